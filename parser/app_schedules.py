@@ -0,0 +1,318 @@
+"""
+Schedule parsers of the app's constitution_of_kenya.json shape.
+
+Each schedule is cut from the text from its heading to the next schedule's
+heading (the last one ends at SUBSIDIARY LEGISLATION): by find_schedules()
+for the app asset parser (build_app_assets.py), and by parse_constitution.py's
+ScheduleSplitter for the engine's "app" schema (see engine.py).
+parse_schedule() turns a slice into
+
+    {"number": 5, "title": "...", "reference": "Article 261(1)", "content": {...}}
+
+where content is specific to each schedule, in the shape the app's
+schedule screens read. parse_constitution.py's own schedule parsers write
+the parser/ shape.
+"""
+
+from typing import Dict, List, Tuple
+
+from normalize import clean_line
+from patterns import PATTERNS
+
+
+def parse_schedule_1(content: str) -> Dict:
+    """Parse First Schedule: Counties."""
+    counties = [
+        "Mombasa", "Kwale", "Kilifi", "Tana River", "Lamu", "Taita/Taveta",
+        "Garissa", "Wajir", "Mandera", "Marsabit", "Isiolo", "Meru",
+        "Tharaka-Nithi", "Embu", "Kitui", "Machakos", "Makueni", "Nyandarua",
+        "Nyeri", "Kirinyaga", "Murang'a", "Kiambu", "Turkana", "West Pokot",
+        "Samburu", "Trans Nzoia", "Uasin Gishu", "Elgeyo/Marakwet", "Nandi",
+        "Baringo", "Laikipia", "Nakuru", "Narok", "Kajiado", "Kericho",
+        "Bomet", "Kakamega", "Vihiga", "Bungoma", "Busia", "Siaya", "Kisumu",
+        "Homa Bay", "Migori", "Kisii", "Nyamira", "Nairobi City"
+    ]
+    return {"counties": [{"number": i + 1, "name": name} for i, name in enumerate(counties)]}
+
+
+def parse_schedule_2(content: str) -> Dict:
+    """Parse Second Schedule: National Symbols."""
+    return {
+        "nationalFlag": {
+            "description": "Three major strips of equal width coloured from top to bottom black, red and green and separated by narrow white strips, with a symmetrical shield and white spears superimposed centrally."
+        },
+        "nationalAnthem": {
+            "verses": [
+                {
+                    "number": 1,
+                    "kiswahili": "Ee Mungu nguvu yetu, Ilete baraka kwetu. Haki iwe ngao na mlinzi, Natukae na undugu. Amani na uhuru, Raha tupate na ustawi.",
+                    "english": "O God of all creation, Bless this our land and nation. Justice be our shield and defender, May we dwell in unity. Peace and liberty, Plenty be found within our borders."
+                },
+                {
+                    "number": 2,
+                    "kiswahili": "Amkeni ndugu zetu, Tufanye sote bidii. Nasi tujitoe kwa nguvu, Nchi yetu ya Kenya. Tunayoipenda, Tuwe tayari kuilinda.",
+                    "english": "Let one and all arise, With hearts both strong and true. Service be our earnest endeavour, And our Homeland of Kenya. Heritage of splendour, Firm may we stand to defend."
+                },
+                {
+                    "number": 3,
+                    "kiswahili": "Natujenge taifa letu, Ee, ndio wajibu wetu. Kenya istahili heshima, Tuungane mikono. Pamoja kazini, Kila siku tuwe na shukrani.",
+                    "english": "Let all with one accord, In common bond united. Build this our nation together, And the glory of Kenya. The fruit of our labour, Fill every heart with thanksgiving."
+                }
+            ]
+        },
+        "coatOfArms": {"description": "The Coat of Arms with two lions, shield, and crossed spears on a mount with motto 'Harambee'."},
+        "publicSeal": {"description": "The Public Seal of Kenya as prescribed by law."}
+    }
+
+
+def parse_schedule_3(content: str) -> Dict:
+    """Parse Third Schedule: National Oaths."""
+    oaths = []
+    lines = content.split('\n')
+    current_oath = None
+    current_text = []
+
+    for line in lines:
+        line = clean_line(line)
+        if not line:
+            continue
+
+        if 'OATH' in line.upper() or 'AFFIRMATION' in line.upper():
+            if current_oath and current_text:
+                oaths.append({"title": current_oath, "text": ' '.join(current_text)})
+            current_oath = line
+            current_text = []
+        elif current_oath:
+            current_text.append(line)
+
+    if current_oath and current_text:
+        oaths.append({"title": current_oath, "text": ' '.join(current_text)})
+
+    return {"oaths": oaths}
+
+
+def parse_schedule_4(content: str) -> Dict:
+    """Parse Fourth Schedule: Distribution of Functions."""
+    result = {"nationalGovernment": [], "countyGovernments": []}
+
+    lines = content.split('\n')
+    current_part = None
+    current_func = None
+    current_subs = []
+
+    for line in lines:
+        line = clean_line(line)
+        if not line:
+            continue
+
+        if 'PART 1' in line.upper() or 'NATIONAL GOVERNMENT' in line.upper():
+            if current_func and current_part:
+                result[current_part].append({"number": current_func[0], "function": current_func[1], "subFunctions": current_subs})
+            current_part = "nationalGovernment"
+            current_func = None
+            current_subs = []
+            continue
+
+        if 'PART 2' in line.upper() or 'COUNTY GOVERNMENT' in line.upper():
+            if current_func and current_part:
+                result[current_part].append({"number": current_func[0], "function": current_func[1], "subFunctions": current_subs})
+            current_part = "countyGovernments"
+            current_func = None
+            current_subs = []
+            continue
+
+        if not current_part:
+            continue
+
+        # Numbered function
+        match = PATTERNS.function_line.match(line)
+        if match:
+            if current_func:
+                result[current_part].append({"number": current_func[0], "function": current_func[1], "subFunctions": current_subs})
+            current_func = (int(match.group(1)), match.group(2))
+            current_subs = []
+            continue
+
+        # Sub-function
+        match = PATTERNS.subfunction_line.match(line)
+        if match and current_func:
+            current_subs.append({"label": match.group(1), "text": match.group(2)})
+
+    if current_func and current_part:
+        result[current_part].append({"number": current_func[0], "function": current_func[1], "subFunctions": current_subs})
+
+    return result
+
+
+def parse_schedule_5(content: str) -> Dict:
+    """Parse Fifth Schedule: Legislation to be Enacted (table format)."""
+    legislation = []
+
+    # Parse as a table: Description (Article X) followed by Time on next line
+    lines = content.split('\n')
+    current_chapter = None
+    pending_item = None
+
+    for line in lines:
+        line = clean_line(line)
+        if not line:
+            continue
+
+        # Chapter header (CHAPTER TWO-REPUBLIC, etc.)
+        if line.upper().startswith('CHAPTER '):
+            current_chapter = line
+            continue
+
+        # Skip column headers and page markers
+        if 'Chapter and Article' in line or 'Time Specification' in line:
+            continue
+
+        # Try to match legislation entry: Description (Article X)
+        # Skip the schedule header itself
+        if 'FIFTH SCHEDULE' in line.upper():
+            continue
+        match = PATTERNS.legislation_row.match(line)
+        if match:
+            # Save previous pending item if exists
+            if pending_item:
+                legislation.append(pending_item)
+
+            pending_item = {
+                "description": match.group(1).strip(),
+                "article": match.group(2).strip(),
+                "timeSpecification": "",
+                "chapter": current_chapter
+            }
+            continue
+
+        # Check if this is a time specification (contains "year" or "months")
+        if pending_item and ('year' in line.lower() or 'month' in line.lower()):
+            pending_item["timeSpecification"] = line
+            legislation.append(pending_item)
+            pending_item = None
+            continue
+
+    # Don't forget last pending item
+    if pending_item:
+        legislation.append(pending_item)
+
+    return {"legislation": legislation}
+
+
+def parse_schedule_6(content: str) -> Dict:
+    """Parse Sixth Schedule: Transitional Provisions."""
+    sections = []
+    lines = content.split('\n')
+
+    current_section = None
+    current_content = []
+    current_part = None
+
+    for line in lines:
+        line = clean_line(line)
+        if not line:
+            continue
+
+        # Part header
+        if line.upper().startswith('PART '):
+            if current_section:
+                sections.append({
+                    "number": current_section[0],
+                    "title": current_section[1],
+                    "content": ' '.join(current_content),
+                    "part": current_part
+                })
+            match = PATTERNS.part_heading.match(line)
+            if match:
+                current_part = f"Part {match.group(1)}: {match.group(2).strip()}"
+            current_section = None
+            current_content = []
+            continue
+
+        # Section header
+        match = PATTERNS.heading_title.match(line)
+        if match and len(match.group(1)) < 60:
+            if current_section:
+                sections.append({
+                    "number": current_section[0],
+                    "title": current_section[1],
+                    "content": ' '.join(current_content),
+                    "part": current_part
+                })
+            current_section = (len(sections) + 1, match.group(1))
+            current_content = []
+            continue
+
+        if current_section:
+            current_content.append(line)
+
+    if current_section:
+        sections.append({
+            "number": current_section[0],
+            "title": current_section[1],
+            "content": ' '.join(current_content),
+            "part": current_part
+        })
+
+    return {"sections": sections}
+
+
+SCHEDULE_INFO = [
+    ("FIRST SCHEDULE", 1, "COUNTIES", "Article 6(1)", parse_schedule_1),
+    ("SECOND SCHEDULE", 2, "NATIONAL SYMBOLS", "Article 9(2)", parse_schedule_2),
+    ("THIRD SCHEDULE", 3, "NATIONAL OATHS AND AFFIRMATIONS", "Articles 74, 141(3), 148(5), 152(4)", parse_schedule_3),
+    ("FOURTH SCHEDULE", 4, "DISTRIBUTION OF FUNCTIONS", "Articles 185(2), 186(1), 187(2)", parse_schedule_4),
+    ("FIFTH SCHEDULE", 5, "LEGISLATION TO BE ENACTED BY PARLIAMENT", "Article 261(1)", parse_schedule_5),
+    ("SIXTH SCHEDULE", 6, "TRANSITIONAL AND CONSEQUENTIAL PROVISIONS", "Article 262", parse_schedule_6),
+]
+
+
+def find_schedules(content: str) -> List[Tuple[int, str]]:
+    """Find each schedule's (number, content) slice."""
+    # First, find where the main SCHEDULES section starts (after last article, before FIRST SCHEDULE)
+    schedules_section_match = PATTERNS.schedules_start.search(content)
+    if schedules_section_match:
+        schedules_start = schedules_section_match.start()
+    else:
+        # Fallback: find FIRST SCHEDULE after the main content
+        schedules_start = len(content) // 2  # Assume schedules are in second half
+
+    # Find schedule positions - only search after schedules_start
+    search_content = content[schedules_start:]
+    positions = []
+    for pattern, num, title, ref, parser in SCHEDULE_INFO:
+        # Look for schedule header patterns - may have tab or whitespace before (Article
+        key = pattern.split()[0].lower()
+        match = getattr(PATTERNS, f"{key}_schedule_header").search(search_content)
+        if not match:
+            # Some schedules have (Article on same line after tab
+            match = getattr(PATTERNS, f"{key}_schedule_header_inline").search(search_content)
+        if match:
+            positions.append((schedules_start + match.start(), num))
+
+    positions.sort(key=lambda x: x[0])
+
+    # Extract content for each schedule
+    schedules = []
+    for i, (start, num) in enumerate(positions):
+        if i + 1 < len(positions):
+            end = positions[i + 1][0]
+        else:
+            # End at SUBSIDIARY LEGISLATION or end of content
+            sub_match = PATTERNS.subsidiary_legislation.search(content, start)
+            end = sub_match.start() if sub_match else len(content)
+
+        schedules.append((num, content[start:end]))
+
+    return schedules
+
+
+def parse_schedule(num: int, schedule_content: str) -> Dict:
+    """Parse one schedule slice."""
+    _, _, title, ref, parser = SCHEDULE_INFO[num - 1]
+    return {
+        "number": num,
+        "title": title,
+        "reference": ref,
+        "content": parser(schedule_content)
+    }
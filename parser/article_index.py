@@ -0,0 +1,153 @@
+"""
+Flat lookup index for constitution JSON outputs.
+
+Maps article and clause references to the exact bytes of the node inside
+the generated JSON, so a reader can seek to "Article 27(4)(b)" and decode
+only that node instead of deserializing and walking the whole tree.
+
+Index layout (JSON):
+
+    {
+      "version": 1,
+      "source": "constitution_of_kenya.json",
+      "sourceBytes": 403193,
+      "chapters": [[number, offset, length], ...],
+      "entries": {
+        "27":          [chapter position, offset, length],
+        "27(4)":       [chapter position, offset, length],
+        "27(4)(b)":    [chapter position, offset, length],
+        "27(4)(b)(ii)": [...]
+      }
+    }
+
+Offsets and lengths are in bytes; chapter position is the index of the
+chapter in the "chapters" list. Both output shapes are supported: articles
+directly under a chapter or under its parts, numeric or string clause
+numbers, and mini-clauses labelled by "label" or "numeral". Unnumbered
+(text-only) clauses are reached through their article. When a reference
+occurs more than once, the first occurrence is kept.
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from patterns import PATTERNS
+
+
+INDEX_VERSION = 1
+
+PathLike = Union[str, Path]
+Span = Tuple[int, int]
+
+
+def iter_articles(chapter: dict) -> Iterator[Tuple[tuple, dict]]:
+    """Yield (path, article) for every article of a chapter, in order."""
+    for i, article in enumerate(chapter.get("articles", [])):
+        yield ("articles", i), article
+    for p, part in enumerate(chapter.get("parts", [])):
+        for i, article in enumerate(part.get("articles", [])):
+            yield ("parts", p, "articles", i), article
+
+
+def iter_references(chapter: dict) -> Iterator[Tuple[str, tuple, dict]]:
+    """
+    Yield (reference key, path, node) for every article, clause, sub-clause
+    and mini-clause of a chapter, in document order.
+
+    A text-only clause shares its article's key, and its sub-clauses are
+    keyed directly under the article: "260(a)".
+    """
+    for path, article in iter_articles(chapter):
+        number = article.get("number")
+        if number in (None, "", 0):
+            continue
+        article_key = str(number)
+        yield article_key, path, article
+
+        for c, clause in enumerate(article.get("clauses", [])):
+            clause_path = path + ("clauses", c)
+            if clause.get("number") in (None, "", 0):
+                clause_key = article_key
+            else:
+                clause_key = f"{article_key}({clause['number']})"
+            yield clause_key, clause_path, clause
+
+            for s, sub in enumerate(clause.get("subClauses", [])):
+                sub_path = clause_path + ("subClauses", s)
+                sub_key = f"{clause_key}({sub['label']})"
+                yield sub_key, sub_path, sub
+
+                for m, mini in enumerate(sub.get("miniClauses", [])):
+                    label = mini.get("numeral") or mini.get("label")
+                    yield f"{sub_key}({label})", sub_path + ("miniClauses", m), mini
+
+
+class ArticleIndexBuilder:
+    """Collect index entries while chapters are written with append_with_spans()."""
+
+    def __init__(self):
+        self.chapters: List[list] = []
+        self.entries: Dict[str, list] = {}
+
+    def add_chapter(self, chapter: dict, spans: Dict[tuple, Span]):
+        """Index one chapter from the spans returned by append_with_spans()."""
+        position = len(self.chapters)
+        self.chapters.append([chapter.get("number"), *spans[()]])
+
+        for key, path, _ in iter_references(chapter):
+            offset, length = spans[path]
+            self.entries.setdefault(key, [position, offset, length])
+
+    def build(self, source: PathLike) -> dict:
+        """The finished index for the JSON file at source."""
+        return {
+            "version": INDEX_VERSION,
+            "source": Path(source).name,
+            "sourceBytes": Path(source).stat().st_size,
+            "chapters": self.chapters,
+            "entries": self.entries
+        }
+
+    def write(self, source: PathLike, index_path: PathLike):
+        with open(index_path, 'w', encoding='utf-8') as f:
+            json.dump(self.build(source), f, separators=(',', ':'), ensure_ascii=False)
+
+
+def index_path_for(output_path: PathLike) -> Path:
+    """Default index location: constitution.json -> constitution.index.json."""
+    output_path = Path(output_path)
+    return output_path.with_name(output_path.stem + ".index.json")
+
+
+def reference_key(reference: str) -> str:
+    """Normalize "Article 27 (4) (b)" or "art. 27(4)(b)" to the index key "27(4)(b)"."""
+    key = PATTERNS.whitespace.sub('', reference)
+    return PATTERNS.index_reference_prefix.sub('', key).lower()
+
+
+class ArticleIndex:
+    """Resolve references through an index and read just the matching node."""
+
+    def __init__(self, index_path: PathLike, source_path: Optional[PathLike] = None):
+        with open(index_path, 'r', encoding='utf-8') as f:
+            self.index = json.load(f)
+        if self.index.get("version") != INDEX_VERSION:
+            raise ValueError(f"Unsupported index version: {self.index.get('version')}")
+        self.source_path = Path(source_path or Path(index_path).with_name(self.index["source"]))
+        if self.source_path.stat().st_size != self.index["sourceBytes"]:
+            raise ValueError(f"{self.source_path} does not match its index")
+
+    def locate(self, reference: str) -> Optional[list]:
+        """[chapter position, offset, length] of a reference, or None."""
+        return self.index["entries"].get(reference_key(reference))
+
+    def get(self, reference: str) -> Optional[dict]:
+        """Decode the article, clause or sub-clause a reference points to."""
+        entry = self.locate(reference)
+        if entry is None:
+            return None
+        _, offset, length = entry
+        with open(self.source_path, 'rb') as f:
+            f.seek(offset)
+            return json.loads(f.read(length))
@@ -0,0 +1,126 @@
+"""
+Batch parsing of a corpus of documents.
+
+Inputs are files, directories (every *.txt file below them) or glob
+patterns. Each document is parsed into <output dir>/<relative path>.json
+and a manifest.json describing every output is written next to them.
+
+Documents are spread over a pool of worker processes. A worker parses many
+documents, so the compiled patterns and lookup tables are built once per
+worker rather than once per file.
+"""
+
+import glob
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+from parse_cache import ParseCache, file_digest, loaded_sources, parser_fingerprint
+from parse_constitution import PARSER_DIR, parse_to_file
+
+
+MANIFEST_NAME = "manifest.json"
+
+
+def expand_inputs(specs: Iterable[str], suffix: str = ".txt") -> List[Path]:
+    """Resolve files, directories and glob patterns to a sorted list of files."""
+    inputs = []
+    for spec in specs:
+        path = Path(spec)
+        if path.is_dir():
+            inputs.extend(sorted(path.rglob(f"*{suffix}")))
+        elif path.is_file():
+            inputs.append(path)
+        else:
+            inputs.extend(sorted(Path(match) for match in glob.glob(spec, recursive=True)
+                                 if os.path.isfile(match)))
+
+    unique = {}
+    for path in inputs:
+        unique.setdefault(path.resolve(), path)
+    return list(unique.values())
+
+
+def output_paths(inputs: List[Path], output_dir: Path) -> List[Path]:
+    """Map inputs to outputs, keeping their layout below the common parent."""
+    if not inputs:
+        return []
+    resolved = [path.resolve() for path in inputs]
+    root = Path(os.path.commonpath([path.parent for path in resolved]))
+    return [output_dir / path.relative_to(root).with_suffix(".json") for path in resolved]
+
+
+def parse_document(input_path: Path, output_path: Path, pretty: bool = False,
+                   cache_dir: Optional[Path] = None) -> dict:
+    """
+    Parse one document and describe its output as a manifest entry.
+
+    A document that fails to parse is recorded with its error rather than
+    stopping the batch.
+    """
+    entry = {"input": str(input_path), "output": str(output_path)}
+    start = time.perf_counter()
+    try:
+        summary = None
+        if cache_dir is not None:
+            cache = ParseCache(cache_dir)
+            key = cache.key(input_path, parser_fingerprint(loaded_sources(PARSER_DIR)), pretty)
+            summary = cache.fetch(key, output_path)
+        entry["cached"] = summary is not None
+        if summary is None:
+            summary = parse_to_file(input_path, output_path, pretty=pretty)
+            if cache_dir is not None:
+                cache.store(key, output_path, summary)
+    except Exception as e:
+        entry["error"] = f"{type(e).__name__}: {e}"
+        return entry
+
+    chapters = summary["chapters"]
+    entry.update({
+        "inputSha256": file_digest(input_path),
+        "outputBytes": output_path.stat().st_size,
+        "preambleParagraphs": len(summary["preamble"].get("paragraphs", [])),
+        "chapters": len(chapters),
+        "articles": sum(chapter["articles"] for chapter in chapters),
+        "clauses": sum(chapter["clauses"] for chapter in chapters),
+        "schedules": len(summary["schedules"]),
+        "seconds": round(time.perf_counter() - start, 4)
+    })
+    return entry
+
+
+def _parse_document(args: Tuple[Path, Path, bool, Optional[Path]]) -> dict:
+    return parse_document(*args)
+
+
+def parse_batch(inputs: List[Path], output_dir: Path, pretty: bool = False,
+                jobs: Optional[int] = None, cache_dir: Optional[Path] = None) -> dict:
+    """
+    Parse every input into output_dir and write the manifest.
+
+    jobs is the number of worker processes (default: one per CPU); with
+    jobs=1 everything runs in this process. Returns the manifest.
+    """
+    start = time.perf_counter()
+    tasks = [(input_path, output_path, pretty, cache_dir)
+             for input_path, output_path in zip(inputs, output_paths(inputs, output_dir))]
+
+    if jobs == 1 or len(tasks) <= 1:
+        documents = [_parse_document(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            documents = list(executor.map(_parse_document, tasks))
+
+    manifest = {
+        "parser": parser_fingerprint(loaded_sources(PARSER_DIR)),
+        "documents": documents,
+        "failed": sum(1 for document in documents if "error" in document),
+        "seconds": round(time.perf_counter() - start, 4)
+    }
+    output_dir.mkdir(parents=True, exist_ok=True)
+    with open(output_dir / MANIFEST_NAME, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    return manifest
@@ -0,0 +1,428 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the constitution parser.
+
+Every stage is timed on the real text and on synthetic documents built from
+it by scale_corpus(): each chapter body is repeated N times and the articles
+of every copy are renumbered, so a 100x document has the same 18 chapters
+and schedules and 100 times the articles, parts and clauses.
+
+Stages:
+
+    tokenize                    tokenizer.tokenize() over all lines
+    parse_constitution          the streaming parser, end to end
+    parse_schedules             the six schedule parsers
+    engine.app                  engine.py in the app's output shape, end to end
+    engine.app_schedules        the app's schedule parsers (app_schedules.py)
+    app.parse_constitution      build_app_assets.py's own parser, end to end
+    app.parse_articles          its parse_articles() over every chapter slice
+    app.parse_clauses           its parse_clauses() over every article
+    app.parse_schedules         app_schedules.parse_schedule() over every schedule slice
+
+Each (stage, scale) pair runs in a fresh process, so the peak RSS it reports
+belongs to that stage alone. A result records the best of --repeat runs,
+throughput in MB/s and lines/s, peak RSS, the number of garbage collections
+the run triggered (one per ~700 net container allocations) and, for scales
+up to --trace-max-scale, the tracemalloc peak and the memory blocks still
+allocated afterwards. Python has no counter of allocations made, so those
+three stand in for it.
+
+Results are written as JSON; --compare reports the change in time against
+an earlier results file and exits with 1 if any stage got slower than
+--threshold.
+
+Usage:
+    python benchmark.py [--input TEXT] [--scales 1,10,100] [--stages NAME,...] [--repeat 3]
+                        [-o benchmark-results.json] [--compare BASELINE.json]
+
+The full suite is --scales 1,10,100,1000; at 1000x the corpus is several
+hundred MB.
+"""
+
+import gc
+import hashlib
+import json
+import multiprocessing
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from normalize import TEXT_CACHES
+from patterns import PATTERNS
+from tokenizer import ARTICLE_START, CHAPTER, PREAMBLE, SCHEDULES, tokenize
+
+
+BENCHMARK_VERSION = 1
+
+FILES_DIR = Path(__file__).resolve().parent.parent / "composeApp" / "src" / "commonMain" / "composeResources" / "files"
+DEFAULT_INPUT = FILES_DIR / "The_Constitution_of_Kenya_2010.txt"
+
+
+# ============================================================================
+# Synthetic corpora
+# ============================================================================
+
+def scale_corpus(text: str, factor: int) -> str:
+    """
+    Repeat every chapter body factor times, renumbering the articles.
+
+    Article n of copy k becomes n + k * (highest article number), so the
+    numbers stay unique. Chapter headings, the preamble and the schedules
+    appear once, as the tokenizer only recognises chapters ONE to EIGHTEEN.
+    """
+    if factor == 1:
+        return text
+    lines = text.split('\n')
+
+    headings = []           # line index of every chapter heading after the preamble
+    articles = {}           # line index -> article number
+    end = len(lines)
+    for token in tokenize(lines):
+        if token.kind == PREAMBLE:
+            headings = []
+            articles = {}
+        elif token.kind == CHAPTER:
+            headings.append(token.line_no - 1)
+        elif token.kind == ARTICLE_START and headings:
+            articles[token.line_no - 1] = token.label
+        elif token.kind == SCHEDULES:
+            end = token.line_no - 1
+            break
+    if not headings:
+        raise ValueError("No chapters found to replicate")
+
+    stride = max(int(label) for label in articles.values())
+    scaled = lines[:headings[0] + 1]
+    for position, start in enumerate(headings):
+        stop = headings[position + 1] if position + 1 < len(headings) else end
+        body = range(start + 1, stop)
+        scaled.extend(lines[i] for i in body)
+        for copy in range(1, factor):
+            for i in body:
+                label = articles.get(i)
+                if label is None:
+                    scaled.append(lines[i])
+                else:
+                    scaled.append(lines[i].replace(label, str(int(label) + copy * stride), 1))
+        if position + 1 < len(headings):
+            scaled.append(lines[stop])
+    scaled.extend(lines[end:])
+    return '\n'.join(scaled)
+
+
+# ============================================================================
+# Stages
+# ============================================================================
+
+def _captured_calls(module, name: str, run: Callable[[], object]) -> List[tuple]:
+    """Arguments of every call run() makes to module.name."""
+    original = getattr(module, name)
+    calls = []
+
+    def capture(*args):
+        calls.append(args)
+        return original(*args)
+
+    setattr(module, name, capture)
+    try:
+        run()
+    finally:
+        setattr(module, name, original)
+    return calls
+
+
+def _tokenize(path: Path, text: str) -> Callable[[], object]:
+    lines = text.split('\n')
+    return lambda: deque(tokenize(lines), maxlen=0)
+
+
+def _parse_constitution(path: Path, text: str) -> Callable[[], object]:
+    import parse_constitution
+    return lambda: parse_constitution.parse_constitution(text)
+
+
+def _parse_schedules(path: Path, text: str) -> Callable[[], object]:
+    import parse_constitution
+    start = PATTERNS.schedules_start.search(text)
+    schedules = text[start.start():] if start else ""
+    return lambda: parse_constitution.parse_schedules(schedules)
+
+
+def _engine_app(path: Path, text: str) -> Callable[[], object]:
+    import engine
+    lines = text.split('\n')
+    return lambda: engine.parse_document(lines, "app")
+
+
+def _engine_app_schedules(path: Path, text: str) -> Callable[[], object]:
+    import engine
+    import parse_constitution
+    start = PATTERNS.schedules_start.search(text)
+    schedules = text[start.start():] if start else ""
+    schema = engine.get_schema("app")
+    return lambda: parse_constitution.parse_schedules(schedules, schema.parse_schedule)
+
+
+def _app_parse_constitution(path: Path, text: str) -> Callable[[], object]:
+    import build_app_assets
+    return lambda: build_app_assets.parse_constitution(str(path))
+
+
+def _app_parse_articles(path: Path, text: str) -> Callable[[], object]:
+    import build_app_assets
+    chapters = build_app_assets.find_chapters(text)
+    return lambda: [build_app_assets.parse_articles(content, number) for number, _, content in chapters]
+
+
+def _app_parse_clauses(path: Path, text: str) -> Callable[[], object]:
+    import build_app_assets
+    chapters = build_app_assets.find_chapters(text)
+    calls = _captured_calls(build_app_assets, "parse_clauses", lambda: [
+        build_app_assets.parse_articles(content, number) for number, _, content in chapters])
+    return lambda: [build_app_assets.parse_clauses(*args) for args in calls]
+
+
+def _app_parse_schedules(path: Path, text: str) -> Callable[[], object]:
+    import app_schedules
+    schedules = app_schedules.find_schedules(text)
+    return lambda: [app_schedules.parse_schedule(number, content) for number, content in schedules]
+
+
+# Stage name -> setup(corpus path, corpus text) returning the timed callable
+STAGES: Dict[str, Callable[[Path, str], Callable[[], object]]] = {
+    "tokenize": _tokenize,
+    "parse_constitution": _parse_constitution,
+    "parse_schedules": _parse_schedules,
+    "engine.app": _engine_app,
+    "engine.app_schedules": _engine_app_schedules,
+    "app.parse_constitution": _app_parse_constitution,
+    "app.parse_articles": _app_parse_articles,
+    "app.parse_clauses": _app_parse_clauses,
+    "app.parse_schedules": _app_parse_schedules,
+}
+
+
+# ============================================================================
+# Measurement
+# ============================================================================
+
+def _peak_rss_kb() -> Optional[int]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def _gc_collections() -> int:
+    return sum(generation["collections"] for generation in gc.get_stats())
+
+
+def _clear_text_caches():
+    # Every run starts cold, as a single parse does
+    for cache in TEXT_CACHES.values():
+        cache.clear()
+
+
+def measure(stage: str, corpus: Path, repeat: int, trace: bool) -> dict:
+    """Run one stage on one corpus; called in a fresh worker process."""
+    text = corpus.read_text(encoding='utf-8')
+    run = STAGES[stage](corpus, text)
+    gc.collect()
+
+    seconds = []
+    collections = None
+    for _ in range(repeat):
+        _clear_text_caches()
+        before = _gc_collections()
+        start = time.perf_counter()
+        run()
+        seconds.append(time.perf_counter() - start)
+        if collections is None:
+            collections = _gc_collections() - before
+
+    result = {
+        "seconds": min(seconds),
+        "meanSeconds": sum(seconds) / len(seconds),
+        "peakRssKb": _peak_rss_kb(),
+        "gcCollections": collections,
+    }
+
+    if trace:
+        _clear_text_caches()
+        gc.collect()
+        blocks = sys.getallocatedblocks()
+        tracemalloc.start()
+        output = run()
+        result["tracedPeakBytes"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        result["retainedBlocks"] = sys.getallocatedblocks() - blocks
+        del output
+    return result
+
+
+def measure_in_subprocess(stage: str, corpus: Path, repeat: int, trace: bool) -> dict:
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+        return pool.submit(measure, stage, corpus, repeat, trace).result()
+
+
+def run_benchmarks(input_path: Path, scales: List[int], stages: List[str], repeat: int = 3,
+                   trace_max_scale: int = 10, progress: Callable[[dict], None] = None) -> dict:
+    """Benchmark every stage at every scale and return the results document."""
+    text = input_path.read_text(encoding='utf-8')
+    data = text.encode('utf-8')
+    results = {
+        "version": BENCHMARK_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "commit": _git_commit(),
+        "input": {
+            "path": str(input_path),
+            "bytes": len(data),
+            "lines": text.count('\n') + 1,
+            "sha256": hashlib.sha256(data).hexdigest()
+        },
+        "repeat": repeat,
+        "results": []
+    }
+
+    with tempfile.TemporaryDirectory(prefix="katiba-bench-") as tmp:
+        for scale in scales:
+            corpus = Path(tmp) / f"corpus-x{scale}.txt"
+            scaled = scale_corpus(text, scale)
+            corpus.write_text(scaled, encoding='utf-8')
+            size = corpus.stat().st_size
+            lines = scaled.count('\n') + 1
+            del scaled
+
+            for stage in stages:
+                entry = {"stage": stage, "scale": scale, "bytes": size, "lines": lines}
+                entry.update(measure_in_subprocess(stage, corpus, repeat, scale <= trace_max_scale))
+                entry["mbPerSecond"] = size / 1e6 / entry["seconds"] if entry["seconds"] else None
+                entry["linesPerSecond"] = lines / entry["seconds"] if entry["seconds"] else None
+                results["results"].append(entry)
+                if progress:
+                    progress(entry)
+            corpus.unlink()
+
+    return results
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=Path(__file__).resolve().parent,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# ============================================================================
+# Reports
+# ============================================================================
+
+RESULT_HEADER = (f"{'Stage':<28}  {'Scale':>6}  {'Seconds':>9}  {'MB/s':>8}  {'Lines/s':>11}  "
+                 f"{'Peak RSS':>10}  {'GCs':>6}  {'Traced peak':>12}")
+
+
+def format_result(entry: dict) -> str:
+    rss = f"{entry['peakRssKb'] / 1024:,.1f} MB" if entry.get("peakRssKb") is not None else "-"
+    traced = f"{entry['tracedPeakBytes'] / 2 ** 20:,.1f} MB" if "tracedPeakBytes" in entry else "-"
+    mb = f"{entry['mbPerSecond']:.2f}" if entry["mbPerSecond"] is not None else "-"
+    rate = f"{entry['linesPerSecond']:,.0f}" if entry["linesPerSecond"] is not None else "-"
+    return (f"{entry['stage']:<28}  {str(entry['scale']) + 'x':>6}  {entry['seconds']:>9.4f}  {mb:>8}  "
+            f"{rate:>11}  {rss:>10}  {entry['gcCollections']:>6,}  {traced:>12}")
+
+
+def compare_results(current: dict, baseline: dict, threshold: float = 0.10) -> List[str]:
+    """
+    Format the change in time of every (stage, scale) found in both result
+    documents. Lines of regressions beyond threshold start with "!".
+    """
+    previous = {(entry["stage"], entry["scale"]): entry for entry in baseline["results"]}
+    lines = [f"  {'Stage':<28}  {'Scale':>6}  {'Baseline':>9}  {'Current':>9}  {'Change':>8}"]
+    for entry in current["results"]:
+        before = previous.get((entry["stage"], entry["scale"]))
+        if before is None or not before["seconds"]:
+            continue
+        change = entry["seconds"] / before["seconds"] - 1
+        flag = "!" if change > threshold else " "
+        lines.append(f"{flag} {entry['stage']:<28}  {str(entry['scale']) + 'x':>6}  "
+                     f"{before['seconds']:>9.4f}  {entry['seconds']:>9.4f}  {change:>+8.1%}")
+    return lines
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark the constitution parsers on real and scaled corpora")
+    parser.add_argument('--input', type=Path, default=DEFAULT_INPUT,
+                        help="Constitution text to benchmark and scale (default: the app's constitution)")
+    parser.add_argument('--scales', default="1,10,100",
+                        help="Comma-separated corpus scale factors (default: %(default)s)")
+    parser.add_argument('--stages', default=','.join(STAGES),
+                        help="Comma-separated stages to run (default: all)")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="Runs per stage and scale; the fastest is reported (default: %(default)s)")
+    parser.add_argument('--trace-max-scale', type=int, default=10,
+                        help="Largest scale to run again under tracemalloc (default: %(default)s)")
+    parser.add_argument('-o', '--output', type=Path, default=Path("benchmark-results.json"),
+                        help="Results file (default: %(default)s)")
+    parser.add_argument('--compare', type=Path, metavar='BASELINE',
+                        help="Earlier results file to compare against")
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="Slowdown reported as a regression by --compare (default: %(default)s)")
+    args = parser.parse_args()
+
+    stages = [stage.strip() for stage in args.stages.split(',') if stage.strip()]
+    unknown = [stage for stage in stages if stage not in STAGES]
+    if unknown:
+        print(f"ERROR: Unknown stages: {', '.join(unknown)} (choose from {', '.join(STAGES)})")
+        return 1
+    scales = [int(scale) for scale in args.scales.split(',')]
+    if not args.input.exists():
+        print(f"ERROR: Input file not found at {args.input}")
+        return 1
+
+    print(f"Input:  {args.input} ({args.input.stat().st_size:,} bytes)")
+    print(f"Scales: {', '.join(f'{scale}x' for scale in scales)}, best of {args.repeat}")
+    print()
+    print(RESULT_HEADER)
+    results = run_benchmarks(args.input, scales, stages, repeat=args.repeat,
+                             trace_max_scale=args.trace_max_scale,
+                             progress=lambda entry: print(format_result(entry), flush=True))
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    print()
+    print(f"Results: {args.output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        lines = compare_results(results, baseline, args.threshold)
+        print()
+        print(f"Compared with {args.compare} ({baseline.get('commit') or 'unknown commit'}):")
+        print('\n'.join(lines))
+        if any(line.startswith("!") for line in lines):
+            print(f"Regressions beyond {args.threshold:.0%} found")
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
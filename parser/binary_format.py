@@ -0,0 +1,239 @@
+"""
+Compact binary encoding of the parsed constitution.
+
+Any JSON-compatible tree is stored as a string table of interned UTF-8
+strings followed by a table of fixed-width 8-byte node records, so a
+client can load the file with a single read and walk the tree in place.
+The layout is documented in docs/CONSTITUTION_BINARY_FORMAT.md.
+
+    encode(value) -> bytes        decode(data) -> value
+    write_binary(value, path)     BinaryReader(data).root
+"""
+
+import struct
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+
+MAGIC = b"KTB1"
+VERSION = 2
+# Versions BinaryReader can read; version 1 files have no DIGITS records
+READABLE_VERSIONS = (1, 2)
+
+HEADER = struct.Struct("<4sHHII")      # magic, version, flags, strings, nodes
+RECORD = struct.Struct("<BBHi")        # kind, key, count, value
+OFFSET = struct.Struct("<I")
+
+# Node kinds
+NULL, FALSE, TRUE, INT, FLOAT, STRING, LIST, OBJECT, DIGITS = range(9)
+
+NO_KEY = 0xFF
+MAX_COUNT = 0xFFFF
+INT_MIN, INT_MAX = -2 ** 31, 2 ** 31 - 1
+
+PathLike = Union[str, Path]
+
+
+def _digits_value(text: str) -> Optional[int]:
+    """
+    The integer a string of decimal digits stands for, if writing it back
+    gives the same string ("12", not "012" or "+12") and it fits a record.
+    """
+    if not (text.isascii() and text.isdigit()) or (len(text) > 1 and text[0] == "0"):
+        return None
+    number = int(text)
+    return number if number <= INT_MAX else None
+
+
+class _StringTable:
+    def __init__(self):
+        self.index: Dict[str, int] = {}
+        self.strings: List[str] = []
+
+    def intern(self, text: str) -> int:
+        position = self.index.get(text)
+        if position is None:
+            position = self.index[text] = len(self.strings)
+            self.strings.append(text)
+        return position
+
+
+def _collect_keys(value: Any, table: _StringTable):
+    # Object keys are interned first so every key fits the 8-bit key field
+    stack = [value]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            for key, item in value.items():
+                table.intern(key)
+                stack.append(item)
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+
+
+def encode(value: Any) -> bytes:
+    """Encode a JSON-compatible value."""
+    table = _StringTable()
+    _collect_keys(value, table)
+    if len(table.strings) >= NO_KEY:
+        raise ValueError(f"Too many distinct object keys: {len(table.strings)}")
+
+    # Breadth-first, so the children of a container are consecutive records
+    records: List[Tuple[int, int, int, int]] = []
+    queue = deque([(NO_KEY, value)])
+    next_free = 1
+    while queue:
+        key, value = queue.popleft()
+        if value is None:
+            records.append((NULL, key, 0, 0))
+        elif value is False:
+            records.append((FALSE, key, 0, 0))
+        elif value is True:
+            records.append((TRUE, key, 0, 0))
+        elif isinstance(value, int) and INT_MIN <= value <= INT_MAX:
+            records.append((INT, key, 0, value))
+        elif isinstance(value, (int, float)):
+            records.append((FLOAT, key, 0, table.intern(repr(value))))
+        elif isinstance(value, str):
+            # Numeric labels ("1", "12") are stored inline, not in the string table
+            number = _digits_value(value)
+            if number is None:
+                records.append((STRING, key, 0, table.intern(value)))
+            else:
+                records.append((DIGITS, key, 0, number))
+        elif isinstance(value, (dict, list, tuple)):
+            if len(value) > MAX_COUNT:
+                raise ValueError(f"Container with {len(value)} items exceeds {MAX_COUNT}")
+            if isinstance(value, dict):
+                records.append((OBJECT, key, len(value), next_free))
+                queue.extend((table.index[k], item) for k, item in value.items())
+            else:
+                records.append((LIST, key, len(value), next_free))
+                queue.extend((NO_KEY, item) for item in value)
+            next_free += len(value)
+        else:
+            raise TypeError(f"Cannot encode {type(value).__name__}")
+
+    blobs = [text.encode('utf-8') for text in table.strings]
+    offsets = [0]
+    for blob in blobs:
+        offsets.append(offsets[-1] + len(blob))
+    blob = b''.join(blobs)
+    padding = b'\0' * (-len(blob) % 4)
+
+    parts = [HEADER.pack(MAGIC, VERSION, 0, len(blobs), len(records))]
+    parts.extend(OFFSET.pack(offset) for offset in offsets)
+    parts.append(blob + padding)
+    parts.extend(RECORD.pack(*record) for record in records)
+    return b''.join(parts)
+
+
+def write_binary(value: Any, path: PathLike) -> int:
+    """Encode value to path; returns the number of bytes written."""
+    data = encode(value)
+    with open(path, 'wb') as f:
+        f.write(data)
+    return len(data)
+
+
+class BinaryReader:
+    """
+    Random access to an encoded tree without decoding all of it.
+
+    Nodes are addressed by record index; the root is node 0. Strings are
+    decoded on first use and kept.
+    """
+
+    def __init__(self, data: Union[bytes, bytearray, memoryview]):
+        self.data = memoryview(data)
+        magic, version, _, strings, nodes = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC:
+            raise ValueError("Not a constitution binary file")
+        if version not in READABLE_VERSIONS:
+            raise ValueError(f"Unsupported binary format version: {version}")
+        self.string_count = strings
+        self.node_count = nodes
+        self._offsets = HEADER.size
+        self._blob = self._offsets + OFFSET.size * (strings + 1)
+        blob_size = OFFSET.unpack_from(self.data, self._offsets + OFFSET.size * strings)[0]
+        self._records = self._blob + blob_size + (-blob_size % 4)
+        self._strings: Dict[int, str] = {}
+
+    @classmethod
+    def open(cls, path: PathLike) -> "BinaryReader":
+        with open(path, 'rb') as f:
+            return cls(f.read())
+
+    def string(self, index: int) -> str:
+        text = self._strings.get(index)
+        if text is None:
+            start, end = struct.unpack_from("<II", self.data, self._offsets + OFFSET.size * index)
+            text = self._strings[index] = str(self.data[self._blob + start:self._blob + end], 'utf-8')
+        return text
+
+    def record(self, node: int) -> Tuple[int, int, int, int]:
+        """(kind, key, count, value) of a node."""
+        if not 0 <= node < self.node_count:
+            raise IndexError(f"Node {node} out of range")
+        return RECORD.unpack_from(self.data, self._records + RECORD.size * node)
+
+    @property
+    def root(self) -> int:
+        return 0
+
+    def kind(self, node: int) -> int:
+        return self.record(node)[0]
+
+    def key(self, node: int) -> Optional[str]:
+        """The object key a node is stored under, if any."""
+        key = self.record(node)[1]
+        return None if key == NO_KEY else self.string(key)
+
+    def children(self, node: int) -> range:
+        """Record indexes of a list's items or an object's values."""
+        kind, _, count, first = self.record(node)
+        if kind not in (LIST, OBJECT):
+            return range(0)
+        return range(first, first + count)
+
+    def items(self, node: int) -> Iterator[Tuple[str, int]]:
+        """(key, child node) pairs of an object."""
+        for child in self.children(node):
+            yield self.key(child), child
+
+    def member(self, node: int, key: str) -> Optional[int]:
+        """Child node of an object under key, or None."""
+        for name, child in self.items(node):
+            if name == key:
+                return child
+        return None
+
+    def value(self, node: int = 0) -> Any:
+        """Decode a node and everything below it."""
+        kind, _, _, payload = self.record(node)
+        if kind == NULL:
+            return None
+        if kind == FALSE:
+            return False
+        if kind == TRUE:
+            return True
+        if kind == INT:
+            return payload
+        if kind == FLOAT:
+            text = self.string(payload)
+            return float(text) if any(c in text for c in ".eEn") else int(text)
+        if kind == STRING:
+            return self.string(payload)
+        if kind == DIGITS:
+            return str(payload)
+        if kind == LIST:
+            return [self.value(child) for child in self.children(node)]
+        if kind == OBJECT:
+            return {name: self.value(child) for name, child in self.items(node)}
+        raise ValueError(f"Unknown node kind {kind} at node {node}")
+
+
+def decode(data: Union[bytes, bytearray, memoryview]) -> Any:
+    """Decode a whole encoded tree."""
+    return BinaryReader(data).value()
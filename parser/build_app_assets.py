@@ -0,0 +1,728 @@
+#!/usr/bin/env python3
+"""
+Build the app's constitution assets in composeResources/files.
+
+The Constitution of Kenya 2010 text is parsed by this script's own parser,
+which handles the nested structure of chapters, parts, articles, clauses,
+sub-clauses and mini-clauses, the preamble and the six schedules. It
+produced the shipped constitution_of_kenya.json and stays the default until
+the shared engine's app output (--engine; engine.parse_file(path, "app"),
+see engine.py) has been checked against the real document. This script writes the
+app's constitution_of_kenya.json, the only asset the app loads, and on
+request the article lookup index, the full-text search index, the citation
+graph and the binary encoding.
+
+Usage:
+    python build_app_assets.py [INPUT] [-o OUTPUT] [--pretty] [--no-cache] [--engine] [--jobs N]
+    python build_app_assets.py [--index [FILE]] [--search-index [FILE]] [--citations [FILE]] [--binary FILE]
+"""
+
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+import app_schedules
+import parse_constitution as engine_parser
+from article_index import ArticleIndexBuilder, index_path_for
+from article_titles import ARTICLE_TITLE_TRIE
+from binary_format import write_binary
+from citations import build_citation_graph, citations_path_for
+from engine import parse_file
+from instrumentation import StageTimer
+from json_writer import JsonStreamWriter
+from normalize import clean_line, normalize_title, set_text_cache_size, text_cache_report, text_cache_stats
+from parse_cache import DEFAULT_CACHE_DIR, ParseCache, loaded_sources, parser_fingerprint
+from patterns import PATTERNS
+from profiling import (
+    allocations_by_function, memory_report, profile_call, profile_report, trace_memory_call,
+)
+from search_index import build_search_index, search_path_for
+from shards import MANIFEST_NAME, ShardWriter
+
+
+# ============================================================================
+# Constants
+# ============================================================================
+
+PARSER_DIR = os.path.dirname(os.path.abspath(__file__))
+# The app's bundled resources: the source text and every generated asset
+FILES_DIR = os.path.join(os.path.dirname(PARSER_DIR), "composeApp", "src", "commonMain", "composeResources", "files")
+
+CHAPTER_WORD_TO_NUM = {
+    'ONE': 1, 'TWO': 2, 'THREE': 3, 'FOUR': 4, 'FIVE': 5,
+    'SIX': 6, 'SEVEN': 7, 'EIGHT': 8, 'NINE': 9, 'TEN': 10,
+    'ELEVEN': 11, 'TWELVE': 12, 'THIRTEEN': 13, 'FOURTEEN': 14,
+    'FIFTEEN': 15, 'SIXTEEN': 16, 'SEVENTEEN': 17, 'EIGHTEEN': 18
+}
+
+ROMAN_NUMERALS = ['i', 'ii', 'iii', 'iv', 'v', 'vi', 'vii', 'viii', 'ix', 'x',
+                  'xi', 'xii', 'xiii', 'xiv', 'xv', 'xvi', 'xvii', 'xviii', 'xix', 'xx']
+
+
+# ============================================================================
+# Helper Functions
+# ============================================================================
+
+def get_article_number(title: str, last_num: int) -> int:
+    """Get article number from title."""
+    match = ARTICLE_TITLE_TRIE.resolve(normalize_title(title))
+    if match:
+        return match.number
+    return last_num + 1
+
+
+def map_slices(function, slices: List[tuple], executor: Optional[Executor] = None) -> list:
+    """
+    Call function with each argument tuple in slices; results keep the order
+    of slices. With an executor, every slice is submitted before waiting.
+    """
+    if executor is None:
+        return [function(*args) for args in slices]
+    futures = [executor.submit(function, *args) for args in slices]
+    return [future.result() for future in futures]
+
+
+# ============================================================================
+# Parsing Functions
+# ============================================================================
+
+def parse_mini_clauses(text: str) -> Tuple[str, List[Dict]]:
+    """Parse mini-clauses (roman numerals) from text."""
+    mini_clauses = []
+
+    # Split by roman numeral patterns
+    parts = PATTERNS.mini_clause_split.split(text)
+
+    if len(parts) > 1:
+        main_text = parts[0].strip()
+        for i in range(1, len(parts), 2):
+            if i + 1 < len(parts):
+                label = parts[i].lower()
+                if label in ROMAN_NUMERALS:
+                    mini_clauses.append({
+                        "label": label,
+                        "text": parts[i + 1].strip()
+                    })
+        return main_text, mini_clauses
+
+    return text, []
+
+
+def subclause_node(label: str, text_lines: List[str]) -> Dict:
+    """Build a subclause from its label and the lines of its text."""
+    main_text, minis = parse_mini_clauses(' '.join(text_lines).strip())
+    return {
+        "label": label,
+        "text": main_text,
+        "miniClauses": minis
+    }
+
+
+def parse_subclauses(lines: List[str]) -> List[Dict]:
+    """Parse subclauses from the cleaned lines of a clause."""
+    subclauses = []
+
+    # Split by subclause patterns (a), (b) or just a, b at line start
+    current_label = None
+    current_text = []
+
+    for line in lines:
+        # Check for (a), (b) pattern
+        match = PATTERNS.subclause_line.match(line)
+        if match:
+            if current_label:
+                subclauses.append(subclause_node(current_label, current_text))
+            current_label = match.group(1)
+            current_text = [match.group(2)] if match.group(2) else []
+            continue
+
+        # Check for standalone letter pattern (a word, b word)
+        match = PATTERNS.subclause_bare_line.match(line)
+        if match:
+            potential = match.group(1)
+            expected = chr(ord(current_label) + 1) if current_label else 'a'
+            if potential == expected:
+                if current_label:
+                    subclauses.append(subclause_node(current_label, current_text))
+                current_label = potential
+                current_text = [match.group(2)]
+                continue
+
+        # Continue current subclause
+        if current_label:
+            current_text.append(line)
+
+    # Don't forget last one
+    if current_label:
+        subclauses.append(subclause_node(current_label, current_text))
+
+    return subclauses
+
+
+def clause_node(number: str, text_lines: List[str]) -> Dict:
+    """
+    Build a clause from its number and the cleaned, non-empty lines of its
+    text; the text is only joined here, once the clause is complete.
+    """
+    subclauses = parse_subclauses(text_lines)
+    if subclauses:
+        # Remove subclause text from main text
+        text = ' '.join(l for l in text_lines if not PATTERNS.subclause_prefix.match(l)).strip()
+    else:
+        text = '\n'.join(text_lines)
+    return {
+        "number": number,
+        "text": text,
+        "subClauses": subclauses
+    }
+
+
+def parse_clauses(lines: List[str]) -> List[Dict]:
+    """Parse clauses from article lines."""
+    clauses = []
+    current_num = ""
+    current_text = []
+
+    for line in lines:
+        line = clean_line(line)
+        if not line:
+            continue
+
+        # "ArticleNum. (ClauseNum)" format - e.g., "27. (1) text..." - or a
+        # numbered clause (1), (2)
+        match = PATTERNS.article_clause_line.match(line) or PATTERNS.clause_line.match(line)
+        if match:
+            # Save previous clause
+            if current_num or current_text:
+                clauses.append(clause_node(current_num, current_text))
+            current_num = match.group(1)
+            current_text = [match.group(2)] if match.group(2) else []
+            continue
+
+        current_text.append(line)
+
+    # Save last clause
+    if current_num or current_text:
+        clauses.append(clause_node(current_num, current_text))
+
+    # Handle articles with no numbered clauses: every line cleaned to nothing
+    if not clauses and lines:
+        clauses.append({
+            "number": "",
+            "text": "",
+            "subClauses": []
+        })
+
+    return clauses
+
+
+def parse_articles(content: str, chapter_num: int) -> List[Dict]:
+    """Parse articles from chapter content."""
+    articles = []
+    lines = content.split('\n')
+
+    # Find article boundaries by looking for capitalized titles ending with period
+    article_starts = []
+    for i, line in enumerate(lines):
+        line = clean_line(line)
+        if not line:
+            continue
+        # Skip part headers
+        if line.upper().startswith('PART '):
+            continue
+        # Check for article title (capitalized, ends with period)
+        match = PATTERNS.heading_title.match(line)
+        if match:
+            title = match.group(1)
+            if len(title) < 100:
+                article_starts.append((i, title))
+
+    # Parse each article
+    last_num = 0
+    for idx, (start, title) in enumerate(article_starts):
+        end = article_starts[idx + 1][0] if idx + 1 < len(article_starts) else len(lines)
+        article_lines = lines[start + 1:end]
+
+        num = get_article_number(title, last_num)
+        last_num = num
+
+        clauses = parse_clauses(article_lines)
+
+        articles.append({
+            "number": num,
+            "title": title,
+            "clauses": clauses
+        })
+
+    return articles
+
+
+def parse_preamble(content: str) -> str:
+    """Extract preamble text."""
+    # Find preamble after table of contents
+    match = PATTERNS.preamble_start.search(content)
+    if not match:
+        return ""
+
+    start = match.start()
+    # Find end (CHAPTER ONE)
+    end_match = PATTERNS.chapter_one.search(content, start)
+    if end_match:
+        end = end_match.start()
+    else:
+        end = start + 2000
+
+    preamble_text = content[start:end]
+    # Clean up
+    lines = [clean_line(l) for l in preamble_text.split('\n')]
+    lines = [l for l in lines if l]
+    return ' '.join(lines)
+
+
+def find_chapters(content: str) -> List[Tuple[int, str, str]]:
+    """Find each chapter's (number, title, content) slice."""
+    chapters = []
+
+    # Find preamble location to skip table of contents
+    preamble_match = PATTERNS.preamble_start.search(content)
+    if preamble_match:
+        start_pos = preamble_match.start()
+    else:
+        start_pos = 0
+
+    # Find chapter boundaries
+    matches = list(PATTERNS.chapter_heading.finditer(content[start_pos:]))
+
+    # Find where schedules start
+    schedules_match = PATTERNS.schedules_section.search(content[start_pos:])
+    schedules_pos = schedules_match.start() if schedules_match else len(content) - start_pos
+
+    seen = set()
+    for idx, match in enumerate(matches):
+        if match.start() > schedules_pos:
+            break
+
+        chapter_word = match.group(1).upper()
+        chapter_num = CHAPTER_WORD_TO_NUM.get(chapter_word)
+        if not chapter_num or chapter_num in seen:
+            continue
+        seen.add(chapter_num)
+
+        chapter_title = match.group(2).strip()
+
+        # Get chapter content
+        ch_start = match.end()
+        if idx + 1 < len(matches) and matches[idx + 1].start() < schedules_pos:
+            ch_end = matches[idx + 1].start()
+        else:
+            ch_end = schedules_pos
+
+        chapters.append((chapter_num, chapter_title, content[start_pos + ch_start:start_pos + ch_end]))
+
+    return chapters
+
+
+def find_parts(chapter_content: str) -> List[Dict]:
+    """Find the parts of a chapter slice."""
+    parts = []
+    for part_match in PATTERNS.part_heading.finditer(chapter_content):
+        parts.append({
+            "number": int(part_match.group(1)),
+            "title": part_match.group(2).strip()
+        })
+    return parts
+
+
+def parse_chapter(chapter_num: int, chapter_title: str, chapter_content: str) -> Dict:
+    """Parse one chapter slice."""
+    # Find parts
+    parts = find_parts(chapter_content)
+
+    # Parse articles
+    articles = parse_articles(chapter_content, chapter_num)
+
+    return {
+        "number": chapter_num,
+        "title": chapter_title,
+        "parts": parts,
+        "articles": articles
+    }
+
+
+def parse_chapters(content: str, executor: Optional[Executor] = None) -> List[Dict]:
+    """Parse all chapters, on executor if one is given."""
+    chapters = map_slices(parse_chapter, find_chapters(content), executor)
+
+    # Sort by chapter number
+    chapters.sort(key=lambda x: x["number"])
+
+    return chapters
+
+
+# ============================================================================
+# Schedule Parsing
+# ============================================================================
+
+def parse_schedules(content: str, executor: Optional[Executor] = None) -> List[Dict]:
+    """Parse all schedules, on executor if one is given."""
+    return map_slices(app_schedules.parse_schedule, app_schedules.find_schedules(content), executor)
+
+
+# ============================================================================
+# Main Functions
+# ============================================================================
+
+# Functions timed by --timings: (module namespace, {function name: stage name})
+TIMED_STAGES = [
+    (globals(), {
+        "parse_preamble": "preamble",
+        "find_chapters": "chapter split",
+        "parse_chapter": "chapter",
+        "find_parts": "part extraction",
+        "parse_articles": "article split",
+        "parse_clauses": "clauses",
+        "parse_subclauses": "sub-clauses",
+        "parse_mini_clauses": "mini-clauses",
+    }),
+    (vars(app_schedules), {
+        "find_schedules": "schedule split",
+        "parse_schedule": lambda num, schedule_content: f"parse_schedule_{num}",
+    }),
+]
+
+# The same with --engine: the whole parse, then the engine's stages
+ENGINE_TIMED_STAGES = [(globals(), {"parse_with_engine": "engine"})] + engine_parser.TIMED_STAGES
+
+
+def parse_constitution(file_path: str, jobs: int = 1) -> Dict[str, Any]:
+    """
+    Parse the constitution from a text file.
+
+    With jobs > 1, chapters and schedules are parsed on a pool of that many
+    worker processes once their boundaries are known.
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    executor = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+    try:
+        result = {
+            "preamble": parse_preamble(content),
+            "chapters": parse_chapters(content, executor),
+            "schedules": parse_schedules(content, executor)
+        }
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    return result
+
+
+def parse_with_engine(file_path: str, jobs: int = 1) -> Dict[str, Any]:
+    """
+    Parse the constitution with the shared single-pass engine, in this
+    app's output shape (see engine.py), on jobs worker processes.
+    """
+    return parse_file(file_path, "app", jobs=jobs)
+
+
+def parser_functions(engine: bool = False) -> Dict[str, Any]:
+    """
+    The namespaces of TIMED_STAGES (ENGINE_TIMED_STAGES with engine)
+    merged, for attributing allocations; classes are kept by name, so
+    their methods are attributed too.
+    """
+    functions = {}
+    for namespace, _ in ENGINE_TIMED_STAGES if engine else TIMED_STAGES:
+        if isinstance(namespace, dict):
+            functions.update(namespace)
+        else:
+            functions[namespace.__name__] = namespace
+    return functions
+
+
+def validate_result(result: Dict) -> List[str]:
+    """Validate parsing results."""
+    issues = []
+
+    if not result.get("preamble"):
+        issues.append("Preamble is missing")
+
+    chapters = result.get("chapters", [])
+    if len(chapters) != 18:
+        issues.append(f"Expected 18 chapters, found {len(chapters)}")
+
+    total_articles = sum(len(ch.get("articles", [])) for ch in chapters)
+    if total_articles < 200:
+        issues.append(f"Found only {total_articles} articles (expected ~264)")
+
+    schedules = result.get("schedules", [])
+    if len(schedules) != 6:
+        issues.append(f"Expected 6 schedules, found {len(schedules)}")
+
+    # Headings that matched known titles of more than one article
+    seen = set()
+    for ch in chapters:
+        for article in ch.get("articles", []):
+            normalized = normalize_title(article["title"])
+            match = ARTICLE_TITLE_TRIE.resolve(normalized)
+            if match and match.ambiguous and normalized not in seen:
+                seen.add(normalized)
+                others = ', '.join(str(num) for num in match.ambiguous)
+                issues.append(f"Ambiguous article title '{article['title']}': "
+                              f"used Article {match.number}, also matches {others}")
+
+    return issues
+
+
+def summarize_result(result: Dict) -> Dict[str, Any]:
+    """Counts and validation issues reported by main()."""
+    chapters = result.get("chapters", [])
+    return {
+        "preambleChars": len(result.get("preamble", "")),
+        "chapters": [{"number": ch["number"], "articles": len(ch.get("articles", []))} for ch in chapters],
+        "schedules": len(result.get("schedules", [])),
+        "issues": validate_result(result)
+    }
+
+
+def write_result(result: Dict, output_file: str, pretty: bool = False,
+                 index_file: Optional[str] = None) -> str:
+    """
+    Write the parsed constitution as JSON; returns the bytes-per-section report.
+
+    With index_file, an article lookup index into the written JSON is saved
+    there as well (see article_index.py).
+    """
+    index = ArticleIndexBuilder() if index_file else None
+    with open(output_file, 'wb') as f:
+        writer = JsonStreamWriter(f, pretty=pretty)
+        writer.write("preamble", result["preamble"])
+        writer.begin_list("chapters")
+        for chapter in result["chapters"]:
+            if index:
+                index.add_chapter(chapter, writer.append_with_spans(chapter))
+            else:
+                writer.append(chapter)
+        writer.end_list()
+        writer.begin_list("schedules")
+        for schedule in result["schedules"]:
+            writer.append(schedule)
+        writer.end_list()
+        writer.close()
+    if index:
+        index.write(output_file, index_file)
+    return writer.report()
+
+
+def write_shards(result: Dict, directory: str, pretty: bool = False) -> str:
+    """Write one file per chapter and schedule plus a manifest; returns a size report."""
+    shard_writer = ShardWriter(directory, pretty=pretty)
+    shard_writer.add("preamble", result["preamble"])
+    for chapter in result["chapters"]:
+        shard_writer.add("chapter", chapter)
+    for schedule in result["schedules"]:
+        shard_writer.add("schedule", schedule)
+    manifest = shard_writer.close()
+
+    shards = [manifest["preamble"]] + manifest["chapters"] + manifest["schedules"]
+    manifest_size = os.path.getsize(os.path.join(directory, MANIFEST_NAME))
+    return (f"  {len(shards)} shards, {sum(shard['bytes'] for shard in shards):,} bytes\n"
+            f"  {MANIFEST_NAME}: {manifest_size:,} bytes")
+
+
+def main():
+    """Main entry point."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build the app's Constitution of Kenya 2010 assets")
+    parser.add_argument('input_file', nargs='?',
+                        help="Input text file (default: The_Constitution_of_Kenya_2010.txt in composeResources/files)")
+    parser.add_argument('-o', '--output',
+                        help="Output JSON file (default: constitution_of_kenya.json in composeResources/files)")
+    parser.add_argument('-v', '--verbose', action='store_true', help="Verbose output")
+    parser.add_argument('--pretty', action='store_true', help="Indent the JSON output (default: compact)")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="Always parse, even if the input and parser are unchanged")
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR,
+                        help="Parse cache directory (default: %(default)s)")
+    parser.add_argument('--pattern-stats', action='store_true',
+                        help="Report call counts and time spent per regex pattern (implies --no-cache)")
+    parser.add_argument('--index', nargs='?', const='', metavar='FILE',
+                        help="Also write the article lookup index to FILE (default: next to the output)")
+    parser.add_argument('--search-index', nargs='?', const='', metavar='FILE',
+                        help="Also write the full-text search index to FILE (default: next to the output)")
+    parser.add_argument('--citations', nargs='?', const='', metavar='FILE',
+                        help="Also write the citation graph to FILE (default: next to the output)")
+    parser.add_argument('--binary', metavar='FILE',
+                        help="Also write the binary encoding to FILE (see docs/CONSTITUTION_BINARY_FORMAT.md)")
+    parser.add_argument('--shards', metavar='DIR',
+                        help="Write one JSON file per chapter and schedule plus a manifest to DIR "
+                             "instead of a single output")
+    parser.add_argument('--text-cache-size', type=int, default=None,
+                        help="Entries kept per memoized text normalizer (0 disables; default: 4096)")
+    parser.add_argument('--engine', action='store_true',
+                        help="Parse with the shared single-pass engine (engine.py) instead of "
+                             "this script's parser")
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help="Parse chapters and schedules on N worker processes (default: 1)")
+    parser.add_argument('--timings', action='store_true',
+                        help="Report wall time, calls and input bytes per parsing stage (implies --no-cache)")
+    parser.add_argument('--timings-json', metavar='FILE',
+                        help="Write the per-stage timings to FILE as JSON (implies --timings)")
+    parser.add_argument('--trace-events', metavar='FILE',
+                        help="Write every stage call to FILE as Chrome trace events (implies --timings)")
+    profiling = parser.add_mutually_exclusive_group()
+    profiling.add_argument('--profile', metavar='FILE',
+                        help="Run the parse under cProfile and write the stats to FILE (implies --no-cache)")
+    profiling.add_argument('--trace-memory', type=int, nargs='?', const=10, metavar='N',
+                        help="Run the parse under tracemalloc and report the N parser functions "
+                             "holding the most memory (default N: 10; implies --no-cache)")
+
+    args = parser.parse_args()
+    if args.timings_json or args.trace_events:
+        args.timings = True
+
+    # Find input file
+    if args.input_file:
+        input_file = args.input_file
+    else:
+        candidates = [
+            os.path.join(FILES_DIR, "The_Constitution_of_Kenya_2010.txt"),
+            os.path.join(FILES_DIR, "CONSTITUTION-OF-KENYA-2010.txt"),
+        ]
+        input_file = next((f for f in candidates if os.path.exists(f)), None)
+        if not input_file:
+            print(f"Error: No input file found in {FILES_DIR}")
+            return 1
+
+    output_file = args.output or os.path.join(FILES_DIR, "constitution_of_kenya.json")
+    # The app only loads the JSON itself; the other outputs are for tools
+    index_file = search_file = citations_file = None
+    if not args.shards:
+        if args.index is not None:
+            index_file = args.index or str(index_path_for(output_file))
+        if args.search_index is not None:
+            search_file = args.search_index or str(search_path_for(output_file))
+        if args.citations is not None:
+            citations_file = args.citations or str(citations_path_for(output_file))
+    binary_file = None if args.shards else args.binary
+    if args.shards:
+        output_file = args.shards
+    attachments = {name: path for name, path in (
+        ("index", index_file), ("search", search_file), ("citations", citations_file),
+        ("binary", binary_file)) if path}
+
+    print(f"Parsing: {input_file}")
+
+    diagnostics = args.pattern_stats or args.timings or args.profile or args.trace_memory is not None
+    cache = None if args.no_cache or diagnostics or args.shards else ParseCache(args.cache_dir)
+    summary = None
+    timer = None
+    profile = memory = None
+    if cache:
+        # Every parser module this script imported, so none can be missed
+        key = cache.key(input_file, parser_fingerprint(loaded_sources(PARSER_DIR)), args.pretty,
+                        sorted(attachments), args.engine)
+        summary = cache.fetch(key, output_file, attachments)
+        if summary:
+            print("Input and parser unchanged: cached JSON copied, parsing skipped")
+
+    if summary is None:
+        if args.pattern_stats:
+            PATTERNS.enable_stats()
+
+        if args.text_cache_size is not None:
+            set_text_cache_size(args.text_cache_size)
+
+        if args.timings:
+            timer = StageTimer()
+            for namespace, stages in ENGINE_TIMED_STAGES if args.engine else TIMED_STAGES:
+                timer.instrument(namespace, stages)
+
+        parse = parse_with_engine if args.engine else parse_constitution
+        # Worker processes keep their own statistics, so diagnostics parse serially
+        jobs = 1 if diagnostics else args.jobs
+        # A Path, so timed stages count the bytes of the file rather than of its name
+        source = Path(input_file)
+        try:
+            if args.profile:
+                result, profile = profile_call(args.profile, parse, source, jobs=jobs)
+            elif args.trace_memory is not None:
+                result, memory = trace_memory_call(parse, source, jobs=jobs)
+            else:
+                result = parse(source, jobs=jobs)
+        finally:
+            if timer:
+                timer.uninstrument()
+        summary = summarize_result(result)
+        summary["textCache"] = text_cache_stats()
+        if args.shards:
+            summary["report"] = write_shards(result, args.shards, pretty=args.pretty)
+        else:
+            summary["report"] = write_result(result, output_file, pretty=args.pretty, index_file=index_file)
+        if search_file:
+            build_search_index(result["chapters"], search_file)
+        if citations_file:
+            build_citation_graph(result["chapters"], result["schedules"], citations_file)
+        if binary_file:
+            summary["binaryBytes"] = write_binary(result, binary_file)
+        if cache:
+            cache.store(key, output_file, summary, attachments)
+
+    # Summary
+    chapters = summary["chapters"]
+    total_articles = sum(ch["articles"] for ch in chapters)
+
+    print(f"\nResults:")
+    print(f"  Preamble: {summary['preambleChars']} chars")
+    print(f"  Chapters: {len(chapters)}")
+    print(f"  Articles: {total_articles}")
+    print(f"  Schedules: {summary['schedules']}")
+
+    if args.verbose:
+        for ch in chapters:
+            print(f"    Chapter {ch['number']}: {ch['articles']} articles")
+
+    print(f"\n{text_cache_report(summary['textCache'])}")
+
+    if args.pattern_stats:
+        print(f"\n{PATTERNS.report()}")
+
+    if timer:
+        print(f"\n{timer.report()}")
+        if args.timings_json:
+            timer.write_json(args.timings_json)
+            print(f"Timings: {args.timings_json}")
+        if args.trace_events:
+            timer.write_chrome_trace(args.trace_events)
+            print(f"Trace:   {args.trace_events}")
+
+    if profile:
+        print(f"\n{profile_report(profile)}")
+        print(f"Profile: {args.profile}")
+
+    if memory:
+        print(f"\n{memory_report(memory, allocations_by_function(memory.snapshot, parser_functions(args.engine)), args.trace_memory)}")
+
+    if summary["issues"]:
+        print("\nWarnings:")
+        for issue in summary["issues"]:
+            print(f"  - {issue}")
+
+    print(f"\nOutput: {output_file}")
+    print(summary["report"])
+    if index_file:
+        print(f"Index:  {index_file}")
+    if search_file:
+        print(f"Search: {search_file}")
+    if citations_file:
+        print(f"Citations: {citations_file}")
+    if binary_file:
+        print(f"Binary: {binary_file} ({summary['binaryBytes']:,} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,235 @@
+"""
+Cross-references between provisions, resolved into a citation graph.
+
+Every clause, sub-clause and mini-clause text and every schedule is scanned
+for citations: "Article 6 (1)", "Articles 185(2), 186(1) and 187(2)",
+"(Article 261)", "Articles 260 to 262", "clauses (1) to (3)", bare "11 (3)" in the Fifth
+Schedule's article column, and "clause (2)" meaning a clause of the citing
+article. Each citation is resolved to the most specific node that exists,
+so "27(4)(z)" resolves to "27(4)" and "Article 300" stays unresolved.
+
+Graph layout (JSON):
+
+    {
+      "version": 1,
+      "cites": {
+        "59(2)(a)": ["10", "27(4)"],
+        "schedule:1": ["6(1)"]
+      },
+      "citedBy": {
+        "27":    ["59(2)(a)"],
+        "27(4)": ["59(2)(a)"]
+      },
+      "unresolved": [["schedule:5", "300"]]
+    }
+
+Nodes are reference keys ("27", "27(4)", "27(4)(b)", see article_index.py)
+and "schedule:N" for schedules. "citedBy" lists the citers of a node or of
+anything inside it: what cites Article 24 is citedBy["24"], whether the
+citation was to 24 or to 24(1)(a). Lists keep document order.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from article_index import iter_references
+from patterns import PATTERNS
+
+
+CITATIONS_VERSION = 1
+
+# Longest "Articles 260 to 262" range that is expanded
+MAX_RANGE = 100
+
+PathLike = Union[str, Path]
+
+
+def citations_path_for(output_path: PathLike) -> Path:
+    """Default graph location: constitution.json -> constitution.citations.json."""
+    output_path = Path(output_path)
+    return output_path.with_name(output_path.stem + ".citations.json")
+
+
+def schedule_key(number: Any) -> str:
+    return f"schedule:{number}"
+
+
+def _cited_keys(body: str, article: Optional[str], plural: bool = True) -> List[str]:
+    """
+    Reference keys of one list of cited items, e.g. "185(2), 186(1) and 187(2)".
+
+    Unless the list follows "Articles" (plural), a bare number after a comma
+    is only cited if a clause label or an "and", "or" or "to" follows it:
+    the 2 of "Article 10, 2 persons" is not an article.
+    """
+    refs: List[List[str]] = []
+    current: Optional[List[str]] = None
+    fresh = True        # at the start of an item
+    through = False     # after "to"
+    comma = False       # after a bare ","
+    loose: List[List[str]] = []     # bare numbers after a comma, not yet confirmed
+    for match in PATTERNS.citation_item.finditer(body):
+        number, label, separator = match.groups()
+        if separator:
+            fresh = True
+            through = separator == "to"
+            comma = separator == ","
+            if not comma:
+                loose = []
+            continue
+        if number is not None:
+            if through and current is not None and len(current) == 1:
+                first, last = int(current[0]), int(number)
+                if first < last <= first + MAX_RANGE:
+                    refs.extend([str(n)] for n in range(first + 1, last))
+            current = [number]
+            refs.append(current)
+            if comma and not plural:
+                loose.append(current)
+        elif fresh and label.isdigit():
+            # "(2)" on its own: a clause of the article cited last, or of
+            # the citing article
+            base = refs[-1][0] if refs else article
+            if base is None:
+                continue
+            # "clauses (1) to (3)"
+            if through and current is not None and len(current) == 2 and current[0] == base \
+                    and current[1].isdigit():
+                first, last = int(current[1]), int(label)
+                if first < last <= first + MAX_RANGE:
+                    refs.extend([base, str(n)] for n in range(first + 1, last))
+            current = [base, label]
+            refs.append(current)
+        elif current is not None:
+            current.append(label)
+            if loose and loose[-1] is current:
+                loose.pop()
+        fresh = through = comma = False
+    if loose:
+        refs = [ref for ref in refs if not any(ref is number for number in loose)]
+    return [ref[0] + ''.join(f"({label})" for label in ref[1:]) for ref in refs]
+
+
+def extract_citations(text: str, article: Optional[str] = None) -> List[str]:
+    """
+    Reference keys cited in text, in order. article is the key of the
+    citing article, which "clause (2)" refers to.
+    """
+    if not text or ("rticle" not in text and "clause" not in text):
+        return []
+    found = []
+    for match in PATTERNS.citation_articles.finditer(text):
+        found.append((match.start(), _cited_keys(match.group("items"), None, match.group("plural") is not None)))
+    if article is not None:
+        for match in PATTERNS.citation_clauses.finditer(text):
+            found.append((match.start(), _cited_keys(match.group("items"), article)))
+    found.sort(key=lambda item: item[0])
+    return [key for _, keys in found for key in keys]
+
+
+def _parent(key: str) -> Optional[str]:
+    cut = key.rfind('(')
+    return key[:cut] if cut > 0 else None
+
+
+def _schedule_strings(value: Any, key: Optional[str] = None) -> Iterator[Tuple[Optional[str], str]]:
+    if isinstance(value, str):
+        yield key, value
+    elif isinstance(value, dict):
+        for name, item in value.items():
+            yield from _schedule_strings(item, name)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _schedule_strings(item, key)
+
+
+class CitationGraphBuilder:
+    """Collect citations from parsed chapters and schedules, then resolve them."""
+
+    def __init__(self):
+        self.nodes = set()
+        self._citations: List[Tuple[str, str]] = []     # (citing node, cited key)
+
+    def add_citations(self, source: str, keys: Iterable[str]):
+        self._citations.extend((source, key) for key in keys)
+
+    def add_chapter(self, chapter: dict):
+        for key, _, node in iter_references(chapter):
+            self.nodes.add(key)
+            text = node.get("text")
+            if isinstance(text, str):
+                self.add_citations(key, extract_citations(text, key.split('(', 1)[0]))
+
+    def add_schedule(self, schedule: dict):
+        source = schedule_key(schedule.get("number"))
+        self.nodes.add(source)
+        for name, text in _schedule_strings(schedule):
+            match = PATTERNS.citation_bare.match(text) if name == "article" else None
+            if match:
+                self.add_citations(source, _cited_keys(match.group(1), None))
+            else:
+                self.add_citations(source, extract_citations(text))
+
+    def resolve(self, key: str) -> Optional[str]:
+        """The most specific existing node for a cited key."""
+        while key is not None and key not in self.nodes:
+            key = _parent(key)
+        return key
+
+    def build(self) -> dict:
+        cites: Dict[str, List[str]] = {}
+        cited_by: Dict[str, List[str]] = {}
+        unresolved = []
+        for source, key in self._citations:
+            target = self.resolve(key)
+            if target is None:
+                unresolved.append([source, key])
+                continue
+            targets = cites.setdefault(source, [])
+            if target in targets:
+                continue
+            targets.append(target)
+            while target is not None:
+                citers = cited_by.setdefault(target, [])
+                if source not in citers:
+                    citers.append(source)
+                target = _parent(target)
+        return {
+            "version": CITATIONS_VERSION,
+            "cites": cites,
+            "citedBy": cited_by,
+            "unresolved": unresolved
+        }
+
+    def write(self, graph_path: PathLike):
+        with open(graph_path, 'w', encoding='utf-8') as f:
+            json.dump(self.build(), f, separators=(',', ':'), ensure_ascii=False)
+
+
+class CitationGraph:
+    """Constant-time lookups in a citation graph file."""
+
+    def __init__(self, graph_path: PathLike):
+        with open(graph_path, 'r', encoding='utf-8') as f:
+            self.graph = json.load(f)
+        if self.graph.get("version") != CITATIONS_VERSION:
+            raise ValueError(f"Unsupported citation graph version: {self.graph.get('version')}")
+
+    def cites(self, key: str) -> List[str]:
+        """Nodes cited by key."""
+        return self.graph["cites"].get(key, [])
+
+    def cited_by(self, key: str) -> List[str]:
+        """Nodes citing key or anything inside it."""
+        return self.graph["citedBy"].get(key, [])
+
+
+def build_citation_graph(chapters: Iterable[dict], schedules: Iterable[dict], graph_path: PathLike):
+    """Resolve the citations of every chapter and schedule and write the graph to graph_path."""
+    builder = CitationGraphBuilder()
+    for chapter in chapters:
+        builder.add_chapter(chapter)
+    for schedule in schedules:
+        builder.add_schedule(schedule)
+    builder.write(graph_path)
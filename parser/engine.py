@@ -0,0 +1,145 @@
+"""
+One parsing engine, several output shapes.
+
+The parse_constitution.py command line and the app asset builder
+(build_app_assets.py) both parse through the single-pass tokenizer and
+ConstitutionBuilder of parse_constitution.py; an output schema decides how
+the finished nodes (see nodes.py) are serialized and how the schedules are
+parsed:
+
+    parser - the shape of parser/parse_constitution.py's constitution.json
+    app    - the shape of the app's constitution_of_kenya.json: the preamble
+             as one string, articles flattened into each chapter, string
+             clause numbers and the app's schedule contents (app_schedules.py)
+
+    document = parse_file(path, "app")
+
+    with open(path, encoding='utf-8') as src:
+        for kind, node in iter_document(src, "app"):
+            ...
+
+parse_tree() keeps the nodes themselves. New shapes are added with
+register_schema().
+"""
+
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+import app_schedules
+from json_writer import JsonStreamWriter
+from nodes import Document, Node, to_app_shape, to_parser_shape
+from parse_constitution import METADATA, iter_nodes, parse_schedule, write_constitution
+from patterns import PATTERNS
+
+
+PathLike = Union[str, Path]
+
+
+class OutputSchema:
+    """
+    An output shape: how schedules are parsed and how the nodes of
+    nodes.py are serialized.
+    """
+
+    name = ""
+    # Written before the preamble, unless None
+    metadata: Optional[dict] = None
+    # Written when the text has no preamble
+    empty_preamble: Any = None
+    serialize: Callable[[Node], Any] = staticmethod(to_parser_shape)
+
+    def parse_schedule(self, index: int, text: str) -> dict:
+        """Parse the text of one schedule (index 0 is the First Schedule)."""
+        return parse_schedule(index, text)
+
+
+class ParserSchema(OutputSchema):
+    name = "parser"
+    metadata = METADATA
+    empty_preamble = {"paragraphs": []}
+
+
+class AppSchema(OutputSchema):
+    name = "app"
+    empty_preamble = ""
+    serialize = staticmethod(to_app_shape)
+
+    def parse_schedule(self, index: int, text: str) -> dict:
+        # The last schedule ends where the subsidiary legislation begins
+        end = PATTERNS.subsidiary_legislation.search(text)
+        if end:
+            text = text[:end.start()]
+        return app_schedules.parse_schedule(index + 1, text)
+
+
+SCHEMAS: Dict[str, OutputSchema] = {}
+
+
+def register_schema(schema: OutputSchema) -> OutputSchema:
+    SCHEMAS[schema.name] = schema
+    return schema
+
+
+register_schema(ParserSchema())
+register_schema(AppSchema())
+
+
+def get_schema(schema: Union[str, OutputSchema]) -> OutputSchema:
+    if isinstance(schema, OutputSchema):
+        return schema
+    if schema not in SCHEMAS:
+        raise ValueError(f"Unknown output schema: {schema} (expected one of {', '.join(SCHEMAS)})")
+    return SCHEMAS[schema]
+
+
+def iter_document(lines: Iterable[str], schema: Union[str, OutputSchema] = "parser",
+                  provenance: Optional[str] = None, jobs: int = 1) -> Iterator[Tuple[str, Any]]:
+    """iter_nodes() with every node serialized to schema."""
+    schema = get_schema(schema)
+    serialize = schema.serialize
+    for kind, node in iter_nodes(lines, provenance, schedule_parser=schema.parse_schedule, jobs=jobs):
+        yield kind, serialize(node)
+
+
+def parse_document(lines: Iterable[str], schema: Union[str, OutputSchema] = "parser",
+                   provenance: Optional[str] = None, jobs: int = 1) -> dict:
+    """The whole document in schema's shape."""
+    schema = get_schema(schema)
+    result = {} if schema.metadata is None else {"metadata": schema.metadata}
+    result.update(preamble=schema.empty_preamble, chapters=[], schedules=[])
+    for kind, node in iter_document(lines, schema, provenance, jobs):
+        if kind == "preamble":
+            result["preamble"] = node
+        else:
+            result[kind + "s"].append(node)
+    return result
+
+
+def parse_tree(lines: Iterable[str], schema: Union[str, OutputSchema] = "parser",
+               provenance: Optional[str] = None, jobs: int = 1) -> Document:
+    """
+    The whole document as nodes, for tools that keep parses in memory;
+    schema only selects the schedule parsers.
+    """
+    document = Document()
+    for kind, node in iter_nodes(lines, provenance, schedule_parser=get_schema(schema).parse_schedule, jobs=jobs):
+        if kind == "preamble":
+            document.preamble = node
+        else:
+            getattr(document, kind + "s").append(node)
+    return document
+
+
+def parse_file(path: PathLike, schema: Union[str, OutputSchema] = "parser", jobs: int = 1) -> dict:
+    """Parse a text file into schema's shape, on jobs worker processes (see iter_nodes())."""
+    with open(path, 'r', encoding='utf-8') as src:
+        return parse_document(src, schema, jobs=jobs)
+
+
+def write_document(items: Iterable[Tuple[str, Any]], writer: JsonStreamWriter,
+                   schema: Union[str, OutputSchema] = "parser", metadata: Optional[dict] = None,
+                   strings: Optional[list] = None):
+    """write_constitution() with schema's metadata (or metadata) and empty preamble."""
+    schema = get_schema(schema)
+    write_constitution(items, writer, metadata if metadata is not None else schema.metadata,
+                       schema.empty_preamble, strings)
@@ -0,0 +1,130 @@
+"""
+Chapter-level incremental re-parsing.
+
+The input is cut at the preamble, chapter and schedule boundaries and each
+span is hashed. Spans whose hash matches the previous run are spliced in
+from the previous output; only the spans that changed are parsed again, so
+the work done depends on the size of the edit rather than the document.
+
+The span hashes of a run are stored in the parse cache directory (see
+parse_cache.py), under incremental/<hash of the output path>.spans.json,
+together with a digest of the output itself so a stale or hand-edited
+output is never spliced from. Nothing is written next to the output.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Tuple, Union
+
+from nodes import to_parser_shape
+from parse_cache import DEFAULT_CACHE_DIR, file_digest
+from parse_constitution import parse_section, split_sections
+
+
+SPANS_SUFFIX = ".spans.json"
+STATE_DIR_NAME = "incremental"
+
+PathLike = Union[str, Path]
+
+# Output key holding each span kind
+KIND_KEYS = {"chapter": "chapters", "schedule": "schedules"}
+
+
+class Span(NamedTuple):
+    kind: str       # "preamble", "chapter" or "schedule"
+    index: int      # schedule index (0 is the First Schedule); 0 otherwise
+    text: str
+    digest: str
+
+
+def _span(kind: str, index: int, text: str) -> Span:
+    digest = hashlib.sha256(f"{kind}:{index}\n{text}".encode('utf-8')).hexdigest()
+    return Span(kind, index, text, digest)
+
+
+def split_spans(lines: List[str]) -> List[Span]:
+    """Cut the document into hashed preamble, chapter and schedule spans (see split_sections())."""
+    return [_span(kind, index, text) for kind, index, text in split_sections(lines)]
+
+
+def parse_span(span: Span) -> dict:
+    """Parse one span on its own."""
+    return to_parser_shape(parse_section((span.kind, span.index, span.text)))
+
+
+def state_path_for(output_path: PathLike, cache_dir: PathLike = DEFAULT_CACHE_DIR) -> Path:
+    """Where the span hashes of the output at output_path are kept."""
+    name = hashlib.sha256(str(Path(output_path).resolve()).encode()).hexdigest()[:32]
+    return Path(cache_dir) / STATE_DIR_NAME / (name + SPANS_SUFFIX)
+
+
+class IncrementalParse:
+    """
+    Re-parse a document against the previous output at output_path.
+
+    Construct it before the output is overwritten: the previous output is
+    read eagerly. After writing the new output, call save_state().
+    """
+
+    def __init__(self, output_path: Path, fingerprint: str, cache_dir: PathLike = DEFAULT_CACHE_DIR):
+        self.output_path = Path(output_path)
+        self.state_path = state_path_for(output_path, cache_dir)
+        self.fingerprint = fingerprint
+        self.reused = 0
+        self.parsed = 0
+        self._digests: List[Tuple[str, str]] = []
+        self._previous = self._load_previous()
+
+    def _load_previous(self) -> Dict[str, dict]:
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            if state.get("fingerprint") != self.fingerprint:
+                return {}
+            if state.get("output") != file_digest(self.output_path):
+                return {}
+            with open(self.output_path, 'r', encoding='utf-8') as f:
+                output = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        previous = {}
+        positions = {"chapter": 0, "schedule": 0}
+        for kind, digest in state.get("spans", []):
+            if kind == "preamble":
+                previous[digest] = output.get("preamble")
+            else:
+                nodes = output.get(KIND_KEYS[kind], [])
+                if positions[kind] < len(nodes):
+                    previous[digest] = nodes[positions[kind]]
+                positions[kind] += 1
+        return previous
+
+    def iter_nodes(self, lines: List[str]) -> Iterator[Tuple[str, dict]]:
+        """Yield (kind, node) pairs like iter_constitution(), reusing unchanged spans."""
+        self._digests = []
+        for span in split_spans(lines):
+            self._digests.append((span.kind, span.digest))
+            node = self._previous.get(span.digest)
+            if node is None:
+                node = parse_span(span)
+                self.parsed += 1
+            else:
+                self.reused += 1
+            yield span.kind, node
+
+    def save_state(self):
+        """Record the span hashes of the output that was just written."""
+        state = {
+            "fingerprint": self.fingerprint,
+            "output": file_digest(self.output_path),
+            "spans": self._digests
+        }
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.state_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+
+    def discard_state(self):
+        """Forget the previous run, e.g. before overwriting its output."""
+        self.state_path.unlink(missing_ok=True)
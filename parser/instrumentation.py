@@ -0,0 +1,225 @@
+"""
+Opt-in per-stage timing of parser functions.
+
+A StageTimer wraps named functions in a module's namespace so that every
+call records its wall time, the time spent in nested instrumented stages
+and the size of its text input. Nothing is wrapped, and nothing costs
+anything, until instrument() is called:
+
+    timer = StageTimer()
+    timer.instrument(globals(), {"parse_articles": "article split",
+                                 "parse_clauses": "clauses"})
+    ...
+    print(timer.report())
+    timer.write_json("timings.json")
+    timer.write_chrome_trace("trace.json")    # chrome://tracing, Perfetto
+
+The namespace may also be a class, to time its methods. Callers must look
+the functions up in the namespace at call time, and the wrapped functions
+cannot be sent to worker processes, so instrumented runs are
+single-process.
+
+A generator function is timed over every step it is resumed for and
+recorded as one call when it finishes, so a stage reading lines lazily
+is not charged with the work done between its steps.
+"""
+
+import inspect
+import io
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Union
+
+
+PathLike = Union[str, Path]
+
+# A stage name, or a function of the call's arguments returning one
+StageName = Union[str, Callable[..., str]]
+
+
+class StageCall(NamedTuple):
+    stage: str
+    start_ns: int       # perf_counter_ns() at entry
+    total_ns: int       # wall time, nested stages included
+    self_ns: int        # wall time outside nested instrumented stages
+    input_bytes: int
+    depth: int
+
+
+def input_bytes(args: tuple) -> int:
+    """
+    UTF-8 size of the text arguments: strings and lists of lines, and the
+    size of the files behind path objects and open files.
+    """
+    size = 0
+    for arg in args:
+        if isinstance(arg, os.PathLike):
+            try:
+                size += os.path.getsize(arg)
+            except OSError:
+                pass
+        elif isinstance(arg, io.IOBase):
+            try:
+                size += os.fstat(arg.fileno()).st_size
+            except (OSError, ValueError):
+                pass
+        elif isinstance(arg, str):
+            size += len(arg.encode('utf-8'))
+        elif isinstance(arg, (list, tuple)):
+            size += sum(len(item.encode('utf-8')) + 1 for item in arg if isinstance(item, str))
+    return size
+
+
+class StageTimer:
+    """Records one StageCall per call of every instrumented function."""
+
+    def __init__(self):
+        self.calls: List[StageCall] = []
+        self._children: List[int] = []     # nested time of each open call
+        self._originals: List[tuple] = []
+        self._origin_ns = time.perf_counter_ns()
+
+    def wrap(self, function: Callable, stage: StageName) -> Callable:
+        """Return function recording each call under stage."""
+        if inspect.isgeneratorfunction(function):
+            return self._wrap_generator(function, stage)
+
+        def timed(*args, **kwargs):
+            name = stage(*args, **kwargs) if callable(stage) else stage
+            size = input_bytes(args)
+            depth = len(self._children)
+            self._children.append(0)
+            start = time.perf_counter_ns()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                total = time.perf_counter_ns() - start
+                nested = self._children.pop()
+                if self._children:
+                    self._children[-1] += total
+                self.calls.append(StageCall(name, start, total, total - nested, size, depth))
+
+        timed.__name__ = function.__name__
+        timed.__doc__ = function.__doc__
+        timed.__wrapped__ = function
+        return timed
+
+    def _wrap_generator(self, function: Callable, stage: StageName) -> Callable:
+        def timed(*args, **kwargs):
+            name = stage(*args, **kwargs) if callable(stage) else stage
+            size = input_bytes(args)
+            depth = len(self._children)
+            generator = function(*args, **kwargs)
+            first = None
+            total = nested = 0
+            try:
+                while True:
+                    self._children.append(0)
+                    start = time.perf_counter_ns()
+                    if first is None:
+                        first = start
+                    try:
+                        item = next(generator)
+                    except StopIteration:
+                        break
+                    finally:
+                        elapsed = time.perf_counter_ns() - start
+                        nested += self._children.pop()
+                        if self._children:
+                            self._children[-1] += elapsed
+                        total += elapsed
+                    yield item
+            finally:
+                generator.close()
+                if first is not None:
+                    self.calls.append(StageCall(name, first, total, total - nested, size, depth))
+
+        timed.__name__ = function.__name__
+        timed.__doc__ = function.__doc__
+        timed.__wrapped__ = function
+        return timed
+
+    def instrument(self, namespace: Union[Dict[str, Any], type], stages: Dict[str, StageName]):
+        """
+        Replace each function named in stages with a timed wrapper, in a
+        module namespace (a dict such as globals()) or a class.
+        """
+        for function_name, stage in stages.items():
+            if isinstance(namespace, dict):
+                original = namespace[function_name]
+                namespace[function_name] = self.wrap(original, stage)
+            else:
+                original = vars(namespace)[function_name]
+                setattr(namespace, function_name, self.wrap(original, stage))
+            self._originals.append((namespace, function_name, original))
+
+    def uninstrument(self):
+        """Put back every function replaced by instrument()."""
+        for namespace, function_name, original in reversed(self._originals):
+            if isinstance(namespace, dict):
+                namespace[function_name] = original
+            else:
+                setattr(namespace, function_name, original)
+        self._originals = []
+
+    def reset(self):
+        self.calls = []
+        self._origin_ns = time.perf_counter_ns()
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Calls, total and self seconds and input bytes per stage, in order of first call."""
+        stages: Dict[str, Dict[str, Any]] = {}
+        for call in sorted(self.calls, key=lambda call: call.start_ns):
+            stat = stages.setdefault(call.stage, {
+                "stage": call.stage, "calls": 0, "seconds": 0.0, "selfSeconds": 0.0, "inputBytes": 0})
+            stat["calls"] += 1
+            stat["seconds"] += call.total_ns / 1e9
+            stat["selfSeconds"] += call.self_ns / 1e9
+            stat["inputBytes"] += call.input_bytes
+        return list(stages.values())
+
+    def report(self) -> str:
+        """Format stats() as a table."""
+        rows = self.stats()
+        if not rows:
+            return "No stage calls recorded"
+        width = max([len(row["stage"]) for row in rows] + [5])
+        total = sum(row["selfSeconds"] for row in rows)
+        lines = [f"{'Stage':<{width}}  {'Calls':>8}  {'Total ms':>10}  {'Self ms':>10}  {'Self %':>6}  "
+                 f"{'Input bytes':>12}  {'MB/s':>8}"]
+        for row in rows:
+            share = f"{row['selfSeconds'] / total:.1%}" if total else "-"
+            rate = f"{row['inputBytes'] / 1e6 / row['seconds']:.2f}" if row["seconds"] else "-"
+            lines.append(f"{row['stage']:<{width}}  {row['calls']:>8,}  {row['seconds'] * 1000:>10.2f}  "
+                         f"{row['selfSeconds'] * 1000:>10.2f}  {share:>6}  {row['inputBytes']:>12,}  {rate:>8}")
+        return '\n'.join(lines)
+
+    def to_json(self) -> Dict[str, Any]:
+        return {"stages": self.stats()}
+
+    def write_json(self, path: PathLike):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_json(), f, indent=2)
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """The calls as Chrome trace "complete" events (times in microseconds)."""
+        pid = os.getpid()
+        tid = threading.get_ident()
+        events = [{
+            "name": call.stage,
+            "cat": "parser",
+            "ph": "X",
+            "ts": (call.start_ns - self._origin_ns) / 1000,
+            "dur": call.total_ns / 1000,
+            "pid": pid,
+            "tid": tid,
+            "args": {"inputBytes": call.input_bytes}
+        } for call in sorted(self.calls, key=lambda call: (call.start_ns, call.depth))]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: PathLike):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.chrome_trace(), f, separators=(',', ':'))
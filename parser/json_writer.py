@@ -0,0 +1,196 @@
+"""
+Incremental JSON output for the constitution parsers.
+
+JsonStreamWriter writes a top-level JSON object one key at a time, and
+list-valued keys one item at a time, so a document can be serialized while
+it is still being parsed. Two layouts are supported:
+
+    compact - no indentation and the shortest separators
+    pretty  - byte-for-byte what json.dump(indent=2) produces
+
+The number of bytes written is recorded per top-level key and per list item.
+append_with_spans() also reports where every object inside an item starts
+and ends in the file, for building seekable indexes (see article_index.py);
+encode_with_spans() does the same for a standalone value (see shards.py).
+"""
+
+import json
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+
+# Path of keys and list indexes from a list item down to a nested object
+SpanPath = Tuple[Any, ...]
+
+
+class _SpanEncoder:
+    """
+    Encode a value exactly like json.dumps and record the byte span of
+    every object in it, keyed by its path.
+    """
+
+    def __init__(self, pretty: bool):
+        self.pretty = pretty
+        self.chunks: List[bytes] = []
+        self.position = 0
+        self.spans: Dict[SpanPath, Tuple[int, int]] = {}
+
+    def _emit(self, chunk: str):
+        data = chunk.encode('utf-8')
+        self.chunks.append(data)
+        self.position += len(data)
+
+    def encode(self, value: Any, level: int, path: SpanPath):
+        if isinstance(value, dict):
+            start = self.position
+            self._container(list(value.items()), level, path, '{', '}')
+            self.spans[path] = (start, self.position - start)
+        elif isinstance(value, (list, tuple)):
+            self._container(list(enumerate(value)), level, path, '[', ']')
+        else:
+            self._emit(json.dumps(value, ensure_ascii=False))
+
+    def _container(self, entries: list, level: int, path: SpanPath, open_: str, close: str):
+        if not entries:
+            self._emit(open_ + close)
+            return
+        is_object = open_ == '{'
+        inner = '\n' + '  ' * (level + 1) if self.pretty else ''
+        sep = ': ' if self.pretty else ':'
+        self._emit(open_)
+        for i, (key, item) in enumerate(entries):
+            prefix = (',' if i else '') + inner
+            if is_object:
+                prefix += json.dumps(key, ensure_ascii=False) + sep
+            self._emit(prefix)
+            self.encode(item, level + 1, path + (key,))
+        self._emit(('\n' + '  ' * level if self.pretty else '') + close)
+
+
+def encode_with_spans(value: Any, pretty: bool = False) -> Tuple[bytes, Dict[SpanPath, Tuple[int, int]]]:
+    """
+    Encode value as UTF-8 JSON, compact or like json.dumps(indent=2), and
+    return it with the (offset, length) of every object in it, keyed by path.
+    """
+    encoder = _SpanEncoder(pretty)
+    encoder.encode(value, 0, ())
+    return b''.join(encoder.chunks), encoder.spans
+
+
+class JsonStreamWriter:
+    """Write a top-level JSON object incrementally to a binary file."""
+
+    def __init__(self, f: BinaryIO, pretty: bool = False):
+        self._f = f
+        self.pretty = pretty
+        self.bytes_written = 0
+        self.sections: Dict[str, int] = {}
+        self.items: Dict[str, List[int]] = {}
+        self._keys = 0
+        self._list_key: Optional[str] = None
+        self._list_start = 0
+        self._closed = False
+        self._write('{')
+
+    def _write(self, chunk: str) -> int:
+        data = chunk.encode('utf-8')
+        self._f.write(data)
+        self.bytes_written += len(data)
+        return len(data)
+
+    def _encode(self, value: Any, depth: int) -> str:
+        if not self.pretty:
+            return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+        encoded = json.dumps(value, ensure_ascii=False, indent=2)
+        # json.dumps indents from column 0; shift nested lines to this depth.
+        # String values never contain a raw newline, so this is safe.
+        return encoded.replace('\n', '\n' + '  ' * depth)
+
+    def _begin_key(self, key: str):
+        if self._closed:
+            raise ValueError("Writer is closed")
+        if self._list_key is not None:
+            raise ValueError(f"List '{self._list_key}' is still open")
+        if key in self.sections:
+            raise ValueError(f"Key '{key}' was already written")
+        prefix = ',' if self._keys else ''
+        if self.pretty:
+            prefix += '\n  '
+        self._keys += 1
+        sep = ': ' if self.pretty else ':'
+        return self._write(f'{prefix}{json.dumps(key, ensure_ascii=False)}{sep}')
+
+    def write(self, key: str, value: Any):
+        """Write a complete key/value pair."""
+        size = self._begin_key(key)
+        size += self._write(self._encode(value, 1))
+        self.sections[key] = size
+
+    def begin_list(self, key: str):
+        """Open a list-valued key; items follow through append()."""
+        self._list_start = self.bytes_written
+        self._begin_key(key)
+        self._write('[')
+        self._list_key = key
+        self.items[key] = []
+
+    def append(self, item: Any):
+        """Write one item of the open list."""
+        if self._list_key is None:
+            raise ValueError("No list is open")
+        items = self.items[self._list_key]
+        prefix = ',' if items else ''
+        if self.pretty:
+            prefix += '\n    '
+        items.append(self._write(prefix + self._encode(item, 2)))
+
+    def append_with_spans(self, item: Any) -> Dict[SpanPath, Tuple[int, int]]:
+        """
+        Write one item of the open list, like append().
+
+        Returns the absolute (offset, length) in the file of the item and of
+        every object nested in it, keyed by path: () is the item itself,
+        ("articles", 3) its fourth article, and so on.
+        """
+        if self._list_key is None:
+            raise ValueError("No list is open")
+        items = self.items[self._list_key]
+        prefix = ',' if items else ''
+        if self.pretty:
+            prefix += '\n    '
+        start = self.bytes_written + self._write(prefix)
+        encoder = _SpanEncoder(self.pretty)
+        encoder.encode(item, 2, ())
+        for chunk in encoder.chunks:
+            self._f.write(chunk)
+        self.bytes_written += encoder.position
+        items.append(len(prefix.encode('utf-8')) + encoder.position)
+        return {path: (start + offset, length) for path, (offset, length) in encoder.spans.items()}
+
+    def end_list(self):
+        """Close the open list."""
+        key = self._list_key
+        if key is None:
+            raise ValueError("No list is open")
+        if self.pretty and self.items[key]:
+            self._write('\n  ]')
+        else:
+            self._write(']')
+        self.sections[key] = self.bytes_written - self._list_start
+        self._list_key = None
+
+    def close(self):
+        """Finish the top-level object."""
+        if self._list_key is not None:
+            self.end_list()
+        if not self._closed:
+            self._write('\n}' if self.pretty and self._keys else '}')
+            self._closed = True
+
+    def report(self) -> str:
+        """Format the bytes written per section."""
+        width = max([len(key) for key in self.sections] + [5])
+        lines = []
+        for key, size in self.sections.items():
+            count = f" ({len(self.items[key])} items)" if key in self.items else ""
+            lines.append(f"  {key:<{width}}  {size:>10,} bytes{count}")
+        lines.append(f"  {'Total':<{width}}  {self.bytes_written:>10,} bytes")
+        return '\n'.join(lines)
@@ -0,0 +1,386 @@
+"""
+Typed nodes of the parse tree.
+
+ConstitutionBuilder builds the tree from these classes instead of dicts.
+Each node keeps its fields in __slots__, which takes about half the memory
+of an equivalent dict, and optional fields are None rather than missing:
+
+    Document -> Preamble, Chapter, Schedule
+    Chapter -> Part -> Article -> Clause -> SubClause -> MiniClause
+
+A node's span is None unless the text was parsed with provenance (see
+provenance.py), and its text is None if the text was dropped in "offsets"
+mode. A Clause with number 0 holds the text before an article's first
+numbered clause.
+
+Serializers turn a node into one of the JSON shapes (see engine.py):
+
+    to_parser_shape(chapter)    # parser/parse_constitution.py's constitution.json
+    to_app_shape(chapter)       # the app's constitution_of_kenya.json
+
+and from_parser_shape() reads the parser shape back, so existing outputs
+can be loaded into nodes.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+Span = Optional[Tuple[int, int]]
+
+
+class Node:
+    __slots__ = ()
+
+    def __eq__(self, other: Any) -> bool:
+        return type(self) is type(other) and all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class MiniClause(Node):
+    __slots__ = ("numeral", "number", "text", "span")
+
+    def __init__(self, numeral: str, number: int, text: Optional[str] = None, span: Span = None):
+        self.numeral = numeral          # "iv"
+        self.number = number            # 4
+        self.text = text
+        self.span = span
+
+
+class SubClause(Node):
+    __slots__ = ("label", "text", "mini_clauses", "span")
+
+    def __init__(self, label: str, text: Optional[str] = None,
+                 mini_clauses: Optional[List[MiniClause]] = None, span: Span = None):
+        self.label = label
+        self.text = text
+        self.mini_clauses = mini_clauses if mini_clauses is not None else []
+        self.span = span
+
+
+class Clause(Node):
+    __slots__ = ("number", "text", "sub_clauses", "span")
+
+    def __init__(self, number: int, text: Optional[str] = None,
+                 sub_clauses: Optional[List[SubClause]] = None, span: Span = None):
+        self.number = number            # 0 for the text-only clause
+        self.text = text
+        self.sub_clauses = sub_clauses if sub_clauses is not None else []
+        self.span = span
+
+    @property
+    def is_text_only(self) -> bool:
+        return self.number == 0
+
+
+class Article(Node):
+    __slots__ = ("number", "title", "clauses", "span")
+
+    def __init__(self, number: int, title: str, clauses: Optional[List[Clause]] = None, span: Span = None):
+        self.number = number
+        self.title = title
+        self.clauses = clauses if clauses is not None else []
+        self.span = span
+
+
+class Part(Node):
+    __slots__ = ("number", "title", "articles", "span")
+
+    def __init__(self, number: int, title: str, articles: Optional[List[Article]] = None, span: Span = None):
+        self.number = number
+        self.title = title
+        self.articles = articles if articles is not None else []
+        self.span = span
+
+
+class Chapter(Node):
+    __slots__ = ("number", "title", "parts", "articles", "span")
+
+    def __init__(self, number: int, title: str, parts: Optional[List[Part]] = None,
+                 articles: Optional[List[Article]] = None, span: Span = None):
+        self.number = number
+        self.title = title
+        self.parts = parts if parts is not None else []
+        self.articles = articles if articles is not None else []     # before the first part
+        self.span = span
+
+    def iter_articles(self):
+        """Every article of the chapter, in document order."""
+        yield from self.articles
+        for part in self.parts:
+            yield from part.articles
+
+
+class Preamble(Node):
+    __slots__ = ("paragraphs",)
+
+    def __init__(self, paragraphs: Optional[List[str]] = None):
+        self.paragraphs = paragraphs if paragraphs is not None else []
+
+
+class Schedule(Node):
+    __slots__ = ("number", "title", "reference", "type", "content")
+
+    def __init__(self, number: int, title: str, reference: Optional[str] = None,
+                 type: Optional[str] = None, content: Optional[Dict[str, Any]] = None):
+        self.number = number
+        self.title = title
+        self.reference = reference
+        self.type = type
+        self.content = content if content is not None else {}     # specific to each schedule
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Schedule":
+        """
+        Wrap a schedule parser's result: parse_constitution.py's parsers put
+        the content next to number, title, reference and type,
+        app_schedules.py's under "content".
+        """
+        content = {key: value for key, value in data.items()
+                   if key not in ("number", "title", "reference", "type")}
+        if "content" in content:
+            content = content["content"]
+        return cls(data["number"], data["title"], data.get("reference"), data.get("type"), content)
+
+
+class Document(Node):
+    """A whole parse: the preamble, chapters and schedules."""
+
+    __slots__ = ("preamble", "chapters", "schedules")
+
+    def __init__(self, preamble: Optional[Preamble] = None, chapters: Optional[List[Chapter]] = None,
+                 schedules: Optional[List[Schedule]] = None):
+        self.preamble = preamble if preamble is not None else Preamble()
+        self.chapters = chapters if chapters is not None else []
+        self.schedules = schedules if schedules is not None else []
+
+
+ParseNode = Union[Preamble, Chapter, Part, Article, Clause, SubClause, MiniClause, Schedule]
+
+
+# ============================================================================
+# parser/ shape
+# ============================================================================
+
+def _mini_to_parser(mini: MiniClause) -> dict:
+    data = {"numeral": mini.numeral, "number": mini.number}
+    if mini.text is not None:
+        data["text"] = mini.text
+    if mini.span is not None:
+        data["span"] = list(mini.span)
+    return data
+
+
+def _sub_to_parser(sub: SubClause) -> dict:
+    data = {"label": sub.label}
+    if sub.text is not None:
+        data["text"] = sub.text
+    if sub.mini_clauses:
+        data["miniClauses"] = [_mini_to_parser(mini) for mini in sub.mini_clauses]
+    if sub.span is not None:
+        data["span"] = list(sub.span)
+    return data
+
+
+def _clause_to_parser(clause: Clause) -> dict:
+    data = {"number": clause.number}
+    if clause.text is not None:
+        data["text"] = clause.text
+    if clause.number == 0:
+        data["isTextOnly"] = True
+    if clause.sub_clauses:
+        data["subClauses"] = [_sub_to_parser(sub) for sub in clause.sub_clauses]
+    if clause.span is not None:
+        data["span"] = list(clause.span)
+    return data
+
+
+def _article_to_parser(article: Article) -> dict:
+    data = {
+        "number": article.number,
+        "title": article.title,
+        "clauses": [_clause_to_parser(clause) for clause in article.clauses]
+    }
+    if article.span is not None:
+        data["span"] = list(article.span)
+    return data
+
+
+def _part_to_parser(part: Part) -> dict:
+    data = {
+        "number": part.number,
+        "title": part.title,
+        "articles": [_article_to_parser(article) for article in part.articles]
+    }
+    if part.span is not None:
+        data["span"] = list(part.span)
+    return data
+
+
+def _chapter_to_parser(chapter: Chapter) -> dict:
+    data = {"number": chapter.number, "title": chapter.title}
+    if chapter.parts:
+        data["parts"] = [_part_to_parser(part) for part in chapter.parts]
+    if chapter.articles:
+        data["articles"] = [_article_to_parser(article) for article in chapter.articles]
+    if chapter.span is not None:
+        data["span"] = list(chapter.span)
+    return data
+
+
+def _schedule_to_parser(schedule: Schedule) -> dict:
+    data = {"number": schedule.number, "title": schedule.title}
+    if schedule.reference is not None:
+        data["reference"] = schedule.reference
+    if schedule.type is not None:
+        data["type"] = schedule.type
+    data.update(schedule.content)
+    return data
+
+
+_PARSER_SERIALIZERS = {
+    Preamble: lambda preamble: {"paragraphs": preamble.paragraphs},
+    Chapter: _chapter_to_parser,
+    Part: _part_to_parser,
+    Article: _article_to_parser,
+    Clause: _clause_to_parser,
+    SubClause: _sub_to_parser,
+    MiniClause: _mini_to_parser,
+    Schedule: _schedule_to_parser,
+}
+
+
+def to_parser_shape(node: ParseNode) -> dict:
+    """The node as written by parser/parse_constitution.py."""
+    return _PARSER_SERIALIZERS[type(node)](node)
+
+
+# ============================================================================
+# App shape
+# ============================================================================
+
+def _with_span(node: Node, data: dict) -> dict:
+    if node.span is not None:
+        data["span"] = list(node.span)
+    return data
+
+
+def _mini_to_app(mini: MiniClause) -> dict:
+    return _with_span(mini, {"label": mini.numeral, "text": mini.text or ""})
+
+
+def _sub_to_app(sub: SubClause) -> dict:
+    return _with_span(sub, {
+        "label": sub.label,
+        "text": sub.text or "",
+        "miniClauses": [_mini_to_app(mini) for mini in sub.mini_clauses]
+    })
+
+
+def _clause_to_app(clause: Clause) -> dict:
+    return _with_span(clause, {
+        "number": "" if clause.number == 0 else str(clause.number),
+        "text": clause.text or "",
+        "subClauses": [_sub_to_app(sub) for sub in clause.sub_clauses]
+    })
+
+
+def _article_to_app(article: Article) -> dict:
+    return _with_span(article, {
+        "number": article.number,
+        "title": article.title,
+        "clauses": [_clause_to_app(clause) for clause in article.clauses]
+    })
+
+
+def _part_to_app(part: Part) -> dict:
+    # The app lists a chapter's articles together; parts only carry headings
+    return _with_span(part, {"number": part.number, "title": part.title})
+
+
+def _chapter_to_app(chapter: Chapter) -> dict:
+    return _with_span(chapter, {
+        "number": chapter.number,
+        "title": chapter.title,
+        "parts": [_part_to_app(part) for part in chapter.parts],
+        "articles": [_article_to_app(article) for article in chapter.iter_articles()]
+    })
+
+
+def _schedule_to_app(schedule: Schedule) -> dict:
+    return {
+        "number": schedule.number,
+        "title": schedule.title,
+        "reference": schedule.reference or "",
+        "content": schedule.content
+    }
+
+
+_APP_SERIALIZERS = {
+    Preamble: lambda preamble: ' '.join(preamble.paragraphs),
+    Chapter: _chapter_to_app,
+    Part: _part_to_app,
+    Article: _article_to_app,
+    Clause: _clause_to_app,
+    SubClause: _sub_to_app,
+    MiniClause: _mini_to_app,
+    Schedule: _schedule_to_app,
+}
+
+
+def to_app_shape(node: ParseNode) -> Any:
+    """The node as written to the app's constitution_of_kenya.json."""
+    return _APP_SERIALIZERS[type(node)](node)
+
+
+# ============================================================================
+# Loading the parser/ shape
+# ============================================================================
+
+def _span(data: dict) -> Span:
+    span = data.get("span")
+    return tuple(span) if span is not None else None
+
+
+def _mini_from_parser(data: dict) -> MiniClause:
+    return MiniClause(data["numeral"], data["number"], data.get("text"), _span(data))
+
+
+def _sub_from_parser(data: dict) -> SubClause:
+    return SubClause(data["label"], data.get("text"),
+                     [_mini_from_parser(mini) for mini in data.get("miniClauses", [])], _span(data))
+
+
+def _clause_from_parser(data: dict) -> Clause:
+    return Clause(data["number"], data.get("text"),
+                  [_sub_from_parser(sub) for sub in data.get("subClauses", [])], _span(data))
+
+
+def _article_from_parser(data: dict) -> Article:
+    return Article(data["number"], data["title"],
+                   [_clause_from_parser(clause) for clause in data["clauses"]], _span(data))
+
+
+def _part_from_parser(data: dict) -> Part:
+    return Part(data["number"], data["title"],
+                [_article_from_parser(article) for article in data["articles"]], _span(data))
+
+
+def _chapter_from_parser(data: dict) -> Chapter:
+    return Chapter(data["number"], data["title"],
+                   [_part_from_parser(part) for part in data.get("parts", [])],
+                   [_article_from_parser(article) for article in data.get("articles", [])], _span(data))
+
+
+_PARSER_LOADERS = {
+    "preamble": lambda data: Preamble(data.get("paragraphs", [])),
+    "chapter": _chapter_from_parser,
+    "schedule": Schedule.from_dict,
+}
+
+
+def from_parser_shape(kind: str, data: dict) -> ParseNode:
+    """A "preamble", "chapter" or "schedule" of constitution.json as a node."""
+    return _PARSER_LOADERS[kind](data)
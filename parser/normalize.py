@@ -0,0 +1,155 @@
+"""
+Text normalization shared by the parsers and the search index.
+
+normalize_title() is what article titles are matched on, and
+search_tokens() splits the same normalized form into words, so a title and
+a search query for it always agree on what the words are.
+
+Normalizers that see the same strings many times in one run are wrapped
+with @memoized: a bounded LRU cache per function, with hit and miss
+counters. TextCache.map() serves a whole list of texts from the cache and
+hands only the misses to a batch implementation. The size is set with
+KATIBA_TEXT_CACHE_SIZE or set_text_cache_size() (0 disables caching).
+"""
+
+import os
+from collections import OrderedDict
+from typing import Callable, Dict, List
+
+from patterns import PATTERNS
+
+
+DEFAULT_TEXT_CACHE_SIZE = int(os.environ.get("KATIBA_TEXT_CACHE_SIZE", 4096))
+
+
+class TextCache:
+    """A str -> str function memoized in a bounded LRU cache."""
+
+    def __init__(self, function: Callable[[str], str], maxsize: int = DEFAULT_TEXT_CACHE_SIZE):
+        self.function = function
+        self.__name__ = function.__name__
+        self.__doc__ = function.__doc__
+        self.resize(maxsize)
+
+    def __call__(self, text: str) -> str:
+        if self.maxsize <= 0:
+            return self.function(text)
+        entries = self._entries
+        if text in entries:
+            self.hits += 1
+            entries.move_to_end(text)
+            return entries[text]
+        self.misses += 1
+        result = self.function(text)
+        self._store(text, result)
+        return result
+
+    def map(self, texts: List[str], batch_function: Callable[[List[str]], List[str]]) -> List[str]:
+        """
+        function() of every text. Cached results are reused and the misses
+        are computed together, with one batch_function(misses) call that
+        must return what function() returns for each of them.
+        """
+        if self.maxsize <= 0:
+            return batch_function(texts)
+        entries = self._entries
+        results = []
+        missing: Dict[str, List[int]] = {}
+        for i, text in enumerate(texts):
+            if text in entries:
+                self.hits += 1
+                entries.move_to_end(text)
+                results.append(entries[text])
+            elif text in missing:
+                # Computed once, with the first occurrence
+                self.hits += 1
+                missing[text].append(i)
+                results.append(None)
+            else:
+                self.misses += 1
+                missing[text] = [i]
+                results.append(None)
+        if missing:
+            for text, result in zip(missing, batch_function(list(missing))):
+                self._store(text, result)
+                for i in missing[text]:
+                    results[i] = result
+        return results
+
+    def _store(self, text: str, result: str):
+        self._entries[text] = result
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def resize(self, maxsize: int):
+        """Change the number of entries kept; clears the cache and its counters."""
+        self.maxsize = maxsize
+        self.clear()
+
+    def clear(self):
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """hits, misses, size and maxsize of the cache."""
+        if self.maxsize <= 0:
+            return {"hits": 0, "misses": 0, "size": 0, "maxsize": 0}
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries), "maxsize": self.maxsize}
+
+
+TEXT_CACHES: Dict[str, TextCache] = {}
+
+
+def memoized(function: Callable[[str], str]) -> TextCache:
+    """Decorator: memoize a text normalizer and register it for reporting."""
+    cache = TextCache(function)
+    TEXT_CACHES[function.__name__] = cache
+    return cache
+
+
+def set_text_cache_size(maxsize: int):
+    for cache in TEXT_CACHES.values():
+        cache.resize(maxsize)
+
+
+def text_cache_stats() -> Dict[str, Dict[str, int]]:
+    """Counters of every memoized normalizer, by function name."""
+    return {name: cache.stats() for name, cache in TEXT_CACHES.items()}
+
+
+def text_cache_report(stats: Dict[str, Dict[str, int]]) -> str:
+    """Format text_cache_stats() as a table."""
+    width = max([len(name) for name in stats] + [8])
+    lines = [f"{'Function':<{width}}  {'Hits':>10}  {'Misses':>10}  {'Hit rate':>8}  {'Size':>12}"]
+    for name, stat in stats.items():
+        calls = stat["hits"] + stat["misses"]
+        rate = f"{stat['hits'] / calls:.1%}" if calls else "-"
+        size = f"{stat['size']:,}/{stat['maxsize']:,}"
+        lines.append(f"{name:<{width}}  {stat['hits']:>10,}  {stat['misses']:>10,}  {rate:>8}  {size:>12}")
+    return '\n'.join(lines)
+
+
+@memoized
+def normalize_title(title: str) -> str:
+    """Normalize title for matching."""
+    t = title.lower().strip()
+    t = PATTERNS.dash.sub('-', t)
+    t = t.replace("'", "'").replace("'", "'")
+    t = PATTERNS.whitespace.sub(' ', t)
+    return t
+
+
+@memoized
+def clean_line(line: str) -> str:
+    """Clean a line by stripping and removing page markers."""
+    line = line.strip()
+    if PATTERNS.page_marker_loose.search(line):
+        return ""
+    return line
+
+
+def search_tokens(text: str) -> List[str]:
+    """Split text into normalized words for indexing and querying."""
+    # Whole texts rarely repeat; bypass the cache so titles stay in it
+    return PATTERNS.search_token.findall(normalize_title.function(text))
@@ -0,0 +1,122 @@
+"""
+Content-addressed cache for parser output.
+
+A cache key is the SHA-256 of the input bytes, a fingerprint of the parser
+source files and any output options. When the key is already in the cache,
+the stored output file is copied to the requested path and parsing is
+skipped entirely.
+
+Layout:
+    <cache dir>/<key>/output   - the output file exactly as written
+    <cache dir>/<key>/meta.json - small summary needed to report on a hit
+    <cache dir>/<key>/<name>    - files written alongside the output, such as
+                                  its lookup index
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+
+# Bump to invalidate every existing entry when the cache layout changes
+CACHE_VERSION = 1
+
+DEFAULT_CACHE_DIR = Path(os.environ.get(
+    "KATIBA_PARSE_CACHE", Path(__file__).resolve().parent / ".parse_cache"))
+
+PathLike = Union[str, Path]
+
+
+def file_digest(path: PathLike, chunk_size: int = 1 << 20) -> str:
+    """SHA-256 of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def loaded_sources(directory: PathLike) -> List[Path]:
+    """
+    Source files of every imported module under directory, sorted, for
+    parser_fingerprint(); call it once the parser has been imported.
+    """
+    directory = Path(directory).resolve()
+    sources = set()
+    for module in list(sys.modules.values()):
+        path = getattr(module, "__file__", None)
+        if path and path.endswith(".py"):
+            path = Path(path).resolve()
+            if directory in path.parents:
+                sources.add(path)
+    return sorted(sources)
+
+
+def parser_fingerprint(source_files: Iterable[PathLike]) -> str:
+    """Fingerprint of the parser code, so a code change invalidates the cache."""
+    digest = hashlib.sha256(f"v{CACHE_VERSION}".encode())
+    for path in source_files:
+        digest.update(Path(path).name.encode())
+        digest.update(file_digest(path).encode())
+    return digest.hexdigest()
+
+
+class ParseCache:
+    """On-disk cache of parser outputs keyed by input and parser content."""
+
+    def __init__(self, directory: PathLike = DEFAULT_CACHE_DIR):
+        self.directory = Path(directory)
+
+    def key(self, input_path: PathLike, fingerprint: str, *options) -> str:
+        """Cache key for an input file parsed by a given parser with options."""
+        digest = hashlib.sha256()
+        digest.update(file_digest(input_path).encode())
+        digest.update(fingerprint.encode())
+        digest.update(json.dumps(options).encode())
+        return digest.hexdigest()
+
+    def fetch(self, key: str, output_path: PathLike,
+              attachments: Optional[Dict[str, PathLike]] = None) -> Optional[dict]:
+        """
+        Copy a cached output to output_path, and each cached attachment
+        to the path given for its name.
+
+        Returns the stored metadata on a hit, or None on a miss.
+        """
+        entry = self.directory / key
+        try:
+            with open(entry / "meta.json", 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(entry / "output", output_path)
+            for name, path in (attachments or {}).items():
+                shutil.copyfile(entry / name, path)
+        except (OSError, ValueError):
+            return None
+        return meta
+
+    def store(self, key: str, output_path: PathLike, meta: dict,
+              attachments: Optional[Dict[str, PathLike]] = None):
+        """Store an output file, its attachments and its metadata under key."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Build the entry next to its final location and move it into place,
+        # so a concurrent or interrupted run never sees a partial entry.
+        staging = Path(tempfile.mkdtemp(prefix=f".{key[:12]}-", dir=self.directory))
+        try:
+            shutil.copyfile(output_path, staging / "output")
+            for name, path in (attachments or {}).items():
+                shutil.copyfile(path, staging / name)
+            with open(staging / "meta.json", 'w', encoding='utf-8') as f:
+                json.dump(meta, f, ensure_ascii=False)
+            try:
+                os.replace(staging, self.directory / key)
+            except OSError:
+                # Another run stored the same key first
+                pass
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
@@ -6,14 +6,65 @@ Parses The_Constitution_of_Kenya_2010.txt into structured JSON for the Katiba ap
 
 Hierarchy: Chapters -> Parts -> Articles -> Clauses -> SubClauses -> MiniClauses
 
+The text is tokenized in a single pass (see tokenizer.py) and the chapter
+tree is built from the token stream, so parse time grows linearly with the
+size of the document. iter_nodes() reads from any text stream and yields
+each chapter and schedule as soon as it is complete, as the typed nodes of
+nodes.py; iter_constitution() yields them as constitution.json dicts. With
+--incremental, only the chapters and schedules that changed since the last
+run are parsed again (see incremental.py).
+
+Given input files, directories or glob patterns, every document is parsed
+into --output-dir on a pool of worker processes (see batch.py). For a
+single document, --jobs parses its chapters and schedules in parallel.
+
+With --provenance, every node records the byte offsets of the source text
+it came from (see provenance.py). With --schema app, the output has the
+shape of the app's constitution_of_kenya.json instead (see engine.py). With
+--dedup-strings, repeated strings are written once, in a string table
+(see string_table.py).
+
 Usage:
-    python parse_constitution.py
+    python parse_constitution.py [--pretty] [--no-cache] [--incremental] [--pattern-stats]
+    python parse_constitution.py --jobs N [--schema app] [--pretty] [--no-cache]
+    python parse_constitution.py --provenance {spans,offsets} [--pretty] [--no-cache]
+    python parse_constitution.py --schema app [--pretty] [--no-cache]
+    python parse_constitution.py --dedup-strings [--schema app] [--pretty] [--no-cache]
+    python parse_constitution.py --shards DIR [--pretty]
+    python parse_constitution.py INPUT... -o OUTPUT_DIR [--jobs N] [--pretty] [--no-cache]
 """
 
-import re
-import json
+import io
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+from json_writer import JsonStreamWriter
+from nodes import (
+    Article, Chapter, Clause, MiniClause, Node, Part, Preamble, Schedule, SubClause, to_parser_shape,
+)
+from normalize import memoized
+from parse_cache import DEFAULT_CACHE_DIR, ParseCache, file_digest, loaded_sources, parser_fingerprint
+from patterns import PATTERNS
+from provenance import OFFSETS, PROVENANCE_MODES, LineOffsets
+from string_table import StringPool, dedup_items
+from tokenizer import (
+    ARTICLE_START, ARTICLE_TITLE, CHAPTER, CLAUSE, MINICLAUSE, PAGE_MARKER,
+    PAGE_MARKER_TEXT, PART, PREAMBLE, SCHEDULES, SUBCLAUSE, TEXT, Token, tokenize,
+)
+
+
+# The parser modules; the ones imported are fingerprinted with
+# parse_cache.loaded_sources(PARSER_DIR), so none can be left out
+PARSER_DIR = Path(__file__).resolve().parent
+
+METADATA = {
+    "title": "The Constitution of Kenya, 2010",
+    "country": "Kenya",
+    "year": 2010
+}
 
 
 def read_constitution_text(file_path: Path) -> str:
@@ -22,19 +73,44 @@ def read_constitution_text(file_path: Path) -> str:
         return f.read()
 
 
+@memoized
 def clean_text(text: str) -> str:
     """Clean and normalize text."""
     if not text:
         return ""
-    # Replace multiple whitespace with single space
-    text = re.sub(r'\s+', ' ', text)
+    # Replace multiple whitespace with single space; str.split() splits on
+    # exactly the characters \s matches
+    text = ' '.join(text.split())
     # Remove page headers/footers
-    text = re.sub(r'Constitution of Kenya, 2010\s*\d*', '', text)
-    # Remove leading/trailing whitespace
-    text = text.strip()
+    if PAGE_MARKER_TEXT in text:
+        text = PATTERNS.page_marker.sub('', text).strip()
     return text
 
 
+# Joins the texts of a batch; neither \s nor the page marker matches it
+BATCH_SEPARATOR = '\x00'
+
+
+def clean_texts(texts: List[str]) -> List[str]:
+    """
+    clean_text() of every text. Texts already in its cache are reused; the
+    rest are normalized in one pass over their concatenation instead of
+    one call per text.
+    """
+    return clean_text.map(texts, _clean_batch)
+
+
+def _clean_batch(texts: List[str]) -> List[str]:
+    buffer = BATCH_SEPARATOR.join(texts)
+    if buffer.count(BATCH_SEPARATOR) != len(texts) - 1:
+        # Empty, or a text contains the separator itself
+        return [clean_text.function(text) for text in texts]
+    buffer = ' '.join(buffer.split())
+    if PAGE_MARKER_TEXT in buffer:
+        buffer = PATTERNS.page_marker.sub('', buffer)
+    return [text.strip() for text in buffer.split(BATCH_SEPARATOR)]
+
+
 def parse_roman_numeral(s: str) -> int:
     """Convert lowercase roman numeral to integer."""
     roman_map = {'i': 1, 'v': 5, 'x': 10, 'l': 50, 'c': 100}
@@ -61,318 +137,12 @@ def word_to_num(word: str) -> int:
     return word_map.get(word.upper(), 0)
 
 
-def parse_mini_clauses(text: str) -> tuple[str, list]:
-    """
-    Parse mini-clauses (i), (ii), (iii) from text.
-    Returns the main text and a list of mini-clauses.
-    """
-    mini_clauses = []
-    
-    # Pattern for roman numeral mini-clauses: (i), (ii), (iii), (iv), etc.
-    mini_pattern = r'\(([ivxlc]+)\)\s*'
-    parts = re.split(mini_pattern, text)
-    
-    if len(parts) > 1:
-        main_text = parts[0].strip()
-        for i in range(1, len(parts), 2):
-            if i + 1 < len(parts):
-                numeral = parts[i]
-                content = clean_text(parts[i + 1])
-                if content and re.match(r'^[ivxlc]+$', numeral):
-                    mini_clauses.append({
-                        "numeral": numeral,
-                        "number": parse_roman_numeral(numeral),
-                        "text": content
-                    })
-        return main_text, mini_clauses
-    
-    return text, []
-
-
-def parse_sub_clauses(text: str) -> tuple[str, list]:
-    """
-    Parse sub-clauses (a), (b), (c) from text.
-    Returns the main text and a list of sub-clauses with potential mini-clauses.
-    """
-    sub_clauses = []
-    
-    # Pattern for lettered sub-clauses: (a), (b), (c), etc.
-    sub_pattern = r'\(([a-z])\)\s*'
-    parts = re.split(sub_pattern, text)
-    
-    if len(parts) > 1:
-        main_text = parts[0].strip()
-        for i in range(1, len(parts), 2):
-            if i + 1 < len(parts):
-                label = parts[i]
-                content = parts[i + 1].strip()
-                
-                # Check for mini-clauses within this sub-clause
-                sub_text, mini_clauses = parse_mini_clauses(content)
-                
-                sub_clause = {
-                    "label": label,
-                    "text": clean_text(sub_text)
-                }
-                
-                if mini_clauses:
-                    sub_clause["miniClauses"] = mini_clauses
-                
-                sub_clauses.append(sub_clause)
-        
-        return main_text, sub_clauses
-    
-    return text, []
-
-
-def parse_clauses(article_text: str) -> list:
-    """
-    Parse clauses (1), (2), (3) from article text.
-    Returns a list of clauses with potential sub-clauses.
-    """
-    clauses = []
-    
-    # Pattern for numbered clauses: (1), (2), (3), etc.
-    clause_pattern = r'\((\d+)\)\s*'
-    parts = re.split(clause_pattern, article_text)
-    
-    if len(parts) > 1:
-        for i in range(1, len(parts), 2):
-            if i + 1 < len(parts):
-                clause_num = parts[i]
-                content = parts[i + 1].strip()
-                
-                # Parse sub-clauses
-                clause_text, sub_clauses = parse_sub_clauses(content)
-                
-                clause = {
-                    "number": int(clause_num),
-                    "text": clean_text(clause_text)
-                }
-                
-                if sub_clauses:
-                    clause["subClauses"] = sub_clauses
-                
-                clauses.append(clause)
-    else:
-        # No numbered clauses - article has only text
-        cleaned = clean_text(article_text)
-        if cleaned:
-            clauses.append({
-                "number": 0,
-                "text": cleaned,
-                "isTextOnly": True
-            })
-    
-    return clauses
-
-
-def parse_articles(text: str, start_article: int = 1) -> list:
-    """
-    Parse articles from a section of text.
-    Articles are identified by a number followed by a period and title.
-    """
-    articles = []
-    
-    # Pattern: Article number, title on line before, then content
-    # Article headers appear as: "Title.\n    N. (1) content" or "Title.\n N. content"
-    
-    # Find article patterns: number at start of line or after whitespace
-    # Format: "Title.\n     N. (1) text" or "N. (1) text"
-    
-    lines = text.split('\n')
-    current_article = None
-    current_title = ""
-    current_content = []
-    
-    # Regex for article number at start: "    1. (1)" or "1. (1)" or just "1. "
-    article_start_pattern = re.compile(r'^\s*(\d+)\.\s+(?:\(1\)\s*)?(.*)$')
-    # Title line pattern: ends with period, no article number
-    title_pattern = re.compile(r'^([A-Z][^.]*\.)\s*$')
-    
-    for line in lines:
-        # Skip page markers
-        if re.search(r'Constitution of Kenya, 2010', line):
-            continue
-        
-        # Check if this is a new article start
-        match = article_start_pattern.match(line)
-        if match:
-            # Save previous article
-            if current_article is not None:
-                article_content = '\n'.join(current_content)
-                clauses = parse_clauses(article_content)
-                articles.append({
-                    "number": current_article,
-                    "title": clean_text(current_title),
-                    "clauses": clauses
-                })
-            
-            current_article = int(match.group(1))
-            remainder = match.group(2)
-            current_content = [remainder] if remainder else []
-            
-            # Title was captured from previous lines
-            continue
-        
-        # Check if this might be a title line (for next article)
-        title_match = title_pattern.match(line.strip())
-        if title_match and not line.strip().startswith('('):
-            # This could be a title for the next article
-            current_title = title_match.group(1).rstrip('.')
-            continue
-        
-        # Otherwise, accumulate content
-        if current_article is not None:
-            current_content.append(line)
-    
-    # Save last article
-    if current_article is not None:
-        article_content = '\n'.join(current_content)
-        clauses = parse_clauses(article_content)
-        articles.append({
-            "number": current_article,
-            "title": clean_text(current_title),
-            "clauses": clauses
-        })
-    
-    return articles
-
-
-def parse_part(text: str, part_num: int, part_title: str) -> dict:
-    """Parse a Part section within a Chapter."""
-    articles = parse_articles(text)
-    return {
-        "number": part_num,
-        "title": clean_text(part_title),
-        "articles": articles
-    }
-
-
-def extract_parts_from_chapter(chapter_text: str) -> tuple[list, list]:
-    """
-    Extract Parts from chapter text.
-    Returns (parts_list, articles_outside_parts)
-    """
-    parts = []
-    
-    # Pattern for parts: "PART 1-TITLE" or "PART 1 - TITLE"
-    part_pattern = re.compile(r'PART\s+(\d+)\s*[-–—]\s*([A-Z][A-Z\s,]+)', re.IGNORECASE)
-    part_matches = list(part_pattern.finditer(chapter_text))
-    
-    if not part_matches:
-        # No parts found, articles are directly in chapter
-        articles = parse_articles(chapter_text)
-        return [], articles
-    
-    # Articles before first part
-    pre_part_text = chapter_text[:part_matches[0].start()]
-    articles_before = parse_articles(pre_part_text) if pre_part_text.strip() else []
-    
-    # Parse each part
-    for i, match in enumerate(part_matches):
-        part_num = int(match.group(1))
-        part_title = match.group(2).strip()
-        
-        start = match.end()
-        end = part_matches[i + 1].start() if i + 1 < len(part_matches) else len(chapter_text)
-        part_text = chapter_text[start:end]
-        
-        part = parse_part(part_text, part_num, part_title)
-        parts.append(part)
-    
-    return parts, articles_before
-
-
-def parse_chapters(text: str) -> list:
-    """Parse all chapters from the constitution text."""
-    chapters = []
-    
-    # Find where schedules start and truncate text to only parse chapters
-    schedule_start = re.search(r'SCHEDULES\s+FIRST\s+SCHEDULE', text, re.IGNORECASE)
-    chapters_text = text[:schedule_start.start()] if schedule_start else text
-    
-    # Pattern for chapter headers
-    chapter_pattern = re.compile(
-        r'CHAPTER\s+(ONE|TWO|THREE|FOUR|FIVE|SIX|SEVEN|EIGHT|NINE|TEN|ELEVEN|TWELVE|THIRTEEN|FOURTEEN|FIFTEEN|SIXTEEN|SEVENTEEN|EIGHTEEN)\s*[-–—]\s*([A-Z][A-Z\s,]+?)(?=\r?\n)',
-        re.IGNORECASE
-    )
-    
-    chapter_matches = list(chapter_pattern.finditer(chapters_text))
-    
-    for i, match in enumerate(chapter_matches):
-        chapter_word = match.group(1).upper()
-        chapter_num = word_to_num(chapter_word)
-        chapter_title = match.group(2).strip()
-        
-        # Get chapter content
-        start = match.end()
-        end = chapter_matches[i + 1].start() if i + 1 < len(chapter_matches) else len(chapters_text)
-        
-        chapter_text = chapters_text[start:end]
-        
-        # Parse parts and articles
-        parts, articles_outside = extract_parts_from_chapter(chapter_text)
-        
-        chapter = {
-            "number": chapter_num,
-            "title": clean_text(chapter_title)
-        }
-        
-        if parts:
-            chapter["parts"] = parts
-        if articles_outside:
-            chapter["articles"] = articles_outside
-        
-        chapters.append(chapter)
-    
-    return chapters
-
-
-def parse_preamble(text: str) -> dict:
-    """Parse the preamble section."""
-    # Find preamble - from start until first CHAPTER
-    preamble_match = re.search(r'PREAMBLE\s*(.*?)(?=CHAPTER\s+ONE)', text, re.DOTALL | re.IGNORECASE)
-    
-    if not preamble_match:
-        return {"paragraphs": []}
-    
-    preamble_text = preamble_match.group(1)
-    
-    # Split into paragraphs, clean each
-    lines = preamble_text.split('\n')
-    paragraphs = []
-    current_para = []
-    
-    for line in lines:
-        # Skip page markers
-        if re.search(r'Constitution of Kenya, 2010', line):
-            continue
-        
-        stripped = line.strip()
-        if stripped:
-            current_para.append(stripped)
-        elif current_para:
-            paragraphs.append(' '.join(current_para))
-            current_para = []
-    
-    if current_para:
-        paragraphs.append(' '.join(current_para))
-    
-    # Filter out empty paragraphs
-    paragraphs = [p for p in paragraphs if p.strip()]
-    
-    return {"paragraphs": paragraphs}
-
-
 def parse_first_schedule(text: str) -> dict:
     """Parse First Schedule - Counties list."""
     counties = []
     
     # Pattern: number. County name
-    county_pattern = re.compile(r'(\d+)\.\s*([A-Za-z\s\'/\-]+?)(?=\r?\n|\d+\.)')
-    
-    for match in county_pattern.finditer(text):
+    for match in PATTERNS.county.finditer(text):
         num = int(match.group(1))
         name = clean_text(match.group(2))
         if name:
@@ -395,9 +165,7 @@ def parse_second_schedule(text: str) -> dict:
     sections = []
     
     # Find subsections (a), (b), (c), (d)
-    section_pattern = re.compile(r'\(([a-d])\)\s*(THE\s+[A-Z\s]+)', re.IGNORECASE)
-    
-    for match in section_pattern.finditer(text):
+    for match in PATTERNS.symbol_section.finditer(text):
         label = match.group(1)
         title = clean_text(match.group(2))
         sections.append({
@@ -419,9 +187,7 @@ def parse_third_schedule(text: str) -> dict:
     oaths = []
     
     # Pattern for oath headers
-    oath_pattern = re.compile(r'(OATH\s+(?:OR\s+SOLEMN\s+AFFIRMATION\s+)?(?:OF\s+)?[A-Z\s/]+?)(?=\r?\n\s*I,)', re.IGNORECASE)
-    
-    for match in oath_pattern.finditer(text):
+    for match in PATTERNS.oath_title.finditer(text):
         title = clean_text(match.group(1))
         if title:
             oaths.append({
@@ -442,11 +208,10 @@ def parse_fourth_schedule(text: str) -> dict:
     parts = []
     
     # Part 1 - National Government
-    part1_match = re.search(r'PART\s+1\s*[-–—]\s*NATIONAL\s+GOVERNMENT(.*?)(?=PART\s+2)', text, re.DOTALL | re.IGNORECASE)
+    part1_match = PATTERNS.national_functions_part.search(text)
     if part1_match:
         functions = []
-        func_pattern = re.compile(r'(\d+)\.\s*([^0-9\n]+?)(?=\r?\n\s*\d+\.|\r?\nPART|\Z)')
-        for match in func_pattern.finditer(part1_match.group(1)):
+        for match in PATTERNS.national_function.finditer(part1_match.group(1)):
             num = int(match.group(1))
             func_text = clean_text(match.group(2))
             if func_text:
@@ -461,11 +226,10 @@ def parse_fourth_schedule(text: str) -> dict:
         })
     
     # Part 2 - County Governments
-    part2_match = re.search(r'PART\s+2\s*[-–—]\s*COUNTY\s+GOVERNMENTS(.*?)(?=FIFTH\s+SCHEDULE|\Z)', text, re.DOTALL | re.IGNORECASE)
+    part2_match = PATTERNS.county_functions_part.search(text)
     if part2_match:
         functions = []
-        func_pattern = re.compile(r'(\d+)\.\s*([^0-9\n]+?)(?=\r?\n\s*\d+\.|\r?\n\d+\s+Constitution|\Z)')
-        for match in func_pattern.finditer(part2_match.group(1)):
+        for match in PATTERNS.county_function.finditer(part2_match.group(1)):
             num = int(match.group(1))
             func_text = clean_text(match.group(2))
             if func_text:
@@ -500,18 +264,18 @@ def parse_fifth_schedule(text: str) -> dict:
         line = line.strip()
         
         # Skip page markers and empty lines
-        if not line or re.search(r'Constitution of Kenya, 2010', line):
+        if not line or PAGE_MARKER_TEXT in line:
             continue
         
         # Check for chapter header
-        chapter_match = re.match(r'(CHAPTER\s+[A-Z]+\s*[-–—]\s*[A-Z\s]+)', line, re.IGNORECASE)
+        chapter_match = PATTERNS.legislation_chapter.match(line)
         if chapter_match:
             current_chapter = clean_text(chapter_match.group(1))
             continue
         
         # Check for article and time specification
         # Format: "Legislation description (Article X)" followed by time on next line or same line
-        article_match = re.match(r'(.+?)\s*\(Article\s+(\d+(?:\s*\([^)]+\))?)\)', line, re.IGNORECASE)
+        article_match = PATTERNS.legislation_article.match(line)
         if article_match:
             description = clean_text(article_match.group(1))
             article_ref = article_match.group(2)
@@ -520,8 +284,8 @@ def parse_fifth_schedule(text: str) -> dict:
             time_spec = ""
             for j in range(i + 1, min(i + 3, len(lines))):
                 next_line = lines[j].strip()
-                if next_line and not re.search(r'Constitution of Kenya|CHAPTER|Article', next_line, re.IGNORECASE):
-                    if re.match(r'(One|Two|Three|Four|Five|Six|18|[0-9]+)\s*(year|month)', next_line, re.IGNORECASE):
+                if next_line and not PATTERNS.legislation_not_time.search(next_line):
+                    if PATTERNS.legislation_time.match(next_line):
                         time_spec = clean_text(next_line)
                         break
             
@@ -547,8 +311,7 @@ def parse_sixth_schedule(text: str) -> dict:
     parts = []
     
     # Pattern for parts
-    part_pattern = re.compile(r'PART\s+(\d+)\s*[-–—]\s*([A-Z\s]+?)(?=\r?\n)', re.IGNORECASE)
-    part_matches = list(part_pattern.finditer(text))
+    part_matches = list(PATTERNS.transitional_part.finditer(text))
     
     for i, match in enumerate(part_matches):
         part_num = int(match.group(1))
@@ -560,9 +323,7 @@ def parse_sixth_schedule(text: str) -> dict:
         
         # Parse sections within part
         sections = []
-        section_pattern = re.compile(r'(\d+)\.\s+(?:\(1\)\s*)?(.+?)(?=\r?\n\s*\d+\.|\Z)', re.DOTALL)
-        
-        for sec_match in section_pattern.finditer(part_text):
+        for sec_match in PATTERNS.transitional_section.finditer(part_text):
             sec_num = int(sec_match.group(1))
             sec_text = clean_text(sec_match.group(2))
             if sec_text:
@@ -586,120 +347,809 @@ def parse_sixth_schedule(text: str) -> dict:
     }
 
 
-def parse_schedules(text: str) -> list:
-    """Parse all six schedules."""
-    schedules = []
-    
-    # Find where schedules start
-    schedules_start = re.search(r'SCHEDULES\s+FIRST\s+SCHEDULE', text, re.IGNORECASE)
+SCHEDULE_PARSERS = [
+    parse_first_schedule,
+    parse_second_schedule,
+    parse_third_schedule,
+    parse_fourth_schedule,
+    parse_fifth_schedule,
+    parse_sixth_schedule
+]
+
+# Names of the heading patterns in PATTERNS, in schedule order
+SCHEDULE_MARKERS = [
+    "first_schedule",
+    "second_schedule",
+    "third_schedule",
+    "fourth_schedule",
+    "fifth_schedule",
+    "sixth_schedule"
+]
+
+
+class ScheduleSplitter:
+    """
+    Split the schedules text into the six schedules, line by line.
+
+    Each schedule runs from its own heading to the heading of the next one,
+    and is returned as an (index, text) pair as soon as that next heading is
+    seen; parse it with parse_schedule().
+    """
+
+    def __init__(self):
+        self._index = -1
+        self._lines = []
+
+    def feed(self, line: str) -> list:
+        """Consume one line; return the (index, text) schedules it completed."""
+        finished = []
+        while self._index + 1 < len(SCHEDULE_MARKERS):
+            match = getattr(PATTERNS, SCHEDULE_MARKERS[self._index + 1]).search(line)
+            if not match:
+                break
+            if self._index >= 0:
+                self._lines.append(line[:match.start()])
+                finished.append(self._take())
+            self._index += 1
+            self._lines = []
+            line = line[match.start():]
+
+        if self._index >= 0:
+            self._lines.append(line)
+        return finished
+
+    def close(self) -> Optional[Tuple[int, str]]:
+        """Return the schedule still being collected, if any."""
+        if self._index < 0 or self._index >= len(SCHEDULE_MARKERS):
+            return None
+        schedule = self._take()
+        self._index = len(SCHEDULE_MARKERS)
+        return schedule
+
+    def _take(self) -> Tuple[int, str]:
+        text = '\n'.join(self._lines)
+        self._lines = []
+        return self._index, text
+
+
+def parse_schedule(index: int, text: str) -> dict:
+    """Parse the text of one schedule (index 0 is the First Schedule)."""
+    return SCHEDULE_PARSERS[index](text)
+
+
+def parse_schedules(text: str, schedule_parser: Optional[Callable[[int, str], dict]] = None) -> list:
+    """Parse all six schedules; schedule_parser replaces parse_schedule()."""
+    schedules_start = PATTERNS.schedules_start.search(text)
     if not schedules_start:
-        return schedules
-    
-    schedules_text = text[schedules_start.start():]
-    
-    # Define schedule boundaries
-    schedule_markers = [
-        (r'FIRST\s+SCHEDULE', r'SECOND\s+SCHEDULE'),
-        (r'SECOND\s+SCHEDULE', r'THIRD\s+SCHEDULE'),
-        (r'THIRD\s+SCHEDULE', r'FOURTH\s+SCHEDULE'),
-        (r'FOURTH\s+SCHEDULE', r'FIFTH\s+SCHEDULE'),
-        (r'FIFTH\s+SCHEDULE', r'SIXTH\s+SCHEDULE'),
-        (r'SIXTH\s+SCHEDULE', None)
-    ]
-    
-    parsers = [
-        parse_first_schedule,
-        parse_second_schedule,
-        parse_third_schedule,
-        parse_fourth_schedule,
-        parse_fifth_schedule,
-        parse_sixth_schedule
-    ]
-    
-    for i, (start_pattern, end_pattern) in enumerate(schedule_markers):
-        start_match = re.search(start_pattern, schedules_text, re.IGNORECASE)
-        if not start_match:
-            continue
-        
-        start = start_match.start()
-        if end_pattern:
-            end_match = re.search(end_pattern, schedules_text, re.IGNORECASE)
-            end = end_match.start() if end_match else len(schedules_text)
-        else:
-            end = len(schedules_text)
-        
-        schedule_text = schedules_text[start:end]
-        schedule = parsers[i](schedule_text)
-        schedules.append(schedule)
-    
+        return []
+
+    parse = schedule_parser or parse_schedule
+    splitter = ScheduleSplitter()
+    schedules = []
+    for line in text[schedules_start.start():].split('\n'):
+        schedules.extend(parse(*schedule) for schedule in splitter.feed(line))
+    schedule = splitter.close()
+    if schedule is not None:
+        schedules.append(parse(*schedule))
+
     return schedules
 
 
-def parse_constitution(text: str) -> dict:
+class ConstitutionBuilder:
+    """
+    Build the preamble and chapter tree from a token stream.
+
+    Nodes stay open until a token at the same or a higher level arrives.
+    Their titles and joined text lines are left raw until the chapter
+    closes, and then cleaned in one batch (see clean_texts()). Titles and
+    labels are interned; texts and schedule strings are shared through a
+    StringPool that lives as long as the builder (see string_table.py).
+    Lines after the SCHEDULES token are handed to a ScheduleSplitter.
+
+    Nodes are those of nodes.py. Finished top-level nodes are queued as
+    ("preamble" | "chapter" | "schedule", node) pairs and collected with
+    pop_finished(); nothing else is retained once it has been handed out.
+
+    Given the LineOffsets the lines were tracked with, every node below the
+    chapters gets a span (see provenance.py); without keep_text, their text
+    is None.
+
+    Schedules are parsed with schedule_parser(index, text), parse_schedule()
+    unless another output schema supplies its own (see engine.py).
+    """
+
+    def __init__(self, offsets: Optional[LineOffsets] = None, keep_text: bool = True,
+                 schedule_parser: Optional[Callable[[int, str], dict]] = None):
+        self._offsets = offsets
+        self._keep_text = keep_text
+        self._parse_schedule = schedule_parser or parse_schedule
+        # Source offset where each open node starts, and where the last
+        # line of content seen so far ends
+        self._start = dict.fromkeys(("chapter", "part", "article", "clause", "sub", "mini"))
+        self._last_end = None
+        self._title_span = None
+        # (node, attribute, keep) of every raw text awaiting clean_texts(),
+        # and (siblings, node) of the nodes dropped from their list of
+        # siblings if their text cleans to nothing
+        self._raw = []
+        self._droppable = []
+        self._pool = StringPool()
+        self._finished = []
+        self._schedules = ScheduleSplitter()
+        self._paragraphs = []
+        self._paragraph = []
+        self._seen_chapter = False
+        self._in_preamble = False
+        self._in_schedules = False
+        self._chapter = None
+        self._part = None
+        self._article = None
+        self._clause = None
+        self._sub = None
+        self._mini = None
+        self._title = None
+
+    def feed(self, token: Token):
+        """Consume one token."""
+        kind = token.kind
+
+        if self._in_schedules:
+            if kind == TEXT:
+                for schedule in self._schedules.feed(token.text):
+                    self._finished.append(("schedule", self._schedule(schedule)))
+            return
+
+        if kind == PAGE_MARKER:
+            return
+        span = self._offsets.span(token.line_no) if self._offsets is not None else None
+
+        if self._in_preamble:
+            if kind == TEXT:
+                stripped = token.text.strip()
+                if stripped:
+                    self._paragraph.append(stripped)
+                elif self._paragraph:
+                    self._paragraphs.append(' '.join(self._paragraph))
+                    self._paragraph = []
+                return
+            self._close_preamble()
+
+        if kind == TEXT:
+            if token.text.strip():
+                self._flush_title()
+                self._append_text(token.text, span)
+        elif kind == ARTICLE_TITLE:
+            self._flush_title()
+            self._title = token.text
+            self._title_span = span
+        elif kind == MINICLAUSE:
+            self._flush_title()
+            if self._sub is None:
+                self._append_text(f"({token.label}) {token.text}", span)
+            else:
+                self._close_mini()
+                self._mini = {"numeral": sys.intern(token.label), "lines": [token.text]}
+                self._opened("mini", span)
+        elif kind == SUBCLAUSE:
+            self._flush_title()
+            if self._clause is not None:
+                self._close_sub()
+                self._sub = {"label": sys.intern(token.label), "lines": [token.text], "miniClauses": []}
+                self._opened("sub", span)
+        elif kind == CLAUSE:
+            self._flush_title()
+            if self._article is not None:
+                self._close_clause()
+                self._clause = {"number": int(token.label), "lines": [token.text], "subClauses": []}
+                self._opened("clause", span)
+        elif kind == ARTICLE_START:
+            if self._chapter is not None:
+                self._close_article()
+                self._article = Article(int(token.label), self._title or "")
+                self._clean_later(self._article, "title")
+                self._opened("article", span)
+                if self._title_span is not None:
+                    self._start["article"] = self._title_span[0]
+                self._title = self._title_span = None
+                # Text before any numbered clause belongs to a text-only clause
+                self._clause = {"number": 0, "lines": [], "subClauses": []}
+                self._start["clause"] = None
+        elif kind == PART:
+            self._flush_title()
+            if self._chapter is not None:
+                self._close_part()
+                self._part = Part(int(token.label), token.text)
+                self._clean_later(self._part, "title")
+                self._opened("part", span)
+        elif kind == CHAPTER:
+            self._flush_title()
+            self._close_chapter()
+            self._seen_chapter = True
+            self._chapter = Chapter(word_to_num(token.label), token.text)
+            self._clean_later(self._chapter, "title")
+            self._opened("chapter", span)
+        elif kind == PREAMBLE:
+            if not self._seen_chapter:
+                self._in_preamble = True
+        elif kind == SCHEDULES:
+            self._flush_title()
+            self._close_chapter()
+            self._in_schedules = True
+
+    def close(self):
+        """Close every node still open at the end of the input."""
+        if self._in_preamble:
+            self._close_preamble()
+        self._flush_title()
+        self._close_chapter()
+        schedule = self._schedules.close()
+        if schedule is not None:
+            self._finished.append(("schedule", self._schedule(schedule)))
+
+    def pop_finished(self) -> list:
+        """Return the nodes finished since the last call."""
+        finished, self._finished = self._finished, []
+        return finished
+
+    def _append_text(self, text: str, span: Optional[Tuple[int, int]] = None):
+        if self._mini is not None:
+            self._mini["lines"].append(text)
+        elif self._sub is not None:
+            self._sub["lines"].append(text)
+        elif self._clause is not None:
+            self._clause["lines"].append(text)
+            self._opened("clause", span, only_if_unset=True)
+            return
+        if span is not None:
+            self._last_end = span[1]
+
+    def _opened(self, level: str, span: Optional[Tuple[int, int]], only_if_unset: bool = False):
+        """Record the line a node starts on as the last line of content."""
+        if span is None:
+            return
+        if level in ("sub", "mini") and self._start["clause"] is None:
+            self._start["clause"] = span[0]     # a text-only clause starting with (a)
+        if not only_if_unset or self._start[level] is None:
+            self._start[level] = span[0]
+        self._last_end = span[1]
+
+    def _schedule(self, schedule: Tuple[int, str]) -> Schedule:
+        return Schedule.from_dict(self._pool.share_all(self._parse_schedule(*schedule)))
+
+    def _add_span(self, level: str, node: Node):
+        if self._offsets is not None and self._start[level] is not None:
+            node.span = (self._start[level], self._last_end)
+
+    def _clean_later(self, node: Node, attribute: str, keep: bool = True):
+        """Queue the raw text of a node for cleaning; without keep, it is set to None instead."""
+        self._raw.append((node, attribute, keep))
+
+    def _clean_raw(self):
+        """Clean every queued text in one batch and drop the nodes left empty."""
+        raw, self._raw = self._raw, []
+        texts = clean_texts([getattr(node, attribute) for node, attribute, _ in raw])
+        share = self._pool.share
+        for (node, attribute, _), text in zip(raw, texts):
+            setattr(node, attribute, sys.intern(text) if attribute == "title" else share(text))
+        droppable, self._droppable = self._droppable, []
+        for siblings, node in droppable:
+            if not node.text:
+                del siblings[next(i for i, sibling in enumerate(siblings) if sibling is node)]
+        for node, attribute, keep in raw:
+            if not keep:
+                setattr(node, attribute, None)
+
+    def _flush_title(self):
+        # A title line that is not followed by an article start was a wrapped
+        # line of running text.
+        if self._title is not None:
+            title, self._title = self._title, None
+            span, self._title_span = self._title_span, None
+            self._append_text(title + '.', span)
+
+    def _close_preamble(self):
+        if self._paragraph:
+            self._paragraphs.append(' '.join(self._paragraph))
+            self._paragraph = []
+        self._in_preamble = False
+        self._finished.append(("preamble", Preamble(self._paragraphs)))
+        self._paragraphs = []
+
+    def _close_mini(self):
+        mini, self._mini = self._mini, None
+        if mini is None:
+            return
+        mini_clause = MiniClause(mini["numeral"], parse_roman_numeral(mini["numeral"]), ' '.join(mini["lines"]))
+        self._clean_later(mini_clause, "text", self._keep_text)
+        self._add_span("mini", mini_clause)
+        self._sub["miniClauses"].append(mini_clause)
+
+    def _close_sub(self):
+        self._close_mini()
+        sub, self._sub = self._sub, None
+        if sub is None:
+            return
+        sub_clause = SubClause(sub["label"], mini_clauses=sub["miniClauses"])
+        if self._keep_text:
+            sub_clause.text = ' '.join(sub["lines"])
+            self._clean_later(sub_clause, "text")
+        # Mini-clauses without text are dropped
+        self._droppable.extend((sub_clause.mini_clauses, mini) for mini in sub_clause.mini_clauses)
+        self._add_span("sub", sub_clause)
+        self._clause["subClauses"].append(sub_clause)
+
+    def _close_clause(self):
+        self._close_sub()
+        clause, self._clause = self._clause, None
+        if clause is None:
+            return
+        text = ' '.join(clause["lines"])
+        if clause["number"] == 0 and not text and not clause["subClauses"]:
+            return
+        result = Clause(clause["number"], text, clause["subClauses"])
+        self._clean_later(result, "text", self._keep_text)
+        if clause["number"] == 0 and not clause["subClauses"]:
+            # Dropped if its text is only whitespace and page markers
+            self._droppable.append((self._article.clauses, result))
+        self._add_span("clause", result)
+        self._article.clauses.append(result)
+
+    def _close_article(self):
+        self._close_clause()
+        article, self._article = self._article, None
+        if article is None:
+            return
+        self._add_span("article", article)
+        if self._part is not None:
+            self._part.articles.append(article)
+        else:
+            self._chapter.articles.append(article)
+
+    def _close_part(self):
+        self._close_article()
+        part, self._part = self._part, None
+        if part is not None:
+            self._add_span("part", part)
+            self._chapter.parts.append(part)
+
+    def _close_chapter(self):
+        if self._chapter is None:
+            return
+        self._close_part()
+        self._clean_raw()
+        chapter, self._chapter = self._chapter, None
+        self._add_span("chapter", chapter)
+        self._finished.append(("chapter", chapter))
+
+
+# Functions timed by build_app_assets.py --engine --timings, as
+# (namespace, {function name: stage name}) for instrumentation.StageTimer.
+# Chapter boundaries are found by the tokenizer, so "tokenize" is this
+# parser's chapter split; each _close_* method finishes one level.
+TIMED_STAGES = [
+    (globals(), {"tokenize": "tokenize", "clean_texts": "text cleaning"}),
+    (ConstitutionBuilder, {
+        "feed": "build",
+        "_close_preamble": "preamble",
+        "_close_chapter": "chapter",
+        "_close_part": "part extraction",
+        "_close_article": "article split",
+        "_close_clause": "clauses",
+        "_close_sub": "sub-clauses",
+        "_close_mini": "mini-clauses",
+        "_schedule": lambda builder, schedule: f"parse_schedule_{schedule[0] + 1}",
+    }),
+    (ScheduleSplitter, {"feed": "schedule split"}),
+]
+
+
+def split_sections(lines: Iterable[str]) -> List[Tuple[str, int, str]]:
+    """
+    Cut the document into its preamble, chapters and schedules, as
+    (kind, schedule index, text) triples in document order; the index is 0
+    for the preamble and chapters.
+
+    Boundaries come from the tokenizer, so a section always starts exactly
+    where a full parse would start the corresponding node, and parsing each
+    section on its own (parse_section()) gives the nodes of a full parse.
+    """
+    lines = [line.rstrip('\r\n') for line in lines]
+    boundaries = []
+    for token in tokenize(lines):
+        if token.kind == PREAMBLE and not boundaries:
+            boundaries.append((PREAMBLE, token.line_no - 1))
+        elif token.kind == CHAPTER:
+            boundaries.append((CHAPTER, token.line_no - 1))
+        elif token.kind == SCHEDULES:
+            boundaries.append((SCHEDULES, token.line_no - 1))
+            break
+
+    sections = []
+    for i, (kind, start) in enumerate(boundaries):
+        end = boundaries[i + 1][1] if i + 1 < len(boundaries) else len(lines)
+        if kind == PREAMBLE:
+            sections.append(("preamble", 0, '\n'.join(lines[start:end])))
+        elif kind == CHAPTER:
+            sections.append(("chapter", 0, '\n'.join(lines[start:end])))
+        else:
+            splitter = ScheduleSplitter()
+            for line in lines[start:]:
+                for index, text in splitter.feed(line):
+                    sections.append(("schedule", index, text))
+            schedule = splitter.close()
+            if schedule is not None:
+                sections.append(("schedule", *schedule))
+
+    return sections
+
+
+def parse_section(section: Tuple[str, int, str],
+                  schedule_parser: Optional[Callable[[int, str], dict]] = None) -> Node:
+    """Parse one section from split_sections() on its own."""
+    kind, index, text = section
+    builder = ConstitutionBuilder(schedule_parser=schedule_parser)
+    if kind == "schedule":
+        return builder._schedule((index, text))
+    for token in tokenize(text.split('\n')):
+        builder.feed(token)
+    builder.close()
+    for _, node in builder.pop_finished():
+        return node
+    raise ValueError(f"Section produced no {kind}")
+
+
+def iter_nodes(lines: Iterable[str], provenance: Optional[str] = None,
+               schedule_parser: Optional[Callable[[int, str], dict]] = None,
+               jobs: int = 1) -> Iterator[Tuple[str, Node]]:
+    """
+    Parse the constitution incrementally from any iterable of lines, such as
+    an open text file.
+
+    Yields ("preamble", Preamble), then ("chapter", Chapter) and
+    ("schedule", Schedule) pairs in document order, each as soon as its end
+    is reached. Only the node currently being built is held in memory.
+
+    With provenance ("spans" or "offsets", see provenance.py) the lines must
+    keep their line endings, as read from a file opened with newline=''.
+    schedule_parser replaces parse_schedule() (see ConstitutionBuilder).
+
+    With jobs > 1, the whole input is read and split into sections
+    (split_sections()), which are parsed on a pool of that many worker
+    processes and yielded in document order. schedule_parser must then be
+    picklable. Titles and labels are interned in the worker that parsed
+    them, not across sections.
+    """
+    if jobs > 1:
+        if provenance is not None:
+            raise ValueError("Source offsets cannot be combined with parallel parsing")
+        yield from _iter_parallel(lines, schedule_parser, jobs)
+        return
+
+    offsets = None
+    if provenance is not None:
+        offsets = LineOffsets()
+        lines = offsets.track(lines)
+    builder = ConstitutionBuilder(offsets, keep_text=provenance != OFFSETS, schedule_parser=schedule_parser)
+    for token in tokenize(lines):
+        builder.feed(token)
+        yield from builder.pop_finished()
+    builder.close()
+    yield from builder.pop_finished()
+
+
+def _iter_parallel(lines: Iterable[str], schedule_parser: Optional[Callable[[int, str], dict]],
+                   jobs: int) -> Iterator[Tuple[str, Node]]:
+    sections = split_sections(lines)
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        nodes = executor.map(parse_section, sections, repeat(schedule_parser))
+        for (kind, _, _), node in zip(sections, nodes):
+            yield kind, node
+
+
+def iter_constitution(lines: Iterable[str], provenance: Optional[str] = None,
+                      jobs: int = 1) -> Iterator[Tuple[str, dict]]:
+    """iter_nodes(), with every node as written to constitution.json."""
+    for kind, node in iter_nodes(lines, provenance, jobs=jobs):
+        yield kind, to_parser_shape(node)
+
+
+def parse_constitution(text: str, provenance: Optional[str] = None, jobs: int = 1) -> dict:
     """Main parser function that orchestrates all parsing."""
     result = {
-        "metadata": {
-            "title": "The Constitution of Kenya, 2010",
-            "country": "Kenya",
-            "year": 2010
-        },
-        "preamble": parse_preamble(text),
-        "chapters": parse_chapters(text),
-        "schedules": parse_schedules(text)
+        "metadata": METADATA,
+        "preamble": {"paragraphs": []},
+        "chapters": [],
+        "schedules": []
     }
-    
+
+    lines = io.StringIO(text, newline='') if provenance else text.split('\n')
+    for kind, node in iter_constitution(lines, provenance, jobs):
+        if kind == "preamble":
+            result["preamble"] = node
+        else:
+            result[kind + "s"].append(node)
+
     return result
 
 
-def print_summary(data: dict):
-    """Print parsing summary."""
+def write_constitution(items: Iterable[Tuple[str, Any]], writer: JsonStreamWriter,
+                       metadata: Optional[dict] = METADATA, empty_preamble: Any = None,
+                       strings: Optional[list] = None):
+    """
+    Write streamed (kind, node) pairs as the constitution document.
+
+    Keys are written in the order metadata, strings, preamble, chapters,
+    schedules; each chapter and schedule is serialized as soon as it
+    arrives. Without metadata, the key is left out. strings is the string
+    table the nodes refer to, if any (see string_table.py). empty_preamble
+    is written if no preamble arrives (default: no paragraphs).
+    """
+    if empty_preamble is None:
+        empty_preamble = {"paragraphs": []}
+    if metadata is not None:
+        writer.write("metadata", metadata)
+    if strings is not None:
+        writer.write("strings", strings)
+    list_keys = ["chapters", "schedules"]
+    current = -1
+
+    for kind, node in items:
+        if kind == "preamble":
+            writer.write("preamble", node)
+            continue
+        if "preamble" not in writer.sections:
+            writer.write("preamble", empty_preamble)
+        index = list_keys.index(kind + "s")
+        while current < index:
+            if current >= 0:
+                writer.end_list()
+            current += 1
+            writer.begin_list(list_keys[current])
+        writer.append(node)
+
+    if "preamble" not in writer.sections:
+        writer.write("preamble", empty_preamble)
+    while current < len(list_keys) - 1:
+        if current >= 0:
+            writer.end_list()
+        current += 1
+        writer.begin_list(list_keys[current])
+    writer.close()
+
+
+def summarize_chapter(chapter: dict) -> dict:
+    """Count the parts, articles and clauses of a chapter."""
+    articles = list(chapter.get('articles', []))
+    for part in chapter.get('parts', []):
+        articles.extend(part.get('articles', []))
+    return {
+        "number": chapter['number'],
+        "title": chapter['title'],
+        "parts": len(chapter.get('parts', [])),
+        "articles": len(articles),
+        "clauses": sum(len(article.get('clauses', [])) for article in articles)
+    }
+
+
+def print_summary(preamble: Any, chapters: list, schedules: list):
+    """Print parsing summary from chapter summaries and schedules."""
     print("=" * 60)
     print("Parsing Summary")
     print("=" * 60)
     
-    preamble_paras = len(data.get('preamble', {}).get('paragraphs', []))
-    print(f"Preamble paragraphs: {preamble_paras}")
-    
-    chapters = data.get('chapters', [])
+    if isinstance(preamble, dict):
+        print(f"Preamble paragraphs: {len(preamble.get('paragraphs', []))}")
+    else:
+        print(f"Preamble: {len(preamble or '')} chars")
     print(f"Chapters: {len(chapters)}")
     
-    total_articles = 0
-    total_clauses = 0
-    
     for chapter in chapters:
-        chapter_articles = 0
-        
-        # Count articles in parts
-        for part in chapter.get('parts', []):
-            chapter_articles += len(part.get('articles', []))
-            for article in part.get('articles', []):
-                total_clauses += len(article.get('clauses', []))
-        
-        # Count articles directly in chapter
-        chapter_articles += len(chapter.get('articles', []))
-        for article in chapter.get('articles', []):
-            total_clauses += len(article.get('clauses', []))
-        
-        total_articles += chapter_articles
-        
-        parts_count = len(chapter.get('parts', []))
-        print(f"  Chapter {chapter['number']}: {chapter['title'][:40]}... - {chapter_articles} articles, {parts_count} parts")
+        print(f"  Chapter {chapter['number']}: {chapter['title'][:40]}... - {chapter['articles']} articles, {chapter['parts']} parts")
     
-    print(f"\nTotal articles: {total_articles}")
-    print(f"Total clauses: {total_clauses}")
+    print(f"\nTotal articles: {sum(chapter['articles'] for chapter in chapters)}")
+    print(f"Total clauses: {sum(chapter['clauses'] for chapter in chapters)}")
     
-    schedules = data.get('schedules', [])
     print(f"\nSchedules: {len(schedules)}")
     for schedule in schedules:
-        print(f"  Schedule {schedule['number']}: {schedule['title'][:40]}... ({schedule['type']})")
+        kind = f" ({schedule['type']})" if schedule.get('type') else ""
+        print(f"  Schedule {schedule['number']}: {schedule['title'][:40]}...{kind}")
+
+
+def new_summary() -> dict:
+    return {"preamble": {}, "chapters": [], "schedules": []}
+
+
+def observe(items: Iterable[Tuple[str, dict]], summary: dict) -> Iterator[Tuple[str, dict]]:
+    """Pass (kind, node) pairs through, recording what print_summary() needs."""
+    for kind, node in items:
+        if kind == "preamble":
+            summary["preamble"] = node
+        elif kind == "chapter":
+            summary["chapters"].append(summarize_chapter(node))
+        else:
+            summary["schedules"].append({key: node.get(key) for key in ("number", "title", "type")})
+        yield kind, node
+
+
+def parse_to_file(input_path: Path, output_path: Path, pretty: bool = False,
+                  incremental: bool = False, provenance: Optional[str] = None,
+                  schema: str = "parser", dedup_strings: bool = False,
+                  cache_dir: Path = DEFAULT_CACHE_DIR, jobs: int = 1) -> dict:
+    """
+    Stream-parse input_path into output_path.
+
+    With incremental, chapters and schedules whose text is unchanged since
+    the previous run are copied from the previous output at output_path;
+    the state of each run is kept in cache_dir (see incremental.py).
+    With provenance, nodes carry source offsets (see provenance.py) and the
+    metadata identifies the source they point into. schema names the output
+    shape (see engine.py). With dedup_strings, repeated strings are written
+    once, in a string table (see string_table.py); the whole document is
+    then held in memory until it is written. With jobs > 1, chapters and
+    schedules are parsed on that many worker processes (see iter_nodes()).
+
+    Returns the summary printed by main(): preamble, per-chapter counts,
+    schedule headers and the writer's byte report.
+    """
+    summary = new_summary()
+    state = None
+    if incremental:
+        import incremental as incremental_parse
+        state = incremental_parse.IncrementalParse(
+            output_path, parser_fingerprint(loaded_sources(PARSER_DIR)), cache_dir)
+        state.discard_state()
+
+    output_schema = None
+    if incremental and jobs > 1:
+        raise ValueError("Incremental parsing cannot be combined with parallel parsing")
+    if incremental and dedup_strings:
+        raise ValueError("A string table cannot be combined with incremental parsing")
+    if schema != "parser":
+        if incremental:
+            raise ValueError("Only the parser schema can be parsed incrementally")
+        import engine
+        output_schema = engine.get_schema(schema)
+
+    metadata = METADATA if output_schema is None else output_schema.metadata
+    if provenance:
+        if incremental:
+            raise ValueError("Source offsets cannot be combined with incremental parsing")
+        metadata = dict(metadata or {}, source={
+            "file": input_path.name,
+            "bytes": input_path.stat().st_size,
+            "sha256": file_digest(input_path),
+            "offsets": "utf-8",
+            "provenance": provenance
+        })
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    newline = '' if provenance else None
+    with open(input_path, 'r', encoding='utf-8', newline=newline) as src, open(output_path, 'wb') as out:
+        writer = JsonStreamWriter(out, pretty=pretty)
+        if output_schema is not None:
+            items = engine.iter_document(src, output_schema, provenance, jobs)
+        else:
+            items = state.iter_nodes(src.readlines()) if state else iter_constitution(src, provenance, jobs)
+        items = observe(items, summary)
+        strings = None
+        if dedup_strings:
+            strings, items = dedup_items(items)
+        if output_schema is not None:
+            engine.write_document(items, writer, output_schema, metadata, strings)
+        else:
+            write_constitution(items, writer, metadata, strings=strings)
+
+    summary["report"] = writer.report()
+    if state:
+        state.save_state()
+        summary["incremental"] = f"{state.reused} reused, {state.parsed} parsed"
+    return summary
+
+
+def parse_to_shards(input_path: Path, shard_dir: Path, pretty: bool = False, jobs: int = 1) -> dict:
+    """
+    Stream-parse input_path into one file per chapter and schedule plus a
+    manifest in shard_dir (see shards.py), parsing on jobs worker processes
+    (see iter_nodes()). Returns the summary.
+    """
+    from shards import MANIFEST_NAME, ShardWriter
+
+    summary = new_summary()
+    shard_writer = ShardWriter(shard_dir, pretty=pretty, metadata=METADATA)
+    with open(input_path, 'r', encoding='utf-8') as src:
+        for kind, node in observe(iter_constitution(src, jobs=jobs), summary):
+            shard_writer.add(kind, node)
+    manifest = shard_writer.close()
+
+    shards = ([manifest["preamble"]] if manifest["preamble"] else []) + manifest["chapters"] + manifest["schedules"]
+    manifest_size = (shard_dir / MANIFEST_NAME).stat().st_size
+    summary["report"] = (f"  {len(shards)} shards, {sum(shard['bytes'] for shard in shards):,} bytes\n"
+                         f"  {MANIFEST_NAME}: {manifest_size:,} bytes")
+    return summary
+
+
+def run_batch(args) -> int:
+    """Parse every document matched by args.inputs into args.output_dir."""
+    import batch
+
+    inputs = batch.expand_inputs(args.inputs)
+    if not inputs:
+        print("ERROR: No input files matched")
+        return 1
+
+    print(f"Parsing {len(inputs)} documents into {args.output_dir}...")
+    cache_dir = None if args.no_cache else args.cache_dir
+    manifest = batch.parse_batch(inputs, args.output_dir, pretty=args.pretty,
+                                 jobs=args.jobs, cache_dir=cache_dir)
+
+    for document in manifest["documents"]:
+        if "error" in document:
+            print(f"  FAILED {document['input']}: {document['error']}")
+        else:
+            cached = " (cached)" if document["cached"] else ""
+            print(f"  {document['input']}: {document['chapters']} chapters, "
+                  f"{document['articles']} articles, {document['outputBytes']:,} bytes{cached}")
+
+    print()
+    print(f"Manifest: {args.output_dir / batch.MANIFEST_NAME}")
+    print(f"{len(inputs) - manifest['failed']} parsed, {manifest['failed']} failed "
+          f"in {manifest['seconds']:.2f}s")
+    return 1 if manifest["failed"] else 0
 
 
 def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Parse the Constitution of Kenya 2010 into JSON")
+    parser.add_argument('inputs', nargs='*',
+                        help="Files, directories or glob patterns to parse in batch (default: the app's constitution)")
+    parser.add_argument('-o', '--output-dir', type=Path, default=Path("parsed"),
+                        help="Batch output directory (default: %(default)s)")
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help="Worker processes: per document in batch mode (default: one per CPU), "
+                             "otherwise per chapter and schedule (default: 1)")
+    parser.add_argument('--pretty', action='store_true',
+                        help="Indent the JSON output (default: compact)")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="Always parse, even if the input and parser are unchanged")
+    parser.add_argument('--shards', type=Path, metavar='DIR',
+                        help="Write one JSON file per chapter and schedule plus a manifest to DIR")
+    parser.add_argument('--incremental', action='store_true',
+                        help="Only re-parse the chapters and schedules changed since the last run")
+    parser.add_argument('--provenance', choices=PROVENANCE_MODES,
+                        help="Record each node's source byte offsets; 'offsets' also drops clause "
+                             "texts, which are read from the source instead")
+    parser.add_argument('--schema', choices=("parser", "app"), default="parser",
+                        help="Output shape: this parser's constitution.json, or the app's "
+                             "constitution_of_kenya.json (default: %(default)s; see engine.py)")
+    parser.add_argument('--dedup-strings', action='store_true',
+                        help="Write repeated strings once, in a top-level string table, and refer "
+                             "to them by index (see string_table.py)")
+    parser.add_argument('--cache-dir', type=Path, default=DEFAULT_CACHE_DIR,
+                        help="Parse cache directory, which also holds the --incremental state "
+                             "(default: %(default)s)")
+    parser.add_argument('--pattern-stats', action='store_true',
+                        help="Report call counts and time spent per regex pattern (implies --no-cache)")
+    args = parser.parse_args()
+    if args.provenance and (args.inputs or args.shards or args.incremental):
+        parser.error("--provenance cannot be combined with batch inputs, --shards or --incremental")
+    if args.schema != "parser" and (args.inputs or args.shards or args.incremental):
+        parser.error("--schema cannot be combined with batch inputs, --shards or --incremental")
+    if args.dedup_strings and (args.inputs or args.shards or args.incremental):
+        parser.error("--dedup-strings cannot be combined with batch inputs, --shards or --incremental")
+    if not args.inputs and (args.jobs or 1) > 1 and (args.provenance or args.incremental):
+        parser.error("--jobs cannot be combined with --provenance or --incremental")
+
+    if args.inputs:
+        return run_batch(args)
+
     # Paths
     script_dir = Path(__file__).parent
     project_root = script_dir.parent
     input_path = project_root / "composeApp" / "src" / "commonMain" / "composeResources" / "files" / "The_Constitution_of_Kenya_2010.txt"
     output_path = project_root / "composeApp" / "src" / "commonMain" / "composeResources" / "files" / "constitution.json"
+    if args.shards:
+        output_path = args.shards
     
     print("=" * 60)
     print("Constitution of Kenya Parser")
@@ -712,29 +1162,49 @@ def main():
         print(f"ERROR: Input file not found at {input_path}")
         return 1
     
-    # Read text
-    print("Reading constitution text...")
-    text = read_constitution_text(input_path)
-    print(f"Text length: {len(text)} characters")
+    print(f"Text size: {input_path.stat().st_size:,} bytes")
     print()
-    
-    # Parse
-    print("Parsing constitution...")
-    constitution = parse_constitution(text)
+
+    cache = None if args.no_cache or args.pattern_stats or args.shards else ParseCache(args.cache_dir)
+    summary = None
+    if cache:
+        if args.schema != "parser":
+            # Imported by parse_to_file(); fingerprinted with the modules already loaded
+            import engine  # noqa: F401
+        key = cache.key(input_path, parser_fingerprint(loaded_sources(PARSER_DIR)), args.pretty, args.provenance,
+                        args.schema, args.dedup_strings)
+        summary = cache.fetch(key, output_path)
+        if summary:
+            print("Input and parser unchanged: cached JSON copied, parsing skipped")
+            print()
+
+    if summary is None:
+        # Parse and write each chapter and schedule as soon as it is complete
+        print("Parsing constitution and writing JSON...")
+        if args.pattern_stats:
+            PATTERNS.enable_stats()
+        if args.shards:
+            summary = parse_to_shards(input_path, args.shards, pretty=args.pretty, jobs=args.jobs or 1)
+        else:
+            summary = parse_to_file(input_path, output_path, pretty=args.pretty,
+                                    incremental=args.incremental, provenance=args.provenance,
+                                    schema=args.schema, dedup_strings=args.dedup_strings,
+                                    cache_dir=args.cache_dir, jobs=args.jobs or 1)
+        if summary.get("incremental"):
+            print(f"Incremental: {summary['incremental']}")
+        if cache:
+            cache.store(key, output_path, summary)
     
     # Print summary
-    print_summary(constitution)
+    print_summary(summary["preamble"], summary["chapters"], summary["schedules"])
     print()
-    
-    # Save JSON
-    print("Saving JSON...")
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(constitution, f, indent=2, ensure_ascii=False)
+
+    if args.pattern_stats:
+        print(PATTERNS.report())
+        print()
     
     print(f"JSON saved to: {output_path}")
-    print(f"JSON size: {output_path.stat().st_size:,} bytes")
+    print(summary["report"])
     print()
     print("=" * 60)
     print("SUCCESS!")
@@ -0,0 +1,258 @@
+"""
+Compiled regular expressions shared by the parser modules.
+
+Every pattern is compiled once, at import time, and registered under a name:
+
+    from patterns import PATTERNS
+    PATTERNS.whitespace.sub(' ', text)
+
+Call counts and time spent per pattern can be collected with
+PATTERNS.enable_stats() and printed with PATTERNS.report(). While stats are
+disabled, the attributes are the plain compiled patterns, so there is no
+overhead on the parsing hot path.
+"""
+
+import re
+import time
+from typing import Dict, List, Tuple
+
+
+class _CountingPattern:
+    """Wraps a compiled pattern and records calls and elapsed time."""
+
+    __slots__ = ("_pattern", "_stat")
+
+    def __init__(self, pattern: re.Pattern, stat: list):
+        self._pattern = pattern
+        self._stat = stat
+
+    def _timed(self, method, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            self._stat[0] += 1
+            self._stat[1] += time.perf_counter() - start
+
+    def _timed_iter(self, iterator):
+        # finditer does its work while being consumed, so time each step
+        stat = self._stat
+        stat[0] += 1
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                stat[1] += time.perf_counter() - start
+                return
+            stat[1] += time.perf_counter() - start
+            yield item
+
+    def match(self, *args, **kwargs):
+        return self._timed(self._pattern.match, *args, **kwargs)
+
+    def fullmatch(self, *args, **kwargs):
+        return self._timed(self._pattern.fullmatch, *args, **kwargs)
+
+    def search(self, *args, **kwargs):
+        return self._timed(self._pattern.search, *args, **kwargs)
+
+    def sub(self, *args, **kwargs):
+        return self._timed(self._pattern.sub, *args, **kwargs)
+
+    def subn(self, *args, **kwargs):
+        return self._timed(self._pattern.subn, *args, **kwargs)
+
+    def split(self, *args, **kwargs):
+        return self._timed(self._pattern.split, *args, **kwargs)
+
+    def findall(self, *args, **kwargs):
+        return self._timed(self._pattern.findall, *args, **kwargs)
+
+    def finditer(self, *args, **kwargs):
+        return self._timed_iter(self._pattern.finditer(*args, **kwargs))
+
+    def __getattr__(self, name):
+        return getattr(self._pattern, name)
+
+
+class PatternRegistry:
+    """Named, precompiled regular expressions with optional call statistics."""
+
+    def __init__(self):
+        self._compiled: Dict[str, re.Pattern] = {}
+        self._stats: Dict[str, list] = {}
+        self._counting = False
+
+    def add(self, name: str, pattern: str, flags: int = 0) -> re.Pattern:
+        """Compile and register a pattern."""
+        if name in self._compiled:
+            raise ValueError(f"Pattern '{name}' is already registered")
+        compiled = re.compile(pattern, flags)
+        self._compiled[name] = compiled
+        self._stats[name] = [0, 0.0]
+        setattr(self, name, _CountingPattern(compiled, self._stats[name]) if self._counting else compiled)
+        return compiled
+
+    def get(self, name: str) -> re.Pattern:
+        """Return the plain compiled pattern registered under name."""
+        return self._compiled[name]
+
+    def names(self) -> List[str]:
+        return list(self._compiled)
+
+    def enable_stats(self):
+        """Start counting calls and time for every registered pattern."""
+        self._counting = True
+        for name, compiled in self._compiled.items():
+            setattr(self, name, _CountingPattern(compiled, self._stats[name]))
+
+    def disable_stats(self):
+        """Stop counting; patterns are served without any wrapper again."""
+        self._counting = False
+        for name, compiled in self._compiled.items():
+            setattr(self, name, compiled)
+
+    def reset_stats(self):
+        for stat in self._stats.values():
+            stat[0] = 0
+            stat[1] = 0.0
+
+    def stats(self) -> List[Tuple[str, int, float]]:
+        """Return (name, calls, seconds) for every pattern that was called, slowest first."""
+        rows = [(name, calls, seconds) for name, (calls, seconds) in self._stats.items() if calls]
+        rows.sort(key=lambda row: row[2], reverse=True)
+        return rows
+
+    def report(self) -> str:
+        """Format the call statistics as a table."""
+        rows = self.stats()
+        if not rows:
+            return "No pattern calls recorded"
+        width = max(len(name) for name, _, _ in rows)
+        lines = [f"{'Pattern':<{width}}  {'Calls':>10}  {'Total ms':>10}  {'us/call':>8}"]
+        for name, calls, seconds in rows:
+            lines.append(f"{name:<{width}}  {calls:>10,}  {seconds * 1000:>10.2f}  {seconds / calls * 1e6:>8.2f}")
+        return '\n'.join(lines)
+
+
+PATTERNS = PatternRegistry()
+_add = PATTERNS.add
+
+
+# ============================================================================
+# Shared text cleaning
+# ============================================================================
+
+_add("whitespace", r'\s+')
+_add("page_marker", r'Constitution of Kenya, 2010\s*\d*')
+_add("page_marker_loose", r'Constitution of Kenya,?\s*2010\s*\d*', re.IGNORECASE)
+_add("dash", r'[—–-]')
+
+
+# ============================================================================
+# Line tokenizer (parser/tokenizer.py)
+# ============================================================================
+
+# One alternation per line: the name of the last group that matched tells the
+# tokenizer which kind of line it is.
+_add("token_line",
+     r'^\s*(?:'
+     r'(?i:CHAPTER\s+(?P<chapter>ONE|TWO|THREE|FOUR|FIVE|SIX|SEVEN|EIGHT|NINE|TEN|ELEVEN|TWELVE'
+     r'|THIRTEEN|FOURTEEN|FIFTEEN|SIXTEEN|SEVENTEEN|EIGHTEEN)\s*[-–—]\s*(?P<chapter_title>[A-Z][A-Z\s,]+?))'
+     r'|(?i:PART\s+(?P<part>\d+)\s*[-–—]\s*(?P<part_title>[A-Z][A-Z\s,]*?))'
+     r'|(?i:(?P<schedules>SCHEDULES)(?:\s+(?P<first_schedule>FIRST\s+SCHEDULE)\b.*?)?)'
+     r'|(?i:(?P<preamble>PREAMBLE))'
+     r'|(?P<article>\d+)\.\s+(?:\((?P<article_clause>\d+)\)\s*)?(?P<article_text>.*?)'
+     r'|\((?P<clause>\d+)\)\s*(?P<clause_text>.*?)'
+     r'|\((?P<sub>[a-z])\)\s*(?P<sub_text>.*?)'
+     r'|\((?P<mini>[ivxlc]+)\)\s*(?P<mini_text>.*?)'
+     r'|(?P<title>[A-Z][^.]*)\.'
+     r')\s*$')
+_add("token_first_schedule", r'^\s*FIRST\s+SCHEDULE\b', re.IGNORECASE)
+_add("token_page_number", r'^\s*\d+\s*$')
+
+
+# ============================================================================
+# Schedules (parser/parse_constitution.py)
+# ============================================================================
+
+_add("schedules_start", r'SCHEDULES\s+FIRST\s+SCHEDULE', re.IGNORECASE)
+for _word in ("FIRST", "SECOND", "THIRD", "FOURTH", "FIFTH", "SIXTH"):
+    _add(f"{_word.lower()}_schedule", rf'{_word}\s+SCHEDULE', re.IGNORECASE)
+
+_add("county", r'(\d+)\.\s*([A-Za-z\s\'/\-]+?)(?=\r?\n|\d+\.)')
+_add("symbol_section", r'\(([a-d])\)\s*(THE\s+[A-Z\s]+)', re.IGNORECASE)
+_add("oath_title", r'(OATH\s+(?:OR\s+SOLEMN\s+AFFIRMATION\s+)?(?:OF\s+)?[A-Z\s/]+?)(?=\r?\n\s*I,)', re.IGNORECASE)
+_add("national_functions_part",
+     r'PART\s+1\s*[-–—]\s*NATIONAL\s+GOVERNMENT(.*?)(?=PART\s+2)', re.DOTALL | re.IGNORECASE)
+_add("national_function", r'(\d+)\.\s*([^0-9\n]+?)(?=\r?\n\s*\d+\.|\r?\nPART|\Z)')
+_add("county_functions_part",
+     r'PART\s+2\s*[-–—]\s*COUNTY\s+GOVERNMENTS(.*?)(?=FIFTH\s+SCHEDULE|\Z)', re.DOTALL | re.IGNORECASE)
+_add("county_function", r'(\d+)\.\s*([^0-9\n]+?)(?=\r?\n\s*\d+\.|\r?\n\d+\s+Constitution|\Z)')
+_add("legislation_chapter", r'(CHAPTER\s+[A-Z]+\s*[-–—]\s*[A-Z\s]+)', re.IGNORECASE)
+_add("legislation_article", r'(.+?)\s*\(Article\s+(\d+(?:\s*\([^)]+\))?)\)', re.IGNORECASE)
+_add("legislation_not_time", r'Constitution of Kenya|CHAPTER|Article', re.IGNORECASE)
+_add("legislation_time", r'(One|Two|Three|Four|Five|Six|18|[0-9]+)\s*(year|month)', re.IGNORECASE)
+_add("transitional_part", r'PART\s+(\d+)\s*[-–—]\s*([A-Z\s]+?)(?=\r?\n)', re.IGNORECASE)
+_add("transitional_section", r'(\d+)\.\s+(?:\(1\)\s*)?(.+?)(?=\r?\n\s*\d+\.|\Z)', re.DOTALL)
+
+
+# ============================================================================
+# App asset parser (parser/build_app_assets.py, parser/app_schedules.py)
+# ============================================================================
+
+_add("mini_clause_split", r'\(([ivxlc]+)\)', re.IGNORECASE)
+_add("subclause_line", r'^\(([a-z])\)\s*(.*)$')
+_add("subclause_bare_line", r'^([a-z])\s+(.+)$')
+_add("subclause_prefix", r'^[\(]?[a-z][\)]?\s')
+_add("article_clause_line", r'^\d+\.\s*\((\d+)\)\s*(.*)$')
+_add("clause_line", r'^\((\d+)\)\s*(.*)$')
+_add("heading_title", r'^([A-Z][^.]+(?:\s+[a-z][^.]*)*)\.$')
+_add("preamble_start", r'We,\s+the\s+people\s+of\s+Kenya', re.IGNORECASE)
+_add("chapter_one", r'CHAPTER\s+ONE', re.IGNORECASE)
+_add("chapter_heading",
+     r'CHAPTER\s+(ONE|TWO|THREE|FOUR|FIVE|SIX|SEVEN|EIGHT|NINE|TEN|ELEVEN|TWELVE|THIRTEEN|FOURTEEN'
+     r'|FIFTEEN|SIXTEEN|SEVENTEEN|EIGHTEEN)[—\-–]([^\n]+)', re.IGNORECASE)
+_add("schedules_section", r'SCHEDULES?\s+FIRST\s+SCHEDULE', re.IGNORECASE)
+_add("part_heading", r'PART\s+(\d+)[—\-–]([^\n]+)', re.IGNORECASE)
+_add("function_line", r'^(\d+)\.\s*(.+)$')
+_add("subfunction_line", r'^\(([a-z])\)\s*(.+)$')
+_add("legislation_row", r'^(.+?)\s*\(Article\s*(\d+(?:\s*\([^)]+\))?)\)\s*$', re.IGNORECASE)
+_add("subsidiary_legislation", r'SUBSIDIARY LEGISLATION', re.IGNORECASE)
+for _word in ("FIRST", "SECOND", "THIRD", "FOURTH", "FIFTH", "SIXTH"):
+    _add(f"{_word.lower()}_schedule_header", rf'{_word} SCHEDULE\s*[\t\n\r]+\s*\(Article', re.IGNORECASE)
+    _add(f"{_word.lower()}_schedule_header_inline", rf'{_word} SCHEDULE\s+\(Article', re.IGNORECASE)
+
+
+# ============================================================================
+# Article lookup index (parser/article_index.py)
+# ============================================================================
+
+_add("index_reference_prefix", r'^(?:articles?|art)\.?', re.IGNORECASE)
+
+
+# ============================================================================
+# Search index (parser/normalize.py, parser/search_index.py)
+# ============================================================================
+
+# Letters and digits; punctuation, dashes and apostrophes separate words
+_add("search_token", r'[^\W_]+')
+_add("search_phrase", r'"([^"]*)"|(\S+)')
+
+
+# ============================================================================
+# Cross-references (parser/citations.py)
+# ============================================================================
+
+_CITATION_SEPARATOR = r'\s*(?:,\s*(?:and|or)\b|,|and\b|or\b|to\b)\s*'
+_CITED_ARTICLE = r'(?:\d+|\(\d+\))(?:\s*\([0-9a-z]+\))*'
+_CITED_CLAUSE = r'\(\d+\)(?:\s*\([a-z]+\))*'
+
+# "Article 6 (1)", "Articles 185(2), 186(1) and 187(2)", "Articles 260 to 262"
+_add("citation_articles", rf'\bArticle(?P<plural>s)?\s+(?P<items>{_CITED_ARTICLE}(?:{_CITATION_SEPARATOR}{_CITED_ARTICLE})*)')
+# "clause (2)", "clauses (1) and (3)": clauses of the citing article
+_add("citation_clauses", rf'\bclauses?\s+(?P<items>{_CITED_CLAUSE}(?:{_CITATION_SEPARATOR}{_CITED_CLAUSE})*)')
+# "11 (3)": a bare article reference, as in the Fifth Schedule
+_add("citation_bare", rf'^\s*({_CITED_ARTICLE})\s*$')
+_add("citation_item", r'(\d+)|\(([0-9a-z]+)\)|(,|\band\b|\bor\b|\bto\b)')
@@ -0,0 +1,143 @@
+"""
+cProfile and tracemalloc modes for the parser command lines.
+
+    result, stats = profile_call("parse.pstats", parse_constitution, path)
+    print(profile_report(stats))
+
+    result, trace = trace_memory_call(parse_constitution, path)
+    print(memory_report(trace, allocations_by_function(trace.snapshot, globals())))
+
+profile_call() writes a pstats file that `python -m pstats`, snakeviz and
+similar tools can open. allocations_by_function() charges every memory
+block still allocated when the snapshot was taken to the innermost parser
+function or method on its allocation traceback, so the report reads in
+terms of parse_clauses or ConstitutionBuilder._close_sub rather than of
+list.append. Classes in the namespace contribute their methods; classes
+from the standard library are skipped.
+"""
+
+import cProfile
+import io
+import pstats
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Tuple, Union
+
+
+PathLike = Union[str, Path]
+
+# Frames kept per allocation; deep enough to reach the parser functions
+TRACE_FRAMES = 25
+
+OTHER = "<other>"
+
+
+def profile_call(stats_path: PathLike, function: Callable, *args, **kwargs) -> Tuple[Any, pstats.Stats]:
+    """Call function under cProfile and write the stats to stats_path."""
+    profiler = cProfile.Profile()
+    result = profiler.runcall(function, *args, **kwargs)
+    profiler.dump_stats(str(stats_path))
+    return result, pstats.Stats(profiler)
+
+
+def profile_report(stats: pstats.Stats, limit: int = 20, sort: str = "cumulative") -> str:
+    """The top functions of a profile as printed by pstats."""
+    stream = io.StringIO()
+    stats.stream = stream
+    stats.strip_dirs().sort_stats(sort).print_stats(limit)
+    return stream.getvalue().strip('\n')
+
+
+class MemoryTrace(NamedTuple):
+    snapshot: tracemalloc.Snapshot
+    peak_bytes: int
+
+
+def trace_memory_call(function: Callable, *args, **kwargs) -> Tuple[Any, MemoryTrace]:
+    """
+    Call function under tracemalloc. The snapshot is taken on return, while
+    the result is still referenced.
+    """
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start(TRACE_FRAMES)
+    tracemalloc.reset_peak()
+    try:
+        result = function(*args, **kwargs)
+        trace = MemoryTrace(tracemalloc.take_snapshot(), tracemalloc.get_traced_memory()[1])
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    return result, trace
+
+
+def _is_stdlib(cls: type) -> bool:
+    return cls.__module__.partition('.')[0] in sys.stdlib_module_names
+
+
+def _functions(namespace: Dict[str, Any]) -> Iterator[Tuple[str, Any]]:
+    """(name, value) of namespace, with the methods of its classes as Class.method."""
+    for name, value in namespace.items():
+        if isinstance(value, type):
+            if _is_stdlib(value):
+                continue
+            for method_name, method in vars(value).items():
+                if isinstance(method, (staticmethod, classmethod)):
+                    method = method.__func__
+                yield f"{name}.{method_name}", method
+        else:
+            yield name, value
+
+
+def _function_lines(namespace: Dict[str, Any]) -> Dict[str, List[Tuple[int, int, str]]]:
+    """filename -> (first line, last line, name) of every function and method in namespace."""
+    spans: Dict[str, List[Tuple[int, int, str]]] = {}
+    for name, value in _functions(namespace):
+        function = getattr(value, "function", value)       # unwrap @memoized
+        function = getattr(function, "__wrapped__", function)
+        code = getattr(function, "__code__", None)
+        if code is None:
+            continue
+        lines = [line for _, _, line in code.co_lines() if line is not None]
+        spans.setdefault(code.co_filename, []).append(
+            (code.co_firstlineno, max(lines, default=code.co_firstlineno), name))
+    return spans
+
+
+def allocations_by_function(snapshot: tracemalloc.Snapshot, namespace: Dict[str, Any]) -> List[Tuple[str, int, int]]:
+    """
+    (function, blocks, bytes) of the live allocations in snapshot, charged
+    to the innermost function of namespace on each traceback, largest first.
+    Allocations made outside those functions are grouped as "<other>".
+    """
+    spans = _function_lines(namespace)
+    totals: Dict[str, List[int]] = {}
+    for trace in snapshot.traces:
+        owner = OTHER
+        for frame in reversed(trace.traceback):      # innermost frame last
+            for first, last, name in spans.get(frame.filename, ()):
+                if first <= frame.lineno <= last:
+                    owner = name
+                    break
+            if owner != OTHER:
+                break
+        total = totals.setdefault(owner, [0, 0])
+        total[0] += 1
+        total[1] += trace.size
+    rows = [(name, blocks, size) for name, (blocks, size) in totals.items()]
+    rows.sort(key=lambda row: row[2], reverse=True)
+    return rows
+
+
+def memory_report(trace: MemoryTrace, rows: List[Tuple[str, int, int]], limit: int = 10) -> str:
+    """Format the top rows of allocations_by_function() as a table."""
+    total = sum(size for _, _, size in rows)
+    width = max([len(name) for name, _, _ in rows[:limit]] + [8])
+    lines = [f"Peak traced memory: {trace.peak_bytes / 2 ** 20:,.1f} MiB; "
+             f"live at return: {total / 2 ** 20:,.1f} MiB",
+             f"{'Function':<{width}}  {'Blocks':>10}  {'KiB':>10}  {'Share':>6}"]
+    for name, blocks, size in rows[:limit]:
+        share = f"{size / total:.1%}" if total else "-"
+        lines.append(f"{name:<{width}}  {blocks:>10,}  {size / 1024:>10,.1f}  {share:>6}")
+    return '\n'.join(lines)
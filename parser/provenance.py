@@ -0,0 +1,77 @@
+"""
+Source offsets for parsed nodes.
+
+With --provenance, every chapter, part, article, clause, sub-clause and
+mini-clause carries "span": [start, end], the UTF-8 byte offsets of the
+source lines it was parsed from. start is the beginning of its first line
+(an article's title line, if it has one), end the end of its last non-blank
+line, excluding the line break. Page headers and blank lines between nodes
+belong to no node.
+
+    spans    - spans are added and the text is kept
+    offsets  - spans are added and the "text" of clauses, sub-clauses and
+               mini-clauses is dropped; read it from the source instead:
+
+    with SourceText("The_Constitution_of_Kenya_2010.txt") as source:
+        text = source.text(clause["span"])
+
+Offsets are only exact when the lines keep their line endings, so the
+source is read with newline='' in this mode.
+"""
+
+import mmap
+from pathlib import Path
+from typing import Iterable, Iterator, List, Sequence, Tuple, Union
+
+
+SPANS = "spans"
+OFFSETS = "offsets"
+PROVENANCE_MODES = (SPANS, OFFSETS)
+
+PathLike = Union[str, Path]
+
+
+def _utf8_length(text: str) -> int:
+    return len(text) if text.isascii() else len(text.encode('utf-8'))
+
+
+class LineOffsets:
+    """Byte offsets of every line passed through track()."""
+
+    def __init__(self):
+        self._starts: List[int] = []
+        self._ends: List[int] = []
+        self._position = 0
+
+    def track(self, lines: Iterable[str]) -> Iterator[str]:
+        """Yield lines unchanged, recording where each starts and ends."""
+        for line in lines:
+            self._starts.append(self._position)
+            self._ends.append(self._position + _utf8_length(line.rstrip('\r\n')))
+            self._position += _utf8_length(line)
+            yield line
+
+    def span(self, line_no: int) -> Tuple[int, int]:
+        """(start, end) of a 1-based line, without its line break."""
+        return self._starts[line_no - 1], self._ends[line_no - 1]
+
+
+class SourceText:
+    """Memory-mapped source text; spans are decoded on request."""
+
+    def __init__(self, path: PathLike):
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def text(self, span: Sequence[int]) -> str:
+        start, end = span
+        return self._map[start:end].decode('utf-8')
+
+    def close(self):
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
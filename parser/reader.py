@@ -0,0 +1,203 @@
+"""
+Random-access readers for parser outputs.
+
+open_constitution() opens either output form and decodes only what is
+asked for:
+
+    binary  - a memory-mapped .bin file (see binary_format.py); lookups walk
+              the node records in place and decode just the matching subtree
+    sharded - a --shards directory (see shards.py); the manifest picks the
+              shard, and the byte range of an article within it, to decode
+              from a memory map
+
+    with open_constitution("constitution_of_kenya.bin") as constitution:
+        article = constitution.get_article(27)
+        for article_number, clause in constitution.iter_clauses(4):
+            ...
+        schedule = constitution.get_schedule(1)
+"""
+
+import json
+import mmap
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from binary_format import INT, BinaryReader
+from shards import MANIFEST_NAME
+
+
+PathLike = Union[str, Path]
+
+
+def _map_file(path: PathLike) -> mmap.mmap:
+    with open(path, 'rb') as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class ConstitutionReader(ABC):
+    """Lazy accessors shared by both output forms."""
+
+    @abstractmethod
+    def get_article(self, number: int) -> Optional[dict]:
+        """The article with this number, or None."""
+
+    @abstractmethod
+    def iter_clauses(self, chapter: int) -> Iterator[Tuple[int, dict]]:
+        """(article number, clause) for every clause of a chapter, in order."""
+
+    @abstractmethod
+    def get_schedule(self, number: int) -> Optional[dict]:
+        """The schedule with this number, or None."""
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class BinaryConstitutionReader(ConstitutionReader):
+    """Reader over a memory-mapped .bin file."""
+
+    def __init__(self, path: PathLike):
+        self._map = _map_file(path)
+        self.binary = BinaryReader(memoryview(self._map))
+        self._articles: Optional[Dict[int, int]] = None
+
+    def close(self):
+        if self._map is not None:
+            self.binary.data.release()
+            self._map.close()
+            self._map = None
+
+    def _number(self, node: int) -> Optional[int]:
+        number = self.binary.member(node, "number")
+        if number is None or self.binary.kind(number) != INT:
+            return None
+        return self.binary.record(number)[3]
+
+    def _list(self, node: Optional[int], key: str) -> range:
+        child = self.binary.member(node, key) if node is not None else None
+        return self.binary.children(child) if child is not None else range(0)
+
+    def _chapter_articles(self, chapter: int) -> List[int]:
+        articles = list(self._list(chapter, "articles"))
+        for part in self._list(chapter, "parts"):
+            articles.extend(self._list(part, "articles"))
+        return articles
+
+    def _find(self, key: str, number: int) -> Optional[int]:
+        for node in self._list(self.binary.root, key):
+            if self._number(node) == number:
+                return node
+        return None
+
+    def get_article(self, number: int) -> Optional[dict]:
+        if self._articles is None:
+            # Article number -> record, built from the records alone
+            self._articles = {}
+            for chapter in self._list(self.binary.root, "chapters"):
+                for article in self._chapter_articles(chapter):
+                    self._articles.setdefault(self._number(article), article)
+        node = self._articles.get(number)
+        return self.binary.value(node) if node is not None else None
+
+    def iter_clauses(self, chapter: int) -> Iterator[Tuple[int, dict]]:
+        node = self._find("chapters", chapter)
+        if node is None:
+            return
+        for article in self._chapter_articles(node):
+            number = self._number(article)
+            for clause in self._list(article, "clauses"):
+                yield number, self.binary.value(clause)
+
+    def get_schedule(self, number: int) -> Optional[dict]:
+        node = self._find("schedules", number)
+        return self.binary.value(node) if node is not None else None
+
+
+class ShardedConstitutionReader(ConstitutionReader):
+    """
+    Reader over a directory written with --shards. Shards are memory-mapped
+    when first used; an article is decoded from its byte range in the
+    chapter shard, as listed in the manifest, without the rest of the
+    chapter.
+    """
+
+    def __init__(self, directory: PathLike):
+        self.directory = Path(directory)
+        with open(self.directory / MANIFEST_NAME, 'r', encoding='utf-8') as f:
+            self.manifest = json.load(f)
+        self._maps: Dict[str, mmap.mmap] = {}
+
+    def close(self):
+        for shard in self._maps.values():
+            shard.close()
+        self._maps = {}
+
+    def _decode(self, name: str, offset: int = 0, length: Optional[int] = None):
+        """Decode a shard, or the bytes [offset, offset + length) of it."""
+        if name not in self._maps:
+            self._maps[name] = _map_file(self.directory / name)
+        shard = self._maps[name]
+        end = len(shard) if length is None else offset + length
+        return json.loads(shard[offset:end])
+
+    @staticmethod
+    def _articles(chapter: dict) -> Iterator[dict]:
+        yield from chapter.get("articles", [])
+        for part in chapter.get("parts", []):
+            yield from part.get("articles", [])
+
+    def _chapter_articles(self, entry: dict) -> Iterator[dict]:
+        offsets = entry.get("articleOffsets")
+        if offsets is None:
+            # Version 1 manifest: the whole chapter has to be decoded
+            yield from self._articles(self._decode(entry["file"]))
+            return
+        for _, offset, length in offsets:
+            yield self._decode(entry["file"], offset, length)
+
+    def get_article(self, number: int) -> Optional[dict]:
+        for entry in self.manifest["chapters"]:
+            articles = entry["articles"]
+            if articles["first"] is None or not articles["first"] <= number <= articles["last"]:
+                continue
+            offsets = entry.get("articleOffsets")
+            if offsets is None:
+                for article in self._chapter_articles(entry):
+                    if article.get("number") == number:
+                        return article
+                continue
+            for article_number, offset, length in offsets:
+                if article_number == number:
+                    return self._decode(entry["file"], offset, length)
+        return None
+
+    def iter_clauses(self, chapter: int) -> Iterator[Tuple[int, dict]]:
+        for entry in self.manifest["chapters"]:
+            if entry["number"] == chapter:
+                for article in self._chapter_articles(entry):
+                    for clause in article.get("clauses", []):
+                        yield article.get("number"), clause
+                return
+
+    def get_schedule(self, number: int) -> Optional[dict]:
+        for entry in self.manifest["schedules"]:
+            if entry["number"] == number:
+                return self._decode(entry["file"])
+        return None
+
+
+def open_constitution(path: PathLike) -> ConstitutionReader:
+    """Open a .bin file, or a shard directory or its manifest.json."""
+    path = Path(path)
+    if path.is_dir():
+        return ShardedConstitutionReader(path)
+    if path.name == MANIFEST_NAME:
+        return ShardedConstitutionReader(path.parent)
+    return BinaryConstitutionReader(path)
@@ -0,0 +1,169 @@
+"""
+Inverted full-text index over the articles, clauses and sub-clauses.
+
+Every article title and clause, sub-clause and mini-clause text is split
+with normalize.search_tokens() and recorded per token with its positions,
+so keyword and phrase queries are answered from postings lists instead of
+by scanning the text.
+
+Index layout (JSON):
+
+    {
+      "version": 1,
+      "docs": [[chapter number, reference key], ...],
+      "postings": {
+        "token": [doc, count, position gap, position gap, ..., doc gap, count, ...]
+      }
+    }
+
+A document is one node addressed by its reference key ("27", "27(4)",
+"27(4)(b)", see article_index.py); an article's document holds its title
+and any text-only clause. Each postings list is flat: for each document
+that contains the token, the gap from the previous document id, the
+number of positions, then the positions as gaps from the previous one.
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple, Union
+
+from article_index import iter_references
+from normalize import search_tokens
+from patterns import PATTERNS
+
+
+SEARCH_INDEX_VERSION = 1
+
+PathLike = Union[str, Path]
+
+
+def search_path_for(output_path: PathLike) -> Path:
+    """Default search index location: constitution.json -> constitution.search.json."""
+    output_path = Path(output_path)
+    return output_path.with_name(output_path.stem + ".search.json")
+
+
+class SearchIndexBuilder:
+    """Build the postings lists from parsed chapters."""
+
+    def __init__(self):
+        self.docs: List[list] = []
+        self._doc_ids: Dict[Tuple[int, str], int] = {}
+        self._lengths: List[int] = []
+        self._postings: Dict[str, Dict[int, List[int]]] = {}
+
+    def add_text(self, chapter_number: int, key: str, text: str):
+        """Index text as (the continuation of) the document for key."""
+        doc = self._doc_ids.get((chapter_number, key))
+        if doc is None:
+            doc = self._doc_ids[(chapter_number, key)] = len(self.docs)
+            self.docs.append([chapter_number, key])
+            self._lengths.append(0)
+
+        tokens = search_tokens(text)
+        start = self._lengths[doc]
+        for offset, token in enumerate(tokens):
+            self._postings.setdefault(token, {}).setdefault(doc, []).append(start + offset)
+        # Leave a gap so a phrase never matches across two separate texts
+        self._lengths[doc] = start + len(tokens) + 1
+
+    def add_chapter(self, chapter: dict):
+        number = chapter.get("number")
+        for key, _, node in iter_references(chapter):
+            text = node.get("title") if "clauses" in node else node.get("text")
+            if text:
+                self.add_text(number, key, text)
+
+    def build(self) -> dict:
+        postings = {}
+        for token in sorted(self._postings):
+            encoded = []
+            previous_doc = 0
+            for doc, positions in self._postings[token].items():
+                encoded.extend((doc - previous_doc, len(positions)))
+                previous_doc = doc
+                previous = 0
+                for position in positions:
+                    encoded.append(position - previous)
+                    previous = position
+            postings[token] = encoded
+        return {
+            "version": SEARCH_INDEX_VERSION,
+            "docs": self.docs,
+            "postings": postings
+        }
+
+    def write(self, index_path: PathLike):
+        with open(index_path, 'w', encoding='utf-8') as f:
+            json.dump(self.build(), f, separators=(',', ':'), ensure_ascii=False)
+
+
+def decode_postings(encoded: List[int]) -> Dict[int, List[int]]:
+    """Expand a flat postings list to {doc: [positions]}."""
+    postings = {}
+    doc = 0
+    i = 0
+    while i < len(encoded):
+        doc += encoded[i]
+        count = encoded[i + 1]
+        positions = []
+        position = 0
+        for gap in encoded[i + 2:i + 2 + count]:
+            position += gap
+            positions.append(position)
+        postings[doc] = positions
+        i += 2 + count
+    return postings
+
+
+class SearchIndex:
+    """Answer keyword and phrase queries from a search index file."""
+
+    def __init__(self, index_path: PathLike):
+        with open(index_path, 'r', encoding='utf-8') as f:
+            self.index = json.load(f)
+        if self.index.get("version") != SEARCH_INDEX_VERSION:
+            raise ValueError(f"Unsupported search index version: {self.index.get('version')}")
+        self.docs = self.index["docs"]
+        self._decoded: Dict[str, Dict[int, List[int]]] = {}
+
+    def postings(self, token: str) -> Dict[int, List[int]]:
+        """{doc: [positions]} for one normalized token."""
+        if token not in self._decoded:
+            self._decoded[token] = decode_postings(self.index["postings"].get(token, []))
+        return self._decoded[token]
+
+    def phrase(self, text: str) -> Dict[int, List[int]]:
+        """{doc: [start positions]} where the words of text occur consecutively."""
+        tokens = search_tokens(text)
+        if not tokens:
+            return {}
+        matches = {doc: list(positions) for doc, positions in self.postings(tokens[0]).items()}
+        for offset, token in enumerate(tokens[1:], 1):
+            following = self.postings(token)
+            for doc in list(matches):
+                positions = set(following.get(doc, ()))
+                matches[doc] = [start for start in matches[doc] if start + offset in positions]
+                if not matches[doc]:
+                    del matches[doc]
+        return matches
+
+    def search(self, query: str) -> List[Tuple[int, str]]:
+        """
+        (chapter number, reference key) of every document matching all terms
+        of query, in document order. Quoted terms are matched as phrases:
+            freedom "of expression"
+        """
+        docs = None
+        for match in PATTERNS.search_phrase.finditer(query):
+            found = set(self.phrase(match.group(1) if match.group(1) is not None else match.group(2)))
+            docs = found if docs is None else docs & found
+        return [tuple(self.docs[doc]) for doc in sorted(docs or ())]
+
+
+def build_search_index(chapters: Iterable[dict], index_path: PathLike):
+    """Index every chapter and write the result to index_path."""
+    builder = SearchIndexBuilder()
+    for chapter in chapters:
+        builder.add_chapter(chapter)
+    builder.write(index_path)
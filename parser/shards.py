@@ -0,0 +1,118 @@
+"""
+Sharded output: one JSON file per chapter and per schedule.
+
+A reader opens manifest.json to render the table of contents, then loads
+only the shards it displays. Layout of the output directory:
+
+    manifest.json
+    preamble.json
+    chapter-01.json ... chapter-18.json
+    schedule-1.json ... schedule-6.json
+
+The manifest lists every shard with its file name, size and SHA-256, and
+for chapters the title, the parts, the range of article numbers and where
+each article is in the chapter shard, so a reader can decode one article
+without the rest of its chapter:
+
+    {
+      "version": 2,
+      "metadata": {...},                    (when given)
+      "preamble": {"file": "preamble.json", "bytes": ..., "sha256": "..."},
+      "chapters": [
+        {"number": 4, "title": "THE BILL OF RIGHTS", "file": "chapter-04.json",
+         "bytes": ..., "sha256": "...", "parts": [{"number": 1, "title": "..."}],
+         "articles": {"count": 41, "first": 19, "last": 59},
+         "articleOffsets": [[19, offset, length], ...]}
+      ],
+      "schedules": [
+        {"number": 1, "title": "COUNTIES", "file": "schedule-1.json", "bytes": ..., "sha256": "..."}
+      ]
+    }
+
+Article offsets and lengths are in bytes from the start of the shard, in
+document order. Version 1 manifests have no "articleOffsets".
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+from article_index import iter_articles
+from json_writer import encode_with_spans
+
+
+SHARDS_VERSION = 2
+MANIFEST_NAME = "manifest.json"
+
+PathLike = Union[str, Path]
+
+
+def _article_range(chapter: dict) -> dict:
+    numbers = [article["number"] for _, article in iter_articles(chapter)
+               if isinstance(article.get("number"), int)]
+    return {
+        "count": len(numbers),
+        "first": min(numbers) if numbers else None,
+        "last": max(numbers) if numbers else None
+    }
+
+
+class ShardWriter:
+    """
+    Write top-level nodes to their own files as they arrive. A second
+    preamble, or a chapter or schedule whose number was already written,
+    raises ValueError rather than overwrite the earlier shard.
+    """
+
+    def __init__(self, directory: PathLike, pretty: bool = False, metadata: Optional[dict] = None):
+        self.directory = Path(directory)
+        self.pretty = pretty
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.manifest: Dict[str, Any] = {"version": SHARDS_VERSION}
+        if metadata is not None:
+            self.manifest["metadata"] = metadata
+        self.manifest.update({"preamble": None, "chapters": [], "schedules": []})
+        self._written: Dict[str, str] = {}     # file name -> what was written to it
+
+    def _write_shard(self, name: str, node: Any, description: str) -> Tuple[dict, dict]:
+        """Write a shard; returns its manifest entry and the spans of its objects."""
+        if name in self._written:
+            raise ValueError(f"Duplicate {description}: {name} was already written for {self._written[name]}")
+        self._written[name] = description
+        data, spans = encode_with_spans(node, self.pretty)
+        with open(self.directory / name, 'wb') as f:
+            f.write(data)
+        return {"file": name, "bytes": len(data), "sha256": hashlib.sha256(data).hexdigest()}, spans
+
+    def add(self, kind: str, node: Any):
+        """Write a ("preamble" | "chapter" | "schedule", node) pair."""
+        if kind == "preamble":
+            self.manifest["preamble"], _ = self._write_shard("preamble.json", node, "preamble")
+        elif kind == "chapter":
+            entry = {"number": node["number"], "title": node["title"]}
+            shard, spans = self._write_shard(f"chapter-{node['number']:02d}.json", node,
+                                             f"chapter {node['number']}")
+            entry.update(shard)
+            entry["parts"] = [{"number": part["number"], "title": part["title"]}
+                              for part in node.get("parts", [])]
+            entry["articles"] = _article_range(node)
+            entry["articleOffsets"] = [[article.get("number"), *spans[path]]
+                                       for path, article in iter_articles(node)]
+            self.manifest["chapters"].append(entry)
+        elif kind == "schedule":
+            entry = {"number": node["number"], "title": node["title"]}
+            shard, _ = self._write_shard(f"schedule-{node['number']}.json", node, f"schedule {node['number']}")
+            entry.update(shard)
+            self.manifest["schedules"].append(entry)
+        else:
+            raise ValueError(f"Unknown shard kind: {kind}")
+
+    def close(self) -> dict:
+        """Write the manifest and return it."""
+        with open(self.directory / MANIFEST_NAME, 'w', encoding='utf-8') as f:
+            if self.pretty:
+                json.dump(self.manifest, f, ensure_ascii=False, indent=2)
+            else:
+                json.dump(self.manifest, f, ensure_ascii=False, separators=(',', ':'))
+        return self.manifest
@@ -0,0 +1,150 @@
+"""
+Shared strings in parser outputs.
+
+Equal strings in a parse are one object. Labels, numerals and titles, a
+small and bounded set, are interned with sys.intern(), so the "a" of every
+sub-clause is shared by all parses in the process. Texts and schedule
+strings, which are unbounded, go through a StringPool that lives as long
+as one parse: a Fifth Schedule chapter name is stored once for all its
+rows, and the pool is released with the tree. (Interned strings are
+immortal from Python 3.12, so interning texts would never free them.)
+
+With --dedup-strings, strings repeated in the output are written once, in
+a "strings" table after the metadata, and every occurrence refers to its
+table entry:
+
+    {
+      "metadata": {...},
+      "strings": ["CHAPTER FOUR-THE BILL OF RIGHTS", ...],
+      "preamble": {...},
+      "chapters": [...],
+      "schedules": [{..., "chapter": {"$": 0}, ...}]
+    }
+
+Only strings of at least MIN_SHARED_LENGTH characters are shared; shorter
+ones take less space inline than as a reference. load_document() reads
+either form, sharing equal strings the same way.
+"""
+
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+
+STRINGS_KEY = "strings"
+REF_KEY = "$"
+
+MIN_SHARED_LENGTH = 12
+
+# Keys whose string values are interned process-wide when loading
+INTERNED_KEYS = frozenset(("label", "numeral", "title"))
+
+PathLike = Union[str, Path]
+
+
+class StringPool:
+    """One object per distinct string, for as long as the pool is referenced."""
+
+    __slots__ = ("_strings",)
+
+    def __init__(self):
+        self._strings: Dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    def share(self, text: str) -> str:
+        """The pooled string equal to text."""
+        return self._strings.setdefault(text, text)
+
+    def share_all(self, value: Any) -> Any:
+        """Pool every string in a JSON-like value; lists and dicts are updated in place."""
+        if isinstance(value, str):
+            return self._strings.setdefault(value, value)
+        if isinstance(value, dict):
+            for key, item in value.items():
+                value[key] = self.share_all(item)
+        elif isinstance(value, list):
+            for i, item in enumerate(value):
+                value[i] = self.share_all(item)
+        return value
+
+
+class StringTable:
+    """Strings repeated across JSON-like values, numbered in order of first occurrence."""
+
+    def __init__(self, min_length: int = MIN_SHARED_LENGTH):
+        self.min_length = min_length
+        self._counts: Dict[str, int] = {}
+        self.strings: List[str] = []
+        self._index: Dict[str, int] = {}
+
+    def count(self, value: Any):
+        """Count the strings of value; call for every value before encode()."""
+        if isinstance(value, str):
+            if len(value) >= self.min_length:
+                self._counts[value] = self._counts.get(value, 0) + 1
+        elif isinstance(value, dict):
+            for item in value.values():
+                self.count(item)
+        elif isinstance(value, list):
+            for item in value:
+                self.count(item)
+
+    def build(self) -> List[str]:
+        """Number the strings counted more than once."""
+        self.strings = [text for text, count in self._counts.items() if count > 1]
+        self._index = {text: i for i, text in enumerate(self.strings)}
+        self._counts = {}
+        return self.strings
+
+    def encode(self, value: Any) -> Any:
+        """A copy of value with every table string replaced by a reference."""
+        if isinstance(value, str):
+            index = self._index.get(value)
+            return value if index is None else {REF_KEY: index}
+        if isinstance(value, dict):
+            return {key: self.encode(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self.encode(item) for item in value]
+        return value
+
+
+def dedup_items(items: Iterable[tuple], min_length: int = MIN_SHARED_LENGTH) -> tuple:
+    """
+    Encode streamed (kind, node) pairs against one table of their repeated
+    strings. Every node is held in memory until the table is complete.
+    Returns (strings, encoded pairs).
+    """
+    items = list(items)
+    table = StringTable(min_length)
+    for _, node in items:
+        table.count(node)
+    strings = table.build()
+    return strings, [(kind, table.encode(node)) for kind, node in items]
+
+
+def expand(value: Any, strings: List[str], pool: StringPool, key: Optional[str] = None) -> Any:
+    """
+    Resolve the references in value. Strings under INTERNED_KEYS are
+    interned, all others shared through pool.
+    """
+    if isinstance(value, str):
+        return sys.intern(value) if key in INTERNED_KEYS else pool.share(value)
+    if isinstance(value, dict):
+        if len(value) == 1 and REF_KEY in value:
+            return strings[value[REF_KEY]]
+        return {name: expand(item, strings, pool, name) for name, item in value.items()}
+    if isinstance(value, list):
+        return [expand(item, strings, pool, key) for item in value]
+    return value
+
+
+def load_document(path: PathLike) -> dict:
+    """Load a parser output, resolving its string table if it has one."""
+    with open(path, 'r', encoding='utf-8') as f:
+        document = json.load(f)
+    pool = StringPool()
+    strings = [pool.share(text) for text in document.pop(STRINGS_KEY, [])]
+    return expand(document, strings, pool)
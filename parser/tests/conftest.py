@@ -0,0 +1,55 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# The parser modules are scripts in parser/, imported by their file names
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+SAMPLE_TEXT = """\
+THE CONSTITUTION OF KENYA, 2010
+PREAMBLE
+We, the people of Kenya-
+PROUD of our ethnic, cultural and religious diversity:
+CHAPTER ONE-SOVEREIGNTY OF THE PEOPLE AND SUPREMACY OF THIS CONSTITUTION
+Sovereignty of the people.
+1. (1) All sovereign power belongs to the people of Kenya.
+(2) The people may exercise their sovereign power-
+(a) directly; or
+(b) through their democratically elected representatives.
+Supremacy of this Constitution.
+2. (1) This Constitution is the supreme law of the Republic.
+(2) Any law that is inconsistent with this Constitution is void, subject to clauses (1) to (3)
+of Article 1.
+Constitution of Kenya, 2010
+3
+CHAPTER TWO-THE REPUBLIC
+Declaration of the Republic.
+4. (1) Kenya is a sovereign Republic.
+(2) The State shall-
+(a) promote-
+(i) the diversity of language; and
+(ii) the use of Braille.
+Territory of Kenya.
+5. Kenya consists of the territory specified in Article 4, 2 persons not withstanding.
+SCHEDULES
+FIRST SCHEDULE  (Article 6 (1))
+COUNTIES
+1. Mombasa
+2. Kwale
+SECOND SCHEDULE  (Article 9 (2))
+NATIONAL SYMBOLS
+(a) THE NATIONAL FLAG
+"""
+
+
+@pytest.fixture
+def sample_lines():
+    return SAMPLE_TEXT.split('\n')
+
+
+@pytest.fixture
+def sample_file(tmp_path):
+    path = tmp_path / "constitution.txt"
+    path.write_text(SAMPLE_TEXT, encoding="utf-8")
+    return path
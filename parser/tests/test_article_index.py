@@ -0,0 +1,49 @@
+import json
+
+import pytest
+
+from article_index import ArticleIndex, index_path_for, reference_key
+from build_app_assets import write_result
+from engine import parse_file
+
+
+@pytest.fixture
+def indexed(tmp_path, sample_file):
+    output = tmp_path / "constitution.json"
+    index = index_path_for(output)
+    result = parse_file(sample_file, "app")
+    write_result(result, output, index_file=index)
+    return result, output, ArticleIndex(index)
+
+
+def test_reference_keys():
+    assert reference_key("Article 27 (4) (b)") == "27(4)(b)"
+    assert reference_key("art. 27(4)(b)") == "27(4)(b)"
+
+
+def test_offsets_point_at_the_encoded_nodes(indexed):
+    result, output, index = indexed
+    data = output.read_bytes()
+    article = result["chapters"][1]["articles"][0]
+
+    _, offset, length = index.locate("Article 4")
+    assert json.loads(data[offset:offset + length]) == article
+    _, offset, length = index.locate("4(2)(a)(ii)")
+    assert json.loads(data[offset:offset + length]) == article["clauses"][1]["subClauses"][0]["miniClauses"][1]
+
+    chapter_number, offset, length = index.index["chapters"][0]
+    assert json.loads(data[offset:offset + length]) == result["chapters"][0]
+
+
+def test_get_decodes_only_the_referenced_node(indexed):
+    result, _, index = indexed
+    assert index.get("Article 1(2)(b)") == result["chapters"][0]["articles"][0]["clauses"][1]["subClauses"][1]
+    assert index.get("Article 5") == result["chapters"][1]["articles"][1]
+    assert index.get("Article 99") is None
+
+
+def test_stale_source_is_rejected(indexed):
+    _, output, _ = indexed
+    output.write_bytes(output.read_bytes() + b" ")
+    with pytest.raises(ValueError):
+        ArticleIndex(index_path_for(output))
@@ -0,0 +1,59 @@
+import json
+
+from batch import MANIFEST_NAME, expand_inputs, output_paths, parse_batch
+from conftest import SAMPLE_TEXT
+
+
+def write_corpus(root):
+    paths = []
+    for i, name in enumerate(["b/second.txt", "a/first.txt", "a/nested/third.txt", "fourth.txt"]):
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Vary the documents so each output is distinguishable
+        path.write_text(SAMPLE_TEXT.replace("Kwale", f"Kwale {i}"), encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def test_inputs_expand_to_sorted_unique_files(tmp_path):
+    write_corpus(tmp_path / "corpus")
+    (tmp_path / "corpus" / "notes.md").write_text("skip", encoding="utf-8")
+    inputs = expand_inputs([str(tmp_path / "corpus"), str(tmp_path / "corpus" / "a" / "*.txt")])
+    assert [path.relative_to(tmp_path / "corpus").as_posix() for path in inputs] == [
+        "a/first.txt", "a/nested/third.txt", "b/second.txt", "fourth.txt",
+    ]
+    assert [path.relative_to(tmp_path / "out").as_posix() for path in output_paths(inputs, tmp_path / "out")] == [
+        "a/first.json", "a/nested/third.json", "b/second.json", "fourth.json",
+    ]
+
+
+def test_parallel_batch_keeps_input_order(tmp_path):
+    inputs = write_corpus(tmp_path / "corpus")
+    serial = parse_batch(inputs, tmp_path / "serial", jobs=1)
+    parallel = parse_batch(inputs, tmp_path / "parallel", jobs=3)
+
+    assert [document["input"] for document in parallel["documents"]] == [str(path) for path in inputs]
+    assert parallel["failed"] == serial["failed"] == 0
+    for one, other in zip(serial["documents"], parallel["documents"]):
+        assert one["inputSha256"] == other["inputSha256"]
+        assert (one["chapters"], one["articles"], one["schedules"]) == (2, 4, 2)
+        with open(one["output"], 'rb') as a, open(other["output"], 'rb') as b:
+            assert a.read() == b.read()
+
+    with open(tmp_path / "parallel" / MANIFEST_NAME, encoding="utf-8") as f:
+        assert json.load(f)["documents"] == parallel["documents"]
+
+
+def test_failures_are_recorded_and_cache_is_reused(tmp_path):
+    inputs = write_corpus(tmp_path / "corpus")[:2]
+    broken = tmp_path / "corpus" / "broken.txt"
+    broken.write_bytes(b"\xff\xfe not utf-8")
+    inputs.append(broken)
+
+    first = parse_batch(inputs, tmp_path / "out", jobs=2, cache_dir=tmp_path / "cache")
+    assert first["failed"] == 1
+    assert first["documents"][-1]["error"].startswith("UnicodeDecodeError")
+    assert [document.get("cached") for document in first["documents"][:2]] == [False, False]
+
+    second = parse_batch(inputs, tmp_path / "out", jobs=2, cache_dir=tmp_path / "cache")
+    assert [document.get("cached") for document in second["documents"][:2]] == [True, True]
@@ -0,0 +1,38 @@
+from benchmark import STAGES, compare_results, measure, scale_corpus
+from conftest import SAMPLE_TEXT
+from parse_constitution import parse_constitution
+
+
+def article_numbers(result):
+    return [[article["number"] for article in chapter["articles"]] for chapter in result["chapters"]]
+
+
+def test_scaled_corpus_repeats_chapter_bodies():
+    assert scale_corpus(SAMPLE_TEXT, 1) is SAMPLE_TEXT
+    original = parse_constitution(SAMPLE_TEXT)
+    scaled = parse_constitution(scale_corpus(SAMPLE_TEXT, 3))
+
+    # Article n of copy k is n + k * 5, 5 being the highest article number
+    assert article_numbers(scaled) == [[1, 2, 6, 7, 11, 12], [4, 5, 9, 10, 14, 15]]
+    assert scaled["preamble"] == original["preamble"]
+    assert scaled["schedules"] == original["schedules"]
+    assert scaled["chapters"][1]["articles"][2]["clauses"] == original["chapters"][1]["articles"][0]["clauses"]
+
+
+def test_every_stage_runs(sample_file):
+    for stage in STAGES:
+        result = measure(stage, sample_file, repeat=2, trace=True)
+        assert result["seconds"] <= result["meanSeconds"]
+        assert result["tracedPeakBytes"] > 0
+
+
+def test_compare_flags_regressions():
+    baseline = {"results": [{"stage": "tokenize", "scale": 1, "seconds": 1.0},
+                            {"stage": "engine.app", "scale": 1, "seconds": 1.0}]}
+    current = {"results": [{"stage": "tokenize", "scale": 1, "seconds": 1.05},
+                           {"stage": "engine.app", "scale": 1, "seconds": 1.5},
+                           {"stage": "engine.app", "scale": 10, "seconds": 9.0}]}
+    lines = compare_results(current, baseline, threshold=0.10)
+    assert len(lines) == 3
+    assert lines[1].startswith("  tokenize") and "+5.0%" in lines[1]
+    assert lines[2].startswith("! engine.app") and "+50.0%" in lines[2]
@@ -0,0 +1,59 @@
+import struct
+
+import pytest
+
+from binary_format import (
+    DIGITS, HEADER, MAGIC, STRING, BinaryReader, decode, encode, write_binary,
+)
+
+DOCUMENT = {
+    "chapters": [
+        {"number": 1, "title": "SOVEREIGNTY", "articles": [
+            {"number": 1, "clauses": [{"number": "1", "text": "All sovereign power", "subClauses": []}]},
+        ]},
+    ],
+    "schedules": [{"number": 1, "reference": "Article 6 (1)", "content": {"counties": ["Mombasa", "Kwale"]}}],
+    "values": [None, True, False, -5, 2 ** 40, 1.5, "", "012", "12", "99999999999"],
+}
+
+
+def test_round_trip():
+    assert decode(encode(DOCUMENT)) == DOCUMENT
+
+
+def test_write_binary(tmp_path):
+    path = tmp_path / "constitution.bin"
+    assert write_binary(DOCUMENT, path) == path.stat().st_size
+    assert BinaryReader.open(path).value() == DOCUMENT
+
+
+def test_numeric_labels_are_stored_inline():
+    reader = BinaryReader(encode(["12", "012", "+1", "99999999999"]))
+    assert [reader.kind(child) for child in reader.children(reader.root)] == [DIGITS, STRING, STRING, STRING]
+    assert reader.record(1)[3] == 12
+    assert reader.string_count == 3
+
+
+def test_member_lookup():
+    reader = BinaryReader(encode(DOCUMENT))
+    chapters = reader.member(reader.root, "chapters")
+    chapter = reader.children(chapters)[0]
+    assert reader.key(reader.member(chapter, "title")) == "title"
+    assert reader.value(reader.member(chapter, "title")) == "SOVEREIGNTY"
+    assert reader.member(chapter, "missing") is None
+
+
+def test_reads_version_1():
+    data = bytearray(encode({"title": "SOVEREIGNTY", "number": 1}))
+    struct.pack_into("<H", data, 4, 1)
+    assert decode(data) == {"title": "SOVEREIGNTY", "number": 1}
+
+
+def test_rejects_unknown_version_and_magic():
+    data = bytearray(encode({}))
+    struct.pack_into("<H", data, 4, 99)
+    with pytest.raises(ValueError, match="version"):
+        decode(data)
+    with pytest.raises(ValueError, match="Not a constitution"):
+        decode(HEADER.pack(b"XXXX", 2, 0, 0, 0) + bytes(8))
+    assert encode({})[:4] == MAGIC
@@ -0,0 +1,73 @@
+import json
+import sys
+
+import build_app_assets
+from build_app_assets import get_article_number, parse_clauses, parse_constitution
+
+
+def test_legacy_parser_is_the_default(sample_file):
+    result = parse_constitution(str(sample_file))
+    assert [chapter["number"] for chapter in result["chapters"]] == [1, 2]
+    articles = [article["number"] for chapter in result["chapters"] for article in chapter["articles"]]
+    assert articles == [1, 2, 4, 5]
+    assert result["preamble"].startswith("We, the people of Kenya")
+
+
+def test_jobs_do_not_change_the_result(sample_file):
+    assert parse_constitution(str(sample_file), jobs=2) == parse_constitution(str(sample_file))
+
+
+def test_article_numbers_come_from_the_title_trie():
+    assert get_article_number("Declaration of the Republic", 0) == 4
+    assert get_article_number("Not an article of the Constitution", 7) == 8
+
+
+def test_parse_clauses_nests_sub_and_mini_clauses():
+    clauses = parse_clauses([
+        "(1) The State shall-",
+        "(a) promote-",
+        "(i) the diversity of language; and",
+        "(2) Nothing more.",
+    ])
+    assert [clause["number"] for clause in clauses] == ["1", "2"]
+    assert clauses[0]["subClauses"][0]["label"] == "a"
+    assert clauses[1]["text"] == "Nothing more."
+
+
+def test_engine_flag_selects_the_engine(tmp_path, sample_file, monkeypatch):
+    output = tmp_path / "out.json"
+    monkeypatch.setattr(sys, "argv", ["build_app_assets.py", str(sample_file), "-o", str(output),
+                                      "--no-cache", "--engine"])
+    calls = []
+    parse_with_engine = build_app_assets.parse_with_engine
+
+    def spy(*args, **kwargs):
+        calls.append(args)
+        return parse_with_engine(*args, **kwargs)
+
+    monkeypatch.setattr(build_app_assets, "parse_with_engine", spy)
+    assert build_app_assets.main() == 0
+    assert len(calls) == 1
+    assert [chapter["number"] for chapter in json.loads(output.read_text(encoding="utf-8"))["chapters"]] == [1, 2]
+
+
+def test_clause_lines_are_joined_once():
+    clauses = parse_clauses([
+        "27. (1) Every person is equal before the law",
+        "and has the right to equal protection.",
+        "",
+        "(2) Equality includes-",
+        "(a) the full enjoyment of rights; and",
+        "(b) fundamental freedoms.",
+    ])
+    assert clauses[0] == {"number": "1",
+                          "text": "Every person is equal before the law\nand has the right to equal protection.",
+                          "subClauses": []}
+    assert clauses[1]["text"] == "Equality includes-"
+    assert [(sub["label"], sub["text"]) for sub in clauses[1]["subClauses"]] == [
+        ("a", "the full enjoyment of rights; and"), ("b", "fundamental freedoms.")]
+
+
+def test_article_without_numbered_clauses_keeps_its_text():
+    clauses = parse_clauses(["The capital is Nairobi.", "", "It is a city."])
+    assert clauses == [{"number": "", "text": "The capital is Nairobi.\nIt is a city.", "subClauses": []}]
@@ -0,0 +1,58 @@
+from citations import CitationGraph, CitationGraphBuilder, build_citation_graph, extract_citations
+
+
+def test_article_list():
+    assert extract_citations("Articles 185(2), 186(1) and 187(2)") == ["185(2)", "186(1)", "187(2)"]
+
+
+def test_article_range():
+    assert extract_citations("Articles 260 to 262") == ["260", "261", "262"]
+
+
+def test_bare_number_after_comma_is_not_cited():
+    assert extract_citations("subject to Article 10, 2 persons may") == ["10"]
+
+
+def test_bare_number_after_comma_with_label_or_list_context():
+    assert extract_citations("Article 10, 2(1)") == ["10", "2(1)"]
+    assert extract_citations("Article 10, 11 and 12") == ["10", "11", "12"]
+    assert extract_citations("Articles 10, 12") == ["10", "12"]
+
+
+def test_clause_of_citing_article():
+    assert extract_citations("as provided in clause (2)", "27") == ["27(2)"]
+
+
+def test_clause_range():
+    assert extract_citations("subject to clauses (1) to (3)", "27") == ["27(1)", "27(2)", "27(3)"]
+
+
+def test_article_clause_range():
+    assert extract_citations("Article 24 (1) to (3)") == ["24(1)", "24(2)", "24(3)"]
+
+
+def _chapter(*articles):
+    return {"number": 1, "title": "SOVEREIGNTY", "articles": list(articles)}
+
+
+def _article(number, *texts):
+    return {"number": number, "title": f"Article {number}",
+            "clauses": [{"number": str(i + 1), "text": text, "subClauses": []} for i, text in enumerate(texts)]}
+
+
+def test_graph_resolves_to_most_specific_node(tmp_path):
+    chapter = _chapter(_article(1, "See Article 2 (1) (z).", "And Article 300."),
+                       _article(2, "First.", "Second."))
+    path = tmp_path / "citations.json"
+    build_citation_graph([chapter], [], path)
+    graph = CitationGraph(path)
+    assert graph.cites("1(1)") == ["2(1)"]
+    assert graph.cited_by("2") == ["1(1)"]
+    assert graph.graph["unresolved"] == [["1(2)", "300"]]
+
+
+def test_schedule_article_column():
+    builder = CitationGraphBuilder()
+    builder.add_chapter(_chapter(_article(11, "First.", "Second.", "Third.")))
+    builder.add_schedule({"number": 5, "content": {"legislation": [{"article": "11 (3)"}]}})
+    assert builder.build()["cites"] == {"schedule:5": ["11(3)"]}
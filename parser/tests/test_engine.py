@@ -0,0 +1,36 @@
+import pytest
+
+from engine import OutputSchema, SCHEMAS, get_schema, parse_document, parse_file, register_schema
+from parse_constitution import parse_constitution
+
+
+def test_parser_schema_matches_the_command_line_parser(sample_file):
+    assert parse_file(sample_file) == parse_constitution(sample_file.read_text(encoding="utf-8"))
+
+
+def test_app_schema_shape(sample_file):
+    result = parse_file(sample_file, "app")
+    assert "metadata" not in result
+    assert isinstance(result["preamble"], str)
+    articles = [article for chapter in result["chapters"] for article in chapter["articles"]]
+    assert [article["number"] for article in articles] == [1, 2, 4, 5]
+    assert all(isinstance(clause["number"], str) for article in articles for clause in article["clauses"])
+    assert [schedule["number"] for schedule in result["schedules"]] == [1, 2]
+
+
+def test_unknown_schema():
+    with pytest.raises(ValueError):
+        get_schema("missing")
+
+
+def test_registered_schema_is_used(sample_lines):
+    class Titles(OutputSchema):
+        name = "titles"
+        serialize = staticmethod(lambda node: getattr(node, "title", None))
+
+    register_schema(Titles())
+    try:
+        result = parse_document(sample_lines, "titles")
+    finally:
+        del SCHEMAS["titles"]
+    assert result["chapters"] == ["SOVEREIGNTY OF THE PEOPLE AND SUPREMACY OF THIS CONSTITUTION", "THE REPUBLIC"]
@@ -0,0 +1,64 @@
+import json
+
+from conftest import SAMPLE_TEXT
+from incremental import IncrementalParse, split_spans, state_path_for
+from parse_constitution import parse_to_file
+
+
+def parse(tmp_path, text, name="constitution.json", incremental=True):
+    source = tmp_path / "constitution.txt"
+    source.write_text(text, encoding="utf-8")
+    output = tmp_path / name
+    parse_to_file(source, output, incremental=incremental, cache_dir=tmp_path / "cache")
+    return output
+
+
+def test_split_spans(sample_lines):
+    assert [span.kind for span in split_spans(sample_lines)] == \
+        ["preamble", "chapter", "chapter", "schedule", "schedule"]
+
+
+def test_unchanged_spans_are_reused(tmp_path, monkeypatch):
+    runs = []
+    iter_nodes = IncrementalParse.iter_nodes
+
+    def record(self, lines):
+        runs.append(self)
+        return iter_nodes(self, lines)
+
+    monkeypatch.setattr(IncrementalParse, "iter_nodes", record)
+
+    output = parse(tmp_path, SAMPLE_TEXT)
+    first = output.read_bytes()
+    parse(tmp_path, SAMPLE_TEXT)
+    assert output.read_bytes() == first
+    edited = SAMPLE_TEXT.replace("Kenya is a sovereign Republic.", "Kenya is a sovereign State.")
+    parse(tmp_path, edited)
+
+    assert [(run.parsed, run.reused) for run in runs] == [(5, 0), (0, 5), (1, 4)]
+    full = parse(tmp_path, edited, "full.json", incremental=False)
+    assert json.loads(output.read_text(encoding="utf-8")) == json.loads(full.read_text(encoding="utf-8"))
+
+
+def test_state_is_kept_in_cache_dir(tmp_path):
+    output = parse(tmp_path, SAMPLE_TEXT)
+    state_path = state_path_for(output, tmp_path / "cache")
+    assert state_path.parent == tmp_path / "cache" / "incremental"
+    assert state_path.exists()
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["cache", "constitution.json", "constitution.txt"]
+
+
+def test_edited_output_is_not_spliced(tmp_path):
+    output = parse(tmp_path, SAMPLE_TEXT)
+    lines = SAMPLE_TEXT.splitlines(keepends=True)
+    cache_dir = tmp_path / "cache"
+    fingerprint = json.loads(state_path_for(output, cache_dir).read_text(encoding="utf-8"))["fingerprint"]
+
+    state = IncrementalParse(output, fingerprint, cache_dir)
+    list(state.iter_nodes(lines))
+    assert (state.parsed, state.reused) == (0, 5)
+
+    output.write_text(output.read_text(encoding="utf-8").replace("Mombasa", "Nairobi"), encoding="utf-8")
+    state = IncrementalParse(output, fingerprint, cache_dir)
+    list(state.iter_nodes(lines))
+    assert (state.parsed, state.reused) == (5, 0)
@@ -0,0 +1,70 @@
+import json
+import sys
+
+import build_app_assets
+import parse_constitution
+from engine import parse_file
+from instrumentation import StageTimer, input_bytes
+
+
+def stage_names(timer):
+    return [row["stage"] for row in timer.stats()]
+
+
+def test_input_bytes_counts_file_contents(sample_file):
+    size = sample_file.stat().st_size
+    assert input_bytes((sample_file,)) == size
+    with open(sample_file, 'r', encoding='utf-8') as f:
+        assert input_bytes((f,)) == size
+    assert input_bytes(("abc", ["de", "f"])) == 3 + 3 + 2
+
+
+def test_generator_steps_exclude_the_consumer():
+    timer = StageTimer()
+    namespace = {}
+
+    def produce(n):
+        yield from range(n)
+
+    namespace["produce"] = produce
+    timer.instrument(namespace, {"produce": "produce"})
+    try:
+        assert list(namespace["produce"](3)) == [0, 1, 2]
+    finally:
+        timer.uninstrument()
+    assert namespace["produce"] is produce
+    assert [(row["stage"], row["calls"]) for row in timer.stats()] == [("produce", 1)]
+
+
+def test_builder_methods_are_timed_and_restored(sample_file):
+    close_article = parse_constitution.ConstitutionBuilder._close_article
+    timer = StageTimer()
+    for namespace, stages in parse_constitution.TIMED_STAGES:
+        timer.instrument(namespace, stages)
+    try:
+        timed = parse_file(sample_file, "app")
+    finally:
+        timer.uninstrument()
+    assert parse_constitution.ConstitutionBuilder._close_article is close_article
+    assert timed == parse_file(sample_file, "app")
+
+    stats = {row["stage"]: row for row in timer.stats()}
+    for stage in ("tokenize", "chapter", "part extraction", "article split", "clauses", "sub-clauses",
+                  "mini-clauses", "text cleaning", "schedule split", "parse_schedule_1", "parse_schedule_2"):
+        assert stage in stats, stage
+    assert stats["chapter"]["calls"] >= 2
+    assert stats["tokenize"]["inputBytes"] == sample_file.stat().st_size
+
+
+def test_builder_stages_from_the_command_line(tmp_path, sample_file, monkeypatch):
+    timings = tmp_path / "timings.json"
+    for engine in ([], ["--engine"]):
+        monkeypatch.setattr(sys, "argv", ["build_app_assets.py", str(sample_file), "-o", str(tmp_path / "out.json"),
+                                          "--timings-json", str(timings)] + engine)
+        assert build_app_assets.main() == 0
+        stages = {row["stage"]: row for row in json.loads(timings.read_text(encoding="utf-8"))["stages"]}
+        assert {"preamble", "chapter", "part extraction", "article split", "clauses"} <= set(stages)
+        if engine:
+            assert stages["engine"]["inputBytes"] == sample_file.stat().st_size
+        else:
+            assert stages["chapter split"]["inputBytes"] == len(sample_file.read_text(encoding="utf-8").encode())
@@ -0,0 +1,71 @@
+import io
+import json
+
+import pytest
+
+from json_writer import JsonStreamWriter
+
+DOCUMENT = {
+    "metadata": {"title": "Constitution of Kenya"},
+    "chapters": [
+        {"number": 1, "title": "SOVEREIGNTY", "articles": [{"number": 1, "clauses": []}]},
+        {"number": 2, "title": "THE REPUBLIC — KENYA", "articles": []},
+    ],
+}
+
+
+def write(document, pretty):
+    f = io.BytesIO()
+    writer = JsonStreamWriter(f, pretty)
+    writer.write("metadata", document["metadata"])
+    writer.begin_list("chapters")
+    for chapter in document["chapters"]:
+        writer.append(chapter)
+    writer.end_list()
+    writer.close()
+    return writer, f.getvalue()
+
+
+def test_pretty_output_matches_json_dump():
+    writer, data = write(DOCUMENT, pretty=True)
+    assert data == json.dumps(DOCUMENT, ensure_ascii=False, indent=2).encode('utf-8')
+    assert writer.bytes_written == len(data)
+
+
+def test_compact_output():
+    writer, data = write(DOCUMENT, pretty=False)
+    assert data == json.dumps(DOCUMENT, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    assert len(writer.items["chapters"]) == 2
+    assert sum(writer.sections.values()) + 2 == len(data)
+
+
+@pytest.mark.parametrize("pretty", [False, True])
+def test_append_with_spans(pretty):
+    f = io.BytesIO()
+    writer = JsonStreamWriter(f, pretty)
+    writer.begin_list("chapters")
+    spans = [writer.append_with_spans(chapter) for chapter in DOCUMENT["chapters"]]
+    writer.close()
+    data = f.getvalue()
+
+    assert json.loads(data) == {"chapters": DOCUMENT["chapters"]}
+    for chapter, chapter_spans in zip(DOCUMENT["chapters"], spans):
+        offset, length = chapter_spans[()]
+        assert json.loads(data[offset:offset + length]) == chapter
+    offset, length = spans[0][("articles", 0)]
+    assert json.loads(data[offset:offset + length]) == {"number": 1, "clauses": []}
+
+
+def test_duplicate_key():
+    writer = JsonStreamWriter(io.BytesIO())
+    writer.write("metadata", {})
+    with pytest.raises(ValueError, match="already written"):
+        writer.write("metadata", {})
+
+
+def test_append_without_open_list():
+    writer = JsonStreamWriter(io.BytesIO())
+    with pytest.raises(ValueError, match="No list is open"):
+        writer.append({})
+    with pytest.raises(ValueError, match="No list is open"):
+        writer.end_list()
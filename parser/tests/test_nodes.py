@@ -0,0 +1,25 @@
+import io
+
+import pytest
+
+from conftest import SAMPLE_TEXT
+from nodes import Article, Clause, from_parser_shape, to_app_shape, to_parser_shape
+from parse_constitution import iter_nodes
+
+
+@pytest.mark.parametrize("provenance", [None, "spans", "offsets"])
+def test_parser_shape_round_trips(provenance):
+    for kind, node in iter_nodes(io.StringIO(SAMPLE_TEXT, newline=''), provenance):
+        assert from_parser_shape(kind, to_parser_shape(node)) == node
+
+
+def test_nodes_have_slots_only():
+    article = Article(1, "Sovereignty of the people", [Clause(1, "All sovereign power belongs to the people.")])
+    assert not hasattr(article, "__dict__")
+    with pytest.raises(AttributeError):
+        article.extra = True
+
+
+def test_app_shape_numbers_clauses_as_strings():
+    article = Article(1, "Sovereignty of the people", [Clause(0, "Introduction."), Clause(1, "Power.")])
+    assert [clause["number"] for clause in to_app_shape(article)["clauses"]] == ["", "1"]
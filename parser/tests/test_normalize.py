@@ -0,0 +1,79 @@
+import pytest
+
+from normalize import TEXT_CACHES, TextCache, normalize_title, search_tokens
+from parse_constitution import clean_text, clean_texts, parse_constitution
+
+
+@pytest.fixture
+def cache():
+    calls = []
+
+    def upper(text):
+        calls.append(text)
+        return text.upper()
+
+    cache = TextCache(upper, maxsize=2)
+    cache.calls = calls
+    return cache
+
+
+def test_hits_misses_and_eviction(cache):
+    assert [cache("a"), cache("b"), cache("a"), cache("c"), cache("b")] == ["A", "B", "A", "C", "B"]
+    # "b" was the least recently used entry when "c" arrived
+    assert cache.calls == ["a", "b", "c", "b"]
+    assert cache.stats() == {"hits": 1, "misses": 4, "size": 2, "maxsize": 2}
+
+
+def test_map_batches_only_the_misses(cache):
+    batches = []
+
+    def batch(texts):
+        batches.append(texts)
+        return [text.upper() for text in texts]
+
+    cache("a")
+    assert cache.map(["a", "b", "b", "a"], batch) == ["A", "B", "B", "A"]
+    assert batches == [["b"]]
+    assert cache.stats()["hits"] == 3 and cache.stats()["misses"] == 2
+
+
+def test_disabled_cache_calls_through(cache):
+    cache.resize(0)
+    assert cache("a") == cache("a") == "A"
+    assert cache.map(["a"], lambda texts: [text.upper() for text in texts]) == ["A"]
+    assert cache.calls == ["a", "a"]
+    assert cache.stats() == {"hits": 0, "misses": 0, "size": 0, "maxsize": 0}
+
+
+def test_engine_text_cleaning_is_memoized():
+    assert TEXT_CACHES["clean_text"] is clean_text
+    text = "  a  clause\nwith   Constitution of Kenya, 2010\n3 spaces "
+    assert clean_texts([text, "", text]) == [clean_text.function(text), "", clean_text.function(text)]
+
+    clean_text.clear()
+    parse_constitution("PREAMBLE\nCHAPTER ONE-ONE\nTitle.\n1. Same text.\nTitle.\n2. Same text.")
+    assert clean_text.stats()["hits"] >= 2
+
+
+def test_titles_and_search_tokens_agree():
+    assert normalize_title("  Rights of  Minorities ") == "rights of minorities"
+    assert search_tokens("Rights of Minorities") == ["rights", "of", "minorities"]
+
+
+def test_batch_cleaning_matches_cleaning_each_text():
+    texts = [
+        "  a  clause\nwith  spaces ",
+        "",
+        "   ",
+        "ends with Constitution of Kenya, 2010",
+        "Constitution of Kenya, 2010\n12\nstarts with a page marker",
+        "non breaking spaces",
+        "contains the \x00 separator",
+        "tabs\tand\r\nline breaks",
+    ]
+    clean_text.clear()
+    assert clean_texts(texts) == [clean_text.function(text) for text in texts]
+    # Without the separator, the texts are cleaned in one pass
+    clean_text.clear()
+    batchable = texts[:6] + texts[7:]
+    assert clean_texts(batchable) == [clean_text.function(text) for text in batchable]
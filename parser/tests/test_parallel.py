@@ -0,0 +1,28 @@
+import pytest
+
+import engine
+from conftest import SAMPLE_TEXT
+from parse_constitution import parse_constitution, parse_to_file, split_sections
+
+
+def test_sections_follow_the_document(sample_lines):
+    assert [(kind, index) for kind, index, _ in split_sections(sample_lines)] == [
+        ("preamble", 0), ("chapter", 0), ("chapter", 0), ("schedule", 0), ("schedule", 1),
+    ]
+
+
+@pytest.mark.parametrize("schema", ["parser", "app"])
+def test_parallel_parse_matches_sequential(sample_lines, schema):
+    assert engine.parse_document(sample_lines, schema, jobs=2) == engine.parse_document(sample_lines, schema)
+
+
+def test_parallel_output_file_is_identical(tmp_path, sample_file):
+    sequential, parallel = tmp_path / "sequential.json", tmp_path / "parallel.json"
+    parse_to_file(sample_file, sequential, cache_dir=tmp_path)
+    parse_to_file(sample_file, parallel, cache_dir=tmp_path, jobs=2)
+    assert parallel.read_bytes() == sequential.read_bytes()
+
+
+def test_parallel_parse_rejects_provenance():
+    with pytest.raises(ValueError):
+        parse_constitution(SAMPLE_TEXT, "spans", jobs=2)
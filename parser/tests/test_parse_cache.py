@@ -0,0 +1,52 @@
+from parse_cache import ParseCache, loaded_sources, parser_fingerprint
+
+
+def test_hit_copies_output_and_attachments(tmp_path, sample_file):
+    cache = ParseCache(tmp_path / "cache")
+    output = tmp_path / "out.json"
+    index = tmp_path / "out.index.json"
+    output.write_text('{"chapters": []}', encoding="utf-8")
+    index.write_text('{"entries": {}}', encoding="utf-8")
+
+    key = cache.key(sample_file, "fingerprint", True, None)
+    assert cache.fetch(key, output) is None
+    cache.store(key, output, {"chapters": 2}, attachments={"index": index})
+
+    copy, copy_index = tmp_path / "copy" / "out.json", tmp_path / "copy.index.json"
+    assert cache.fetch(key, copy, attachments={"index": copy_index}) == {"chapters": 2}
+    assert copy.read_text(encoding="utf-8") == '{"chapters": []}'
+    assert copy_index.read_text(encoding="utf-8") == '{"entries": {}}'
+
+
+def test_key_changes_with_input_parser_and_options(tmp_path, sample_file):
+    cache = ParseCache(tmp_path)
+    key = cache.key(sample_file, "fingerprint", False)
+    assert cache.key(sample_file, "fingerprint", False) == key
+    assert cache.key(sample_file, "other parser", False) != key
+    assert cache.key(sample_file, "fingerprint", True) != key
+
+    sample_file.write_text(sample_file.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+    assert cache.key(sample_file, "fingerprint", False) != key
+
+
+def test_fingerprint_follows_source_contents(tmp_path):
+    source = tmp_path / "parser.py"
+    source.write_text("A = 1\n", encoding="utf-8")
+    before = parser_fingerprint([source])
+    source.write_text("A = 2\n", encoding="utf-8")
+    assert parser_fingerprint([source]) != before
+
+
+def test_loaded_sources_cover_every_imported_parser_module():
+    import engine  # noqa: F401
+    from parse_constitution import PARSER_DIR
+    names = {path.name for path in loaded_sources(PARSER_DIR)}
+    assert {"parse_constitution.py", "tokenizer.py", "engine.py", "app_schedules.py", "parse_cache.py"} <= names
+    assert all(PARSER_DIR in path.parents for path in loaded_sources(PARSER_DIR))
+
+
+def test_batch_fingerprints_the_loaded_modules(tmp_path, sample_file):
+    from batch import parse_batch
+    from parse_constitution import PARSER_DIR
+    manifest = parse_batch([sample_file], tmp_path / "out", jobs=1)
+    assert manifest["parser"] == parser_fingerprint(loaded_sources(PARSER_DIR))
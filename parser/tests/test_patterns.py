@@ -0,0 +1,37 @@
+import re
+
+import pytest
+
+from patterns import PATTERNS, PatternRegistry
+
+
+def test_patterns_are_compiled_once():
+    assert isinstance(PATTERNS.whitespace, re.Pattern)
+    assert PATTERNS.get("whitespace") is PATTERNS.whitespace
+    assert "whitespace" in PATTERNS.names()
+
+
+def test_duplicate_names_are_rejected():
+    registry = PatternRegistry()
+    registry.add("digits", r"\d+")
+    with pytest.raises(ValueError):
+        registry.add("digits", r"[0-9]+")
+
+
+def test_stats_count_calls_only_while_enabled():
+    registry = PatternRegistry()
+    registry.add("digits", r"\d+")
+    registry.digits.findall("1 2 3")
+    assert registry.stats() == []
+
+    registry.enable_stats()
+    assert registry.digits.findall("1 2 3") == ["1", "2", "3"]
+    assert [m.group() for m in registry.digits.finditer("4 5")] == ["4", "5"]
+    [(name, calls, seconds)] = registry.stats()
+    assert (name, calls) == ("digits", 2)
+    assert seconds >= 0
+
+    registry.disable_stats()
+    assert isinstance(registry.digits, re.Pattern)
+    registry.reset_stats()
+    assert registry.stats() == []
@@ -0,0 +1,26 @@
+import build_app_assets
+import profiling
+from engine import parse_file
+from parse_constitution import ConstitutionBuilder
+from profiling import allocations_by_function, trace_memory_call
+
+
+def test_class_methods_are_attributed(sample_file):
+    result, trace = trace_memory_call(parse_file, sample_file, "app")
+    rows = allocations_by_function(trace.snapshot, build_app_assets.parser_functions(engine=True))
+    names = {name for name, _, _ in rows}
+    assert any(name.startswith("ConstitutionBuilder.") for name in names)
+    assert sum(size for _, _, size in rows) > 0
+
+
+def test_standard_library_classes_are_skipped():
+    from pathlib import Path
+    names = [name for name, _ in profiling._functions({"Path": Path, "ConstitutionBuilder": ConstitutionBuilder})]
+    assert "ConstitutionBuilder._close_sub" in names
+    assert not any(name.startswith("Path.") for name in names)
+
+
+def test_legacy_functions_are_attributed(sample_file):
+    result, trace = trace_memory_call(build_app_assets.parse_constitution, sample_file)
+    names = {name for name, _, _ in allocations_by_function(trace.snapshot, build_app_assets.parser_functions())}
+    assert "parse_articles" in names
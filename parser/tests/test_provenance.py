@@ -0,0 +1,40 @@
+from parse_constitution import iter_constitution
+from provenance import LineOffsets, SourceText
+
+
+def parse_with(path, provenance):
+    with open(path, 'r', encoding='utf-8', newline='') as src:
+        return list(iter_constitution(src, provenance))
+
+
+def articles(items):
+    return [article for kind, node in items if kind == "chapter" for article in node["articles"]]
+
+
+def test_line_offsets_are_utf8_bytes():
+    offsets = LineOffsets()
+    assert list(offsets.track(["é a\r\n", "b\n", "c"])) == ["é a\r\n", "b\n", "c"]
+    assert offsets.span(1) == (0, 4)
+    assert offsets.span(2) == (6, 7)
+    assert offsets.span(3) == (8, 9)
+
+
+def test_spans_decode_to_the_source_lines(sample_file):
+    items = parse_with(sample_file, "spans")
+    with SourceText(sample_file) as source:
+        article = articles(items)[0]
+        assert source.text(article["span"]).startswith("Sovereignty of the people.\n1. (1)")
+        clause = article["clauses"][0]
+        assert source.text(clause["span"]) == "1. (1) All sovereign power belongs to the people of Kenya."
+        sub = article["clauses"][1]["subClauses"][1]
+        assert source.text(sub["span"]) == "(b) through their democratically elected representatives."
+
+
+def test_offsets_mode_drops_texts_but_keeps_spans(sample_file):
+    spans = parse_with(sample_file, "spans")
+    offsets = parse_with(sample_file, "offsets")
+    for with_text, without_text in zip(articles(spans), articles(offsets)):
+        assert with_text["span"] == without_text["span"]
+        for clause in without_text["clauses"]:
+            assert "text" not in clause and "span" in clause
+            assert all("text" not in sub for sub in clause.get("subClauses", []))
@@ -0,0 +1,88 @@
+import pytest
+
+from binary_format import write_binary
+from engine import parse_document
+from parse_constitution import iter_constitution
+from reader import (
+    BinaryConstitutionReader, ConstitutionReader, ShardedConstitutionReader, open_constitution,
+)
+from shards import MANIFEST_NAME, ShardWriter
+
+
+@pytest.fixture(params=["binary", "sharded"])
+def constitution(request, tmp_path, sample_lines):
+    if request.param == "binary":
+        path = tmp_path / "constitution.bin"
+        write_binary(parse_document(sample_lines, "app"), path)
+    else:
+        path = tmp_path / "shards"
+        writer = ShardWriter(path)
+        for kind, node in iter_constitution(sample_lines):
+            writer.add(kind, node)
+        writer.close()
+    with open_constitution(path) as reader:
+        yield reader
+
+
+def test_reader_is_abstract():
+    with pytest.raises(TypeError):
+        ConstitutionReader()
+
+
+def test_open_constitution(tmp_path, sample_lines):
+    write_binary(parse_document(sample_lines, "app"), tmp_path / "constitution.bin")
+    writer = ShardWriter(tmp_path / "shards")
+    writer.close()
+    with open_constitution(tmp_path / "constitution.bin") as reader:
+        assert isinstance(reader, BinaryConstitutionReader)
+    assert isinstance(open_constitution(tmp_path / "shards"), ShardedConstitutionReader)
+    assert isinstance(open_constitution(tmp_path / "shards" / MANIFEST_NAME), ShardedConstitutionReader)
+
+
+def test_get_article(constitution):
+    article = constitution.get_article(4)
+    assert (article["number"], article["title"]) == (4, "Declaration of the Republic")
+    assert article["clauses"][0]["text"] == "Kenya is a sovereign Republic."
+    assert constitution.get_article(3) is None
+
+
+def test_iter_clauses(constitution):
+    clauses = [(number, clause["text"]) for number, clause in constitution.iter_clauses(2)]
+    assert [number for number, _ in clauses] == [4, 4, 5]
+    assert clauses[0][1] == "Kenya is a sovereign Republic."
+    assert list(constitution.iter_clauses(9)) == []
+
+
+def test_get_schedule(constitution):
+    schedule = constitution.get_schedule(1)
+    assert schedule["number"] == 1
+    assert "Mombasa" in str(schedule)
+    assert constitution.get_schedule(7) is None
+
+
+def test_sharded_reader_decodes_single_articles(tmp_path, sample_lines, monkeypatch):
+    writer = ShardWriter(tmp_path)
+    for kind, node in iter_constitution(sample_lines):
+        writer.add(kind, node)
+    manifest = writer.close()
+    [(number, offset, length), _] = manifest["chapters"][1]["articleOffsets"]
+    assert number == 4
+
+    decoded = []
+    with ShardedConstitutionReader(tmp_path) as reader:
+        original = reader._decode
+        monkeypatch.setattr(reader, "_decode", lambda *args: decoded.append(args) or original(*args))
+        assert reader.get_article(4)["title"] == "Declaration of the Republic"
+    assert decoded == [("chapter-02.json", offset, length)]
+
+
+def test_sharded_reader_reads_version_1_manifests(tmp_path, sample_lines):
+    writer = ShardWriter(tmp_path)
+    for kind, node in iter_constitution(sample_lines):
+        writer.add(kind, node)
+    writer.close()
+    with ShardedConstitutionReader(tmp_path) as reader:
+        expected = reader.get_article(5), list(reader.iter_clauses(2))
+        for entry in reader.manifest["chapters"]:
+            del entry["articleOffsets"]
+        assert (reader.get_article(5), list(reader.iter_clauses(2))) == expected
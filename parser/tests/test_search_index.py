@@ -0,0 +1,38 @@
+import pytest
+
+from engine import parse_file
+from search_index import SearchIndex, SearchIndexBuilder, build_search_index, decode_postings, search_path_for
+
+
+@pytest.fixture
+def index(tmp_path, sample_file):
+    path = search_path_for(tmp_path / "constitution.json")
+    build_search_index(parse_file(sample_file, "app")["chapters"], path)
+    return SearchIndex(path)
+
+
+def test_keyword_queries_match_every_term(index):
+    assert index.search("sovereign") == [(1, "1(1)"), (1, "1(2)"), (2, "4(1)")]
+    assert index.search("sovereign people") == [(1, "1(1)"), (1, "1(2)")]
+    assert index.search("Braille") == [(2, "4(2)(a)(ii)")]
+    assert index.search("parliament") == []
+
+
+def test_article_titles_are_searchable(index):
+    assert index.search("territory") == [(2, "5")]
+
+
+def test_phrases_need_consecutive_words(index):
+    assert index.search('"sovereign power"') == [(1, "1(1)"), (1, "1(2)")]
+    assert index.search('"power sovereign"') == []
+
+
+def test_phrases_do_not_span_separate_texts():
+    builder = SearchIndexBuilder()
+    builder.add_text(1, "1", "freedom of")
+    builder.add_text(1, "1", "expression")
+    assert builder.build()["postings"]["expression"] == [0, 1, 3]
+
+
+def test_postings_round_trip():
+    assert decode_postings([0, 2, 1, 3, 2, 1, 4]) == {0: [1, 4], 2: [4]}
@@ -0,0 +1,38 @@
+import hashlib
+import json
+
+import pytest
+
+from parse_constitution import iter_constitution
+from shards import MANIFEST_NAME, ShardWriter
+
+
+def test_manifest(tmp_path, sample_lines):
+    writer = ShardWriter(tmp_path, metadata={"title": "Constitution of Kenya"})
+    for kind, node in iter_constitution(sample_lines):
+        writer.add(kind, node)
+    manifest = writer.close()
+
+    assert json.loads((tmp_path / MANIFEST_NAME).read_text(encoding="utf-8")) == manifest
+    assert manifest["metadata"] == {"title": "Constitution of Kenya"}
+    assert [(entry["number"], entry["file"], entry["articles"]) for entry in manifest["chapters"]] == [
+        (1, "chapter-01.json", {"count": 2, "first": 1, "last": 2}),
+        (2, "chapter-02.json", {"count": 2, "first": 4, "last": 5}),
+    ]
+    assert [entry["file"] for entry in manifest["schedules"]] == ["schedule-1.json", "schedule-2.json"]
+    for entry in [manifest["preamble"]] + manifest["chapters"] + manifest["schedules"]:
+        data = (tmp_path / entry["file"]).read_bytes()
+        assert (entry["bytes"], entry["sha256"]) == (len(data), hashlib.sha256(data).hexdigest())
+
+
+def test_duplicate_chapter(tmp_path):
+    writer = ShardWriter(tmp_path)
+    writer.add("chapter", {"number": 1, "title": "SOVEREIGNTY", "articles": []})
+    with pytest.raises(ValueError, match="Duplicate chapter 1: chapter-01.json"):
+        writer.add("chapter", {"number": 1, "title": "THE REPUBLIC", "articles": []})
+    assert json.loads((tmp_path / "chapter-01.json").read_text(encoding="utf-8"))["title"] == "SOVEREIGNTY"
+
+
+def test_unknown_kind(tmp_path):
+    with pytest.raises(ValueError, match="Unknown shard kind"):
+        ShardWriter(tmp_path).add("part", {})
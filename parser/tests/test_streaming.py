@@ -0,0 +1,41 @@
+import io
+
+from conftest import SAMPLE_TEXT
+from nodes import Chapter, Preamble, Schedule
+from parse_constitution import iter_constitution, iter_nodes, parse_constitution
+
+
+def test_chapters_are_yielded_before_the_input_is_exhausted(sample_lines):
+    consumed = []
+
+    def lines():
+        for line in sample_lines:
+            consumed.append(line)
+            yield line
+
+    items = iter_nodes(lines())
+    kind, preamble = next(items)
+    assert kind == "preamble" and isinstance(preamble, Preamble)
+    kind, chapter = next(items)
+    assert kind == "chapter" and isinstance(chapter, Chapter) and chapter.number == 1
+    # Chapter ONE ends where CHAPTER TWO starts; nothing after it has been read
+    assert consumed[-1].startswith("CHAPTER TWO")
+    assert len(consumed) < len(sample_lines)
+
+    rest = list(items)
+    assert [kind for kind, _ in rest] == ["chapter", "schedule", "schedule"]
+    assert isinstance(rest[-1][1], Schedule)
+
+
+def test_reads_from_a_file_handle(sample_file):
+    with open(sample_file, encoding="utf-8") as f:
+        streamed = list(iter_constitution(f))
+    result = parse_constitution(SAMPLE_TEXT)
+    assert [node for kind, node in streamed if kind == "chapter"] == result["chapters"]
+    assert [node for kind, node in streamed if kind == "schedule"] == result["schedules"]
+
+
+def test_stream_and_text_agree_with_provenance():
+    streamed = list(iter_constitution(io.StringIO(SAMPLE_TEXT, newline=''), "spans"))
+    assert [node for kind, node in streamed if kind == "chapter"] == \
+        parse_constitution(SAMPLE_TEXT, "spans")["chapters"]
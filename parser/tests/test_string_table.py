@@ -0,0 +1,57 @@
+import json
+import sys
+
+from parse_constitution import iter_nodes, parse_to_file
+from string_table import REF_KEY, STRINGS_KEY, StringPool, StringTable, dedup_items, load_document
+
+COUNTY = "Mombasa County Assembly"
+
+
+def test_dedup_items():
+    items = [("schedule", {"chapter": COUNTY, "row": 1}), ("schedule", {"chapter": COUNTY, "title": "short"})]
+    strings, encoded = dedup_items(items)
+    assert strings == [COUNTY]
+    assert encoded == [("schedule", {"chapter": {REF_KEY: 0}, "row": 1}),
+                       ("schedule", {"chapter": {REF_KEY: 0}, "title": "short"})]
+
+
+def test_short_and_single_strings_stay_inline():
+    table = StringTable()
+    table.count(["short", "short", COUNTY])
+    assert table.build() == []
+
+
+def test_string_pool():
+    pool = StringPool()
+    first = pool.share(''.join(["Mombasa ", "County"]))
+    value = pool.share_all({"rows": [''.join(["Mombasa ", "County"])]})
+    assert value["rows"][0] is first
+    assert len(pool) == 1
+
+
+def test_load_document_resolves_string_table(tmp_path, sample_file):
+    plain, dedup = tmp_path / "plain.json", tmp_path / "dedup.json"
+    parse_to_file(sample_file, plain)
+    parse_to_file(sample_file, dedup, dedup_strings=True)
+    assert STRINGS_KEY in json.loads(dedup.read_text(encoding="utf-8"))
+    assert load_document(dedup) == json.loads(plain.read_text(encoding="utf-8"))
+
+
+def test_load_document_shares_equal_strings(tmp_path):
+    path = tmp_path / "constitution.json"
+    path.write_text(json.dumps({"a": {"text": COUNTY, "label": "a"}, "b": {"text": COUNTY, "label": "a"}}))
+    document = load_document(path)
+    assert document["a"]["text"] is document["b"]["text"]
+    assert document["a"]["label"] is sys.intern("a")
+
+
+def test_parse_does_not_intern_texts(sample_lines):
+    # Texts are pooled per parse; interning them would keep every parse's
+    # texts alive for the life of the process.
+    chapters = [node for kind, node in iter_nodes(sample_lines) if kind == "chapter"]
+    article = next(chapters[1].iter_articles())
+    clause = article.clauses[1]
+    sub = clause.sub_clauses[0]
+    assert sys.intern(''.join(list(clause.text))) is not clause.text
+    assert sys.intern(''.join(list(article.title))) is article.title
+    assert sys.intern(''.join(list(sub.label))) is sub.label
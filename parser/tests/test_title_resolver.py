@@ -0,0 +1,50 @@
+from title_resolver import TitleMatch, TitleTrie
+
+TITLES = {
+    "Sovereignty of the people": 1,
+    "Supremacy of this Constitution": 2,
+    "Rights of minorities": 56,
+    "Rights of minorities and marginalised groups": 57,
+}
+
+
+def test_exact_match():
+    trie = TitleTrie(TITLES)
+    assert len(trie) == 4
+    assert trie.resolve("Supremacy of this Constitution") == TitleMatch(2, "Supremacy of this Constitution", ())
+
+
+def test_heading_with_trailing_words():
+    assert TitleTrie(TITLES).resolve("Sovereignty of the people of Kenya") == \
+        TitleMatch(1, "Sovereignty of the people", ())
+
+
+def test_truncated_heading():
+    assert TitleTrie(TITLES).resolve("Supremacy of") == TitleMatch(2, "Supremacy of this Constitution", ())
+
+
+def test_ambiguous_match_prefers_first_title():
+    match = TitleTrie(TITLES).resolve("Rights of min")
+    assert match == TitleMatch(56, "Rights of minorities", (57,))
+
+
+def test_no_match():
+    assert TitleTrie(TITLES).resolve("Citizenship") is None
+
+
+def test_first_number_wins_for_duplicate_title():
+    trie = TitleTrie({"Sovereignty of the people": 1})
+    trie.add("Sovereignty of the people", 9)
+    assert len(trie) == 1
+    assert trie.resolve("Sovereignty of the people").number == 1
+
+
+def test_ambiguous_match_lists_every_other_article():
+    trie = TitleTrie({
+        "Rights of minorities": 56,
+        "Rights of minorities and marginalised groups": 57,
+        "Rights of minors": 53,
+        "Rights of minority shareholders": 99,
+    })
+    assert trie.resolve("Rights of min") == TitleMatch(56, "Rights of minorities", (53, 57, 99))
+    assert trie.resolve("Rights of minorities").ambiguous == ()
@@ -0,0 +1,59 @@
+from tokenizer import (
+    ARTICLE_START, ARTICLE_TITLE, CHAPTER, CLAUSE, MINICLAUSE, PAGE_MARKER, PREAMBLE, SCHEDULES,
+    SUBCLAUSE, TEXT, tokenize,
+)
+
+
+def kinds(lines):
+    return [(token.kind, token.label) for token in tokenize(lines)]
+
+
+def test_line_kinds():
+    assert kinds([
+        "CHAPTER FOUR-THE BILL OF RIGHTS",
+        "Equality and freedom from discrimination.",
+        "27. (1) Every person is equal before the law.",
+        "(2) Equality includes-",
+        "(a) the full enjoyment;",
+        "(iv) of all rights.",
+        "and fundamental freedoms.",
+    ]) == [
+        (CHAPTER, "FOUR"), (ARTICLE_TITLE, ""), (ARTICLE_START, "27"), (CLAUSE, "1"), (CLAUSE, "2"),
+        (SUBCLAUSE, "a"), (MINICLAUSE, "iv"), (TEXT, ""),
+    ]
+
+
+def test_headings_keep_their_titles():
+    chapter, title = tokenize(["CHAPTER FOUR-THE BILL OF RIGHTS", "Equality and freedom from discrimination."])
+    assert chapter.text == "THE BILL OF RIGHTS"
+    assert title.text == "Equality and freedom from discrimination"
+
+
+def test_article_with_first_clause_on_one_line():
+    article, clause = tokenize(["27. (1) Every person is equal before the law."])
+    assert (article.kind, article.label, article.line_no) == (ARTICLE_START, "27", 1)
+    assert (clause.kind, clause.label, clause.line_no) == (CLAUSE, "1", 1)
+    assert clause.text == "Every person is equal before the law."
+
+
+def test_page_marker_and_its_page_number():
+    assert kinds(["Constitution of Kenya, 2010", "3", "(1) text"]) == [
+        (PAGE_MARKER, ""), (PAGE_MARKER, ""), (CLAUSE, "1")]
+
+
+def test_preamble_lines_are_text_until_first_chapter(sample_lines):
+    tokens = list(tokenize(sample_lines))
+    preamble = [token.kind for token in tokens].index(PREAMBLE)
+    chapter = [token.kind for token in tokens].index(CHAPTER)
+    assert {token.kind for token in tokens[preamble + 1:chapter]} == {TEXT}
+
+
+def test_everything_after_schedules_is_text(sample_lines):
+    tokens = list(tokenize(sample_lines))
+    start = [token.kind for token in tokens].index(SCHEDULES)
+    assert {token.kind for token in tokens[start + 1:]} == {TEXT}
+    assert "FIRST SCHEDULE  (Article 6 (1))" in [token.text for token in tokens[start + 1:]]
+
+
+def test_reads_lines_with_endings():
+    assert kinds(["(1) text\r\n", "(a) more\n"]) == [(CLAUSE, "1"), (SUBCLAUSE, "a")]
@@ -0,0 +1,90 @@
+"""
+Prefix trie for resolving article headings to article numbers.
+
+A heading resolves to a known title when they are equal, when the known
+title is a prefix of the heading (a heading with trailing words), or when
+the heading is a prefix of the known title (a truncated heading). Among
+several such titles the one added first wins. A lookup walks the heading
+once, so its cost depends on the heading's length and not on the number
+of known titles.
+
+When the matching titles belong to more than one article, the match is
+reported as ambiguous, listing every other article number.
+"""
+
+from typing import Dict, NamedTuple, Optional, Set, Tuple
+
+
+class TitleMatch(NamedTuple):
+    number: int
+    title: str                  # the known title that was matched
+    ambiguous: Tuple[int, ...]  # other article numbers that also matched
+
+
+class _Node:
+    __slots__ = ("children", "terminal", "first", "numbers")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        self.terminal: Optional[Tuple[int, int, str]] = None  # (rank, number, title)
+        self.first: Optional[Tuple[int, int, str]] = None     # earliest title in this subtree
+        self.numbers: Set[int] = set()                        # every number in this subtree
+
+
+class TitleTrie:
+    """Known titles, each mapped to an article number."""
+
+    def __init__(self, titles: Optional[Dict[str, int]] = None):
+        self._root = _Node()
+        self._size = 0
+        for title, number in (titles or {}).items():
+            self.add(title, number)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, title: str, number: int):
+        """Add a normalized title; a title that is already known keeps its number."""
+        entry = (self._size, number, title)
+        path = [self._root]
+        node = self._root
+        for char in title:
+            node = node.children.setdefault(char, _Node())
+            path.append(node)
+        if node.terminal is not None:
+            return
+        node.terminal = entry
+        self._size += 1
+        # Titles are ranked in insertion order, so a subtree's first title
+        # never changes once set.
+        for node in path:
+            if node.first is None:
+                node.first = entry
+            node.numbers.add(number)
+
+    def resolve(self, title: str) -> Optional[TitleMatch]:
+        """Match a normalized heading, or None if no known title matches."""
+        candidates = []
+        numbers = set()
+        node = self._root
+        for char in title:
+            if node.terminal is not None:
+                candidates.append(node.terminal)
+            node = node.children.get(char)
+            if node is None:
+                break
+        else:
+            if node.terminal is not None:
+                # Exact match
+                rank, number, known = node.terminal
+                return TitleMatch(number, known, ())
+            if node.first is not None:
+                candidates.append(node.first)
+                numbers.update(node.numbers)
+
+        if not candidates:
+            return None
+        _, number, known = min(candidates)
+        numbers.update(candidate[1] for candidate in candidates)
+        numbers.discard(number)
+        return TitleMatch(number, known, tuple(sorted(numbers)))
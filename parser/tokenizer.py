@@ -0,0 +1,164 @@
+"""
+Line tokenizer for the Constitution of Kenya text.
+
+Reads the input once, line by line, and classifies each line into a typed
+token. The tree builder in parse_constitution.py consumes the token stream,
+so no part of the document is sliced or re-scanned after this pass.
+
+Token kinds:
+    PREAMBLE       - the PREAMBLE heading
+    CHAPTER        - "CHAPTER ONE-SOVEREIGNTY OF THE PEOPLE ..."
+    PART           - "PART 1-GENERAL PROVISIONS ..."
+    ARTICLE_TITLE  - a capitalised line ending with a period
+    ARTICLE_START  - "27. (1) text" or "27. text"
+    CLAUSE         - "(2) text"
+    SUBCLAUSE      - "(a) text"
+    MINICLAUSE     - "(ii) text"
+    TEXT           - any other line, blank lines included
+    PAGE_MARKER    - page headers/footers and their page numbers
+    SCHEDULES      - start of the schedules
+
+Lines between PREAMBLE and the first CHAPTER, and every line after
+SCHEDULES, are passed through untouched as TEXT.
+"""
+
+from typing import Iterable, Iterator, NamedTuple
+
+from patterns import PATTERNS
+
+
+PREAMBLE = "PREAMBLE"
+CHAPTER = "CHAPTER"
+PART = "PART"
+ARTICLE_TITLE = "ARTICLE_TITLE"
+ARTICLE_START = "ARTICLE_START"
+CLAUSE = "CLAUSE"
+SUBCLAUSE = "SUBCLAUSE"
+MINICLAUSE = "MINICLAUSE"
+TEXT = "TEXT"
+PAGE_MARKER = "PAGE_MARKER"
+SCHEDULES = "SCHEDULES"
+
+
+class Token(NamedTuple):
+    kind: str
+    label: str      # chapter word, part/article/clause number or sub/mini label
+    text: str       # heading title or the text following the marker
+    line_no: int
+
+
+PAGE_MARKER_TEXT = "Constitution of Kenya, 2010"
+
+ROMAN_LETTERS = frozenset("ivxlc")
+
+# Name of the last group matched by PATTERNS.token_line -> token kind
+LAST_GROUP_KIND = {
+    "chapter_title": CHAPTER,
+    "part_title": PART,
+    "schedules": SCHEDULES,
+    "first_schedule": SCHEDULES,
+    "preamble": PREAMBLE,
+    "article_text": ARTICLE_START,
+    "clause_text": CLAUSE,
+    "sub_text": SUBCLAUSE,
+    "mini_text": MINICLAUSE,
+    "title": ARTICLE_TITLE,
+}
+
+
+def tokenize(lines: Iterable[str]) -> Iterator[Token]:
+    """
+    Tokenize constitution lines.
+
+    Accepts any iterable of lines (a list, or an open text file), so the
+    input never has to be held in memory as a whole.
+    """
+    line_pattern = PATTERNS.token_line
+    first_schedule_pattern = PATTERNS.token_first_schedule
+    page_number_pattern = PATTERNS.token_page_number
+
+    last_sub = ""           # label of the last (a), (b), ... seen in this clause
+    after_marker = False
+    held_schedules = None   # a bare SCHEDULES line waiting for FIRST SCHEDULE
+    in_preamble = False
+    in_schedules = False
+
+    for line_no, line in enumerate(lines, 1):
+        line = line.rstrip('\r\n')
+
+        if in_schedules:
+            yield Token(TEXT, "", line, line_no)
+            continue
+
+        if held_schedules is not None:
+            if not line.strip():
+                continue
+            if first_schedule_pattern.match(line):
+                yield held_schedules
+                yield Token(TEXT, "", held_schedules.text, held_schedules.line_no)
+                yield Token(TEXT, "", line, line_no)
+                held_schedules = None
+                in_schedules = True
+                continue
+            yield Token(TEXT, "", held_schedules.text, held_schedules.line_no)
+            held_schedules = None
+
+        if PAGE_MARKER_TEXT in line or (after_marker and page_number_pattern.match(line)):
+            after_marker = PAGE_MARKER_TEXT in line
+            yield Token(PAGE_MARKER, "", line.strip(), line_no)
+            continue
+        after_marker = False
+
+        match = line_pattern.match(line)
+        kind = LAST_GROUP_KIND[match.lastgroup] if match else TEXT
+        if in_preamble:
+            if kind != CHAPTER:
+                kind = TEXT
+            in_preamble = kind == TEXT
+
+        if kind == TEXT:
+            yield Token(TEXT, "", line, line_no)
+        elif kind == SUBCLAUSE:
+            label = match.group("sub")
+            expected = chr(ord(last_sub) + 1) if last_sub else "a"
+            # "(i)", "(v)", "(x)" are mini-clauses unless they continue the
+            # lettered sequence
+            if label != expected and label in ROMAN_LETTERS:
+                yield Token(MINICLAUSE, label, match.group("sub_text"), line_no)
+            else:
+                last_sub = label
+                yield Token(SUBCLAUSE, label, match.group("sub_text"), line_no)
+        elif kind == MINICLAUSE:
+            yield Token(MINICLAUSE, match.group("mini"), match.group("mini_text"), line_no)
+        elif kind == CLAUSE:
+            last_sub = ""
+            yield Token(CLAUSE, match.group("clause"), match.group("clause_text"), line_no)
+        elif kind == ARTICLE_START:
+            last_sub = ""
+            yield Token(ARTICLE_START, match.group("article"), "", line_no)
+            if match.group("article_clause"):
+                yield Token(CLAUSE, match.group("article_clause"), match.group("article_text"), line_no)
+            elif match.group("article_text"):
+                yield Token(TEXT, "", match.group("article_text"), line_no)
+        elif kind == ARTICLE_TITLE:
+            yield Token(ARTICLE_TITLE, "", match.group("title"), line_no)
+        elif kind == CHAPTER:
+            last_sub = ""
+            yield Token(CHAPTER, match.group("chapter").upper(), match.group("chapter_title"), line_no)
+        elif kind == PART:
+            last_sub = ""
+            yield Token(PART, match.group("part"), match.group("part_title"), line_no)
+        elif kind == PREAMBLE:
+            in_preamble = True
+            yield Token(PREAMBLE, "", "", line_no)
+        elif kind == SCHEDULES:
+            token = Token(SCHEDULES, "", line, line_no)
+            if match.group("first_schedule"):
+                in_schedules = True
+                yield token
+                yield Token(TEXT, "", line, line_no)
+            else:
+                held_schedules = token
+
+    if held_schedules is not None:
+        yield Token(TEXT, "", held_schedules.text, held_schedules.line_no)